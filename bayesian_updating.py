@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Bayesian updating for EBM Dashboard
+Computes the confidence journey (prior → posterior after each evidence
+source) that the bayesian_journey chart plots. Updates are conjugate in
+odds form, so the whole sequence is one cumulative sum:
+
+    log posterior odds_k = log prior odds + Σ_{j≤k} log LR_j
+
+The likelihood ratios are the ones the synthesis assigns to each evidence
+source (content/synthesis-integration.txt), so the posteriors follow from
+them rather than being entered by hand.
+
+Sensitivity bands come from drawing thousands of prior/likelihood
+combinations at once - prior ~ Beta around the stated prior (prior_strength
+pseudo-observations), log LR_j ~ Normal(log LR_j, log_lr_se_j) - and
+updating every draw in the same vectorised pass.
+
+Usage:
+    python bayesian_updating.py [spec] [--draws N]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+DRAWS = 10_000
+BAND = (5, 95)      # percentiles of the sensitivity band
+SEED = 0
+
+
+def _logit(p):
+    return np.log(p) - np.log1p(-p)
+
+
+def _expit(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def posterior_sequence(prior, likelihood_ratios):
+    """Probabilities after each source, prior first: shape (..., K + 1)
+
+    `prior` is a probability (scalar or array of draws, shape S) and
+    `likelihood_ratios` has K sources on the last axis (shape K or S × K).
+    """
+    prior = np.asarray(prior, dtype='float64')
+    ratios = np.asarray(likelihood_ratios, dtype='float64')
+    if np.any((prior <= 0) | (prior >= 1)):
+        raise ValueError("prior must be strictly between 0 and 1")
+    if np.any(ratios <= 0):
+        raise ValueError("likelihood ratios must be positive")
+    steps = np.cumsum(np.log(ratios), axis=-1)
+    log_odds = _logit(prior)[..., None] + np.concatenate(
+        [np.zeros(steps.shape[:-1] + (1,)), steps], axis=-1)
+    return _expit(log_odds)
+
+
+def sensitivity(prior, likelihood_ratios, prior_strength, log_lr_se, draws=DRAWS, band=BAND, seed=SEED):
+    """(low, high) percentile band of each stage over sampled priors and likelihood ratios"""
+    rng = np.random.default_rng(seed)
+    ratios = np.asarray(likelihood_ratios, dtype='float64')
+    priors = rng.beta(prior * prior_strength, (1 - prior) * prior_strength, size=draws)
+    priors = np.clip(priors, 1e-9, 1 - 1e-9)
+    log_ratios = rng.normal(np.log(ratios), np.asarray(log_lr_se, dtype='float64'),
+                            size=(draws, len(ratios)))
+    sequences = posterior_sequence(priors, np.exp(log_ratios))
+    low, high = np.percentile(sequences, band, axis=0)
+    return low, high
+
+
+def journey(data, draws=DRAWS):
+    """Chart-ready journey from a bayesian_journey spec entry (percent scale)
+
+    Returns {'stages', 'confidence', 'low', 'high'}; the stages are the
+    prior followed by one 'After <source>' point per evidence source.
+    """
+    prior = data['prior'] / 100
+    confidence = posterior_sequence(prior, data['likelihood_ratios'])
+    low, high = sensitivity(prior, data['likelihood_ratios'], data['prior_strength'],
+                            data['log_lr_se'], draws)
+    return {
+        'stages': ['Initial\nBelief', *(f'After\n{source}' for source in data['sources'])],
+        'confidence': list(100 * confidence),
+        'low': list(100 * low),
+        'high': list(100 * high),
+    }
+
+
+def describe(data):
+    """One-line summary of the journey, for dashboard captions"""
+    confidence = posterior_sequence(data['prior'] / 100, data['likelihood_ratios']) * 100
+    steps = ' → '.join(f"{source} {after - before:+.0f}%" for source, before, after
+                       in zip(data['sources'], confidence, confidence[1:]))
+    return f"Started at {confidence[0]:.0f}% confidence → {steps} → Final: {confidence[-1]:.0f}% confidence"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compute the Bayesian confidence journey')
+    parser.add_argument('spec', nargs='?', default=None, help='chart spec (default: chart_data.json)')
+    parser.add_argument('--draws', type=int, default=DRAWS, help='prior/likelihood combinations sampled')
+    args = parser.parse_args(argv)
+
+    from chart_data import ChartDataError, get_chart_data
+
+    try:
+        data = get_chart_data('bayesian_journey', args.spec)
+        result = journey(data, args.draws)
+    except (ChartDataError, ValueError) as e:
+        print(f"✗ {e}")
+        return 1
+    print(f"✓ Confidence journey ({args.draws:,} sensitivity draws, {BAND[0]}-{BAND[1]}% band)")
+    ratios = [None, *data['likelihood_ratios']]
+    for stage, ratio, value, low, high in zip(result['stages'], ratios, result['confidence'],
+                                              result['low'], result['high']):
+        label = stage.replace('\n', ' ')
+        lr = f"LR {ratio:.3g}" if ratio else 'prior'
+        print(f"   {label:<24} {lr:<9} {value:5.1f}%   [{low:4.1f}, {high:4.1f}]")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
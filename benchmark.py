@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for EBM Dashboard
+Times and memory-profiles every create_* chart function and every
+data_analysis.py stage over repeated runs, appends the results to a JSON
+history file and exits non-zero when a target regressed past the threshold
+compared with the previous run in the history.
+
+Wall time is the median of --repeat timed runs (after --warmup untimed
+runs); peak memory comes from one extra run under tracemalloc, kept
+separate so tracing overhead never inflates the timings. Analysis stages
+use the offline sample data unless --online is given.
+
+Usage:
+    python benchmark.py [--repeat N] [--only charts|analysis] [--threshold PCT]
+                        [--history FILE] [--no-save]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_HISTORY = 'benchmark_history.json'
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 20.0  # percent slower / heavier than the previous run
+MIN_DELTA_MS = 5.0        # ignore timing changes below this (timer noise)
+MIN_DELTA_KB = 64.0       # ignore peak memory changes below this
+
+
+def _measure(func, repeat, warmup):
+    """Median/min wall time (ms) over `repeat` runs plus tracemalloc peak (KB)"""
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for _ in range(warmup):
+            func()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append((time.perf_counter() - start) * 1000)
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        'median_ms': round(statistics.median(times), 2),
+        'min_ms': round(min(times), 2),
+        'peak_kb': round(peak / 1024, 1),
+        'runs': repeat,
+    }
+
+
+def chart_targets(out_dir):
+    """(name, callable) for every chart function, writing into out_dir"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    import chart_output
+    import power_analysis
+    import theme
+    from build_dashboard import chart_tasks
+
+    chart_output.set_output_dir(out_dir)
+    power_analysis.CACHE_DIR = None  # time the simulation, not .cache/power
+    targets = []
+    for module_name, func_name in chart_tasks():
+        module = sys.modules[module_name]
+        func = getattr(module, func_name)
+
+        def run(module=module, func=func):
+            theme.apply_theme(module.THEME)
+            func()
+            plt.close('all')
+        targets.append((f"chart:{module_name}.{func_name}", run))
+    return targets
+
+
+def analysis_targets(out_dir):
+    """(name, callable) for each data_analysis stage, fed real upstream outputs
+
+    Includes the optional stages main() runs only when enabled (seasonal
+    adjustment, FEVS microdata, each alignment method, panel regression).
+    On-disk caches are off, so repeated runs time the work, not cache hits.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import data_analysis as da
+    import frequency_alignment
+    import panel_regression
+
+    da.OUTPUT_DIR = str(out_dir)
+    os.makedirs(da.OUTPUT_DIR, exist_ok=True)
+    fevs_fixture = str(Path(da.__file__).resolve().parent / 'data' / 'fevs_fixture.csv')
+
+    # Build every stage's inputs once so each stage is timed on its own
+    with contextlib.redirect_stdout(io.StringIO()):
+        jolts_df, eci_df, fevs_df = da.load_jolts(), da.load_eci(), da.load_fevs()
+        merged_df, eci_monthly = da.merge_datasets(jolts_df, eci_df, fevs_df)
+        eci_clean, fevs_clean = da.summary_statistics(merged_df, fevs_df)
+        corr_data, correlation_matrix, corrs = da.correlation_analysis(merged_df)
+        breaks = da.detect_regimes(merged_df)
+        forecast_df = da.forecast_outcomes(merged_df, eci_df, cache_dir=None)
+        panel_df = panel_regression.demo_panel(merged_df)
+
+    def align(method):
+        def run():
+            saved = dict(da.ALIGNMENT)
+            da.ALIGNMENT.update(dict.fromkeys(da.ALIGNMENT, method))
+            try:
+                da.align_monthly(eci_df, ['compensation_change_pct'], 'Q', 'last', merged_df['date'])
+                da.align_monthly(fevs_df, da.FEVS_METRICS, 'Y', 'average', merged_df['date'])
+            finally:
+                da.ALIGNMENT.update(saved)
+        return run
+
+    stages = [
+        ('load_jolts', da.load_jolts),
+        ('load_eci', da.load_eci),
+        ('load_fevs', da.load_fevs),
+        ('load_fevs_microdata', lambda: da.load_fevs_microdata(fevs_fixture)),
+        ('merge_datasets', lambda: da.merge_datasets(jolts_df, eci_df, fevs_df)),
+        *[(f'align_monthly[{method}]', align(method)) for method in frequency_alignment.METHODS],
+        ('summary_statistics', lambda: da.summary_statistics(merged_df, fevs_df)),
+        ('adjust_seasonality', lambda: da.adjust_seasonality(merged_df, cache_dir=None)),
+        ('correlation_analysis', lambda: da.correlation_analysis(merged_df)),
+        ('time_series_trends', lambda: da.time_series_trends(merged_df)),
+        ('detect_regimes', lambda: da.detect_regimes(merged_df)),
+        ('forecast_outcomes', lambda: da.forecast_outcomes(merged_df, eci_df, cache_dir=None)),
+        ('panel_fixed_effects', lambda: da.panel_fixed_effects(panel_df)),
+        ('plot_time_series', lambda: da.plot_time_series(merged_df, eci_monthly, fevs_df, breaks)),
+        ('plot_correlation_heatmap', lambda: da.plot_correlation_heatmap(correlation_matrix)),
+        ('plot_scatter_plots', lambda: da.plot_scatter_plots(corr_data, corrs)),
+        ('plot_forecasts', lambda: da.plot_forecasts(merged_df, eci_df, forecast_df)),
+        ('export_results', lambda: da.export_results(merged_df, eci_clean, fevs_clean,
+                                                     correlation_matrix, forecast_df=forecast_df)),
+    ]
+    return [(f"analysis:{name}", func) for name, func in stages]
+
+
+def run_benchmarks(only=None, repeat=DEFAULT_REPEAT, warmup=1):
+    """Measure every target; returns {name: measurement}"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='ebm-bench-') as tmp:
+        targets = []
+        if only in (None, 'charts'):
+            targets += chart_targets(Path(tmp) / 'visuals')
+        if only in (None, 'analysis'):
+            targets += analysis_targets(Path(tmp) / 'analysis_output')
+
+        for name, func in targets:
+            results[name] = _measure(func, repeat, warmup)
+            r = results[name]
+            print(f"  {name:<72} {r['median_ms']:>9.1f} ms  {r['peak_kb']:>9.0f} KB")
+    return results
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    path = Path(path)
+    if not path.exists():
+        return []
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def save_history(path, history):
+    Path(path).write_text(json.dumps(history, indent=2) + '\n', encoding='utf-8')
+
+
+def find_regressions(previous, current, threshold):
+    """Targets slower or heavier than `previous` by more than threshold percent"""
+    regressions = []
+    limit = 1 + threshold / 100
+    for name, now in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        for key, unit, floor in (('median_ms', 'ms', MIN_DELTA_MS),
+                                 ('peak_kb', 'KB', MIN_DELTA_KB)):
+            old, new = before[key], now[key]
+            if new > old * limit and new - old > floor:
+                pct = (new / old - 1) * 100 if old else float('inf')
+                regressions.append(f"{name}: {key} {old:.1f} → {new:.1f} {unit} (+{pct:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark chart functions and analysis stages')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='timed runs per target (median is reported)')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='untimed runs per target before timing')
+    parser.add_argument('--only', choices=['charts', 'analysis'], default=None)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown / memory growth in percent')
+    parser.add_argument('--history', default=DEFAULT_HISTORY,
+                        help='JSON file the results are appended to')
+    parser.add_argument('--no-save', action='store_true',
+                        help='compare against the history without appending to it')
+    parser.add_argument('--online', action='store_true',
+                        help='let the load stages call the BLS API')
+    args = parser.parse_args(argv)
+
+    if not args.online:
+        os.environ['EBM_OFFLINE'] = '1'
+
+    print("=" * 60)
+    print("EBM DASHBOARD BENCHMARKS")
+    print("=" * 60)
+    print(f"\n▶ {args.repeat} runs per target (+{args.warmup} warmup)\n")
+
+    results = run_benchmarks(args.only, args.repeat, args.warmup)
+
+    history = load_history(args.history)
+    regressions = []
+    if history:
+        previous = history[-1]
+        regressions = find_regressions(previous['results'], results, args.threshold)
+        print(f"\nCompared with run {previous['timestamp']} ({previous.get('commit') or 'unknown'})")
+    else:
+        print("\nNo previous run in history - recording baseline")
+
+    if not args.no_save:
+        history.append({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'repeat': args.repeat,
+            'results': results,
+        })
+        save_history(args.history, history)
+        print(f"✓ Results appended to {args.history}")
+
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) over {args.threshold:g}%:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print(f"\n✅ No regressions over {args.threshold:g}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Build script for EBM Dashboard
+Checks the chart sample sizes against the evidence source files
+(citation_db.py check-charts), regenerates all chart images on a pool of
+pre-warmed render workers, runs the PNG optimization stage, then publishes
+content/*.txt into dist/ either pre-rendered into the page or as one
+hashed bundle (--content bundle),
+together with the content search index, and finally hashes, precompresses
+and writes cache headers for dist/ (deploy_assets.py).
+Exits non-zero when any stage fails (including the image size budget).
+
+Usage:
+    python build_dashboard.py [--data SPEC] [--vector] [--quantize] [--budget-kb N] [--skip-charts]
+                              [--content prerender|bundle]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import bundle_content
+import chart_data
+import citation_db
+import chart_output
+import deploy_assets
+import optimize_visuals
+import prerender_content
+import search_index
+import theme
+
+CHART_MODULES = [
+    'generate_visuals',
+    'generate_evidence_visuals',
+    'generate_milestone3_visuals',
+]
+
+
+def chart_tasks():
+    """(module, function) pairs for every create_* chart function"""
+    tasks = []
+    for module_name in CHART_MODULES:
+        module = importlib.import_module(module_name)
+        tasks.extend((module_name, name) for name in dir(module)
+                     if name.startswith('create_') and callable(getattr(module, name)))
+    return tasks
+
+
+def render_chart(task):
+    """Worker: render one chart with its module's theme.
+
+    Returns (task, format_results, error). Modules are imported once per
+    worker and the theme switch is a cached rcParams update.
+    """
+    module_name, func_name = task
+    chart_output.FORMAT_RESULTS.clear()
+    try:
+        module = importlib.import_module(module_name)
+        theme.apply_theme(module.THEME)
+        getattr(module, func_name)()
+    except Exception:
+        return task, {}, traceback.format_exc()
+    return task, dict(chart_output.FORMAT_RESULTS), None
+
+
+def build_charts(vector=False, workers=None):
+    """Render every chart across a worker pool (startup paid once per worker)"""
+    tasks = chart_tasks()
+    print(f"\n▶ Rendering {len(tasks)} charts...")
+    format_results = {}
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=theme.init_worker,
+                             initargs=('clean', vector)) as pool:
+        for task, results, error in pool.map(render_chart, tasks):
+            format_results.update(results)
+            if error:
+                failed.append(task)
+                print(f"✗ {task[0]}.{task[1]} failed\n{error}")
+
+    if chart_output.write_format_report(format_results):
+        print(f"✓ Format comparison written to {chart_output.OUTPUT_DIR / chart_output.FORMAT_REPORT}")
+    return not failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the EBM dashboard assets')
+    parser.add_argument('--vector', action='store_true',
+                        help='also emit SVG for diagram charts and serve it where smaller')
+    parser.add_argument('--quantize', action='store_true',
+                        help='palette-quantize PNGs (lossy)')
+    parser.add_argument('--budget-kb', type=int, default=optimize_visuals.DEFAULT_BUDGET_KB)
+    parser.add_argument('--skip-charts', action='store_true',
+                        help='only optimize the existing visuals/')
+    parser.add_argument('--data', default=None,
+                        help='chart data spec to render (default: chart_data.json)')
+    parser.add_argument('--content', choices=['prerender', 'bundle'], default='prerender',
+                        help='render content into the page, or ship it as one hashed bundle')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='render/optimize worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("EBM DASHBOARD BUILD")
+    print("=" * 60)
+
+    if args.data:
+        # Workers inherit the environment, so every chart reads the same spec
+        os.environ['EBM_CHART_DATA'] = os.path.abspath(args.data)
+    try:
+        # Parse and validate once up front; forked workers share the result
+        chart_data.load_chart_data()
+    except chart_data.ChartDataError as e:
+        print(f"✗ Invalid chart data: {e}")
+        return 1
+
+    # Sample sizes are entered by hand; fail before rendering if they drift from the sources
+    print("\n▶ Checking chart sample sizes against the cited sources...")
+    if citation_db.main(['check-charts']) != 0:
+        return 1
+
+    if not args.skip_charts and not build_charts(args.vector, args.workers):
+        return 1
+
+    opt_args = ['visuals', '--budget-kb', str(args.budget_kb)]
+    if args.workers:
+        opt_args += ['--workers', str(args.workers)]
+    if args.quantize:
+        opt_args.append('--quantize')
+    if optimize_visuals.main(opt_args) != 0:
+        return 1
+
+    publish = bundle_content.main if args.content == 'bundle' else prerender_content.main
+    if publish([]) != 0 or search_index.main(['build']) != 0:
+        return 1
+    if deploy_assets.main([]) != 0:
+        return 1
+
+    print("\n✅ Build complete")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Content bundle for EBM Dashboard
+Packs every content/*.txt file into one JSON bundle whose name carries a
+content hash (content-bundle.<hash>.json), with precompressed .gz and .br
+siblings, and writes dist/index.html pointing content-loader.js at it.
+The browser then makes one request instead of 18, and because the name
+changes whenever the content does, the bundle can be cached indefinitely.
+
+Use this instead of prerender_content.py when the page should keep
+rendering content client-side.
+
+Usage:
+    python bundle_content.py [--out dist]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from prerender_content import CONTENT_DIR, CONTENT_FILES, DIST_DIR, INDEX, copy_assets, fill_stats
+
+try:
+    import brotli  # optional dependency
+except ImportError:
+    brotli = None
+
+BUNDLE_PREFIX = 'content-bundle.'
+LOADER_TAG = '<script src="content-loader.js"></script>'
+
+
+def build_bundle(content_dir=CONTENT_DIR):
+    """Bundle bytes for the content files that exist (missing ones are skipped)"""
+    files = {}
+    for filename in CONTENT_FILES:
+        path = Path(content_dir) / filename
+        if path.exists():
+            files[filename] = path.read_text(encoding='utf-8')
+    payload = {'version': 1, 'files': files}
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), files
+
+
+def bundle_name(data):
+    return f"{BUNDLE_PREFIX}{hashlib.sha256(data).hexdigest()[:12]}.json"
+
+
+def compress(data):
+    """{suffix: bytes} precompressed variants; brotli only when installed"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    return variants
+
+
+def write_bundle(out_dir):
+    """Write the hashed bundle and its compressed copies; returns the bundle name"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    data, files = build_bundle()
+    name = bundle_name(data)
+
+    # Drop bundles from earlier builds so dist/ holds only the live one
+    for old in out_dir.glob(f"{BUNDLE_PREFIX}*.json*"):
+        if not old.name.startswith(name):
+            old.unlink()
+
+    (out_dir / name).write_bytes(data)
+    print(f"✓ Saved: {out_dir / name} ({len(files)} files, {len(data) / 1024:.1f} KB)")
+    if brotli is None:
+        print("  (brotli not installed - skipping .br)")
+    for suffix, blob in compress(data).items():
+        (out_dir / (name + suffix)).write_bytes(blob)
+        print(f"✓ Saved: {out_dir / (name + suffix)} ({len(blob) / 1024:.1f} KB)")
+    return name
+
+
+def point_loader_at(page, name):
+    """Tell content-loader.js which bundle to fetch"""
+    return page.replace(LOADER_TAG, f'<script src="content-loader.js" data-bundle="{name}"></script>')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bundle content/*.txt into one hashed JSON file')
+    parser.add_argument('--out', default=str(DIST_DIR), help='output directory (default: dist)')
+    args = parser.parse_args(argv)
+
+    print("\n▶ Bundling content files...")
+    page = fill_stats(INDEX.read_text(encoding='utf-8'))
+    if LOADER_TAG not in page:
+        print(f"✗ {LOADER_TAG} not found in index.html")
+        return 1
+
+    out_dir = Path(args.out)
+    copy_assets(out_dir)
+    name = write_bundle(out_dir)
+    (out_dir / 'index.html').write_text(point_loader_at(page, name), encoding='utf-8')
+    print(f"✓ Saved: {out_dir / 'index.html'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Change-point detection for EBM Dashboard
+Finds regime breaks (shifts in level) in monthly series with PELT - exact
+optimal partitioning with pruning, linear time in practice:
+
+    F(t) = min over s < t of  F(s) + cost(x[s:t]) + β
+
+cost is the Gaussian change-in-mean cost (within-segment sum of squares
+over a robust noise variance), read in O(1) from cumulative sums, and
+each step evaluates all surviving candidates s at once. Candidates that
+can never again be optimal are pruned, which keeps the work near O(n);
+with a minimum segment length the pruning waits until the dominating
+split is itself admissible, so the result stays exactly optimal.
+β defaults to a BIC-style 2·log(n); min_size stops breaks closer than
+six months apart.
+
+Series in a panel are independent, so detect() runs them in parallel.
+
+Usage:
+    python changepoints.py [--penalty BETA] [--min-size MONTHS]
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+MIN_SIZE = 6
+
+
+def _mad_sigma(diffs):
+    mad = np.median(np.abs(diffs - np.median(diffs)))
+    return mad / 0.6745 / np.sqrt(2)
+
+
+def noise_variance(x):
+    """Robust σ² from first differences (MAD), insensitive to level shifts
+
+    A series that mostly repeats itself (e.g. a quarterly series forward
+    filled to months) has a zero MAD; σ² then comes from the differences
+    that are not zero, so the level shifts still do not inflate it, times
+    the average run length, since every repeated value counts that often
+    in the segment costs.
+    """
+    diffs = np.diff(x)
+    if len(diffs) == 0:
+        return 1.0
+    sigma = _mad_sigma(diffs)
+    if sigma == 0:
+        moves = diffs[diffs != 0]
+        sigma = _mad_sigma(moves) * np.sqrt(len(diffs) / len(moves)) if len(moves) else 0.0
+    return max(sigma ** 2, 1e-12 * max(np.var(x), 1.0))
+
+
+def pelt(x, penalty=None, min_size=MIN_SIZE):
+    """Break positions (indices where a new segment starts) in a 1-d array"""
+    x = np.asarray(x, dtype='float64')
+    n = len(x)
+    if n < 2 * min_size:
+        return []
+    beta = 2 * np.log(n) if penalty is None else penalty
+    scale = 1.0 / noise_variance(x)
+    s1 = np.concatenate([[0.0], np.cumsum(x)])
+    s2 = np.concatenate([[0.0], np.cumsum(x * x)])
+
+    def cost(starts, end):
+        length = end - starts
+        total = s1[end] - s1[starts]
+        return scale * (s2[end] - s2[starts] - total * total / length)
+
+    F = np.full(n + 1, np.inf)
+    F[0] = -beta
+    last = np.zeros(n + 1, dtype=int)
+    candidates = np.array([0])
+    pruned = {}
+    for t in range(min_size, n + 1):
+        if t - min_size >= min_size:
+            # t - min_size is admissible from now on, so the starts it dominates can go
+            candidates = candidates[~np.isin(candidates, pruned.pop(t - min_size, []))]
+            candidates = np.append(candidates, t - min_size)
+        seg = F[candidates] + cost(candidates, t)
+        best = np.argmin(seg)
+        F[t] = seg[best] + beta
+        last[t] = candidates[best]
+        # A start already worse than F(t) can never beat a split at t - but
+        # only once t itself may start a segment, min_size steps later
+        pruned[t] = candidates[seg > F[t]]
+
+    breaks, t = [], n
+    while t > 0:
+        t = last[t]
+        if t > 0:
+            breaks.append(t)
+    return sorted(breaks)
+
+
+def _detect_one(args):
+    """Worker: breaks of one series as positions in the original index"""
+    values, penalty, min_size = args
+    observed = np.flatnonzero(~np.isnan(values))
+    return [int(observed[b]) for b in pelt(values[observed], penalty, min_size)]
+
+
+def detect(frame, penalty=None, min_size=MIN_SIZE, workers=None):
+    """{column: [break dates]} for every column, series run in parallel"""
+    jobs = [(frame[column].to_numpy(dtype='float64'), penalty, min_size) for column in frame]
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            positions = list(pool.map(_detect_one, jobs))
+    else:
+        positions = [_detect_one(job) for job in jobs]
+    return {column: list(frame.index[p]) for column, p in zip(frame.columns, positions)}
+
+
+def segments(series, breaks):
+    """(start, end, mean) for each regime between consecutive breaks"""
+    series = series.dropna()
+    edges = [series.index[0], *breaks, None]
+    result = []
+    for start, stop in zip(edges, edges[1:]):
+        part = series[(series.index >= start) & ((series.index < stop) if stop is not None else True)]
+        result.append((part.index[0], part.index[-1], part.mean()))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Detect regime breaks in the monthly series')
+    parser.add_argument('--penalty', type=float, default=None, help='β per break (default: 2·log n)')
+    parser.add_argument('--min-size', type=int, default=MIN_SIZE, help='shortest regime in months')
+    args = parser.parse_args(argv)
+
+    from data_analysis import load_eci, load_jolts
+
+    jolts = load_jolts().set_index('date')[['quits_rate']]
+    eci = load_eci().set_index('date').resample('MS').ffill()[['compensation_change_pct']]
+    frame = jolts.join(eci, how='left')
+    for column, breaks in detect(frame, args.penalty, args.min_size).items():
+        print(f"\n✓ {column}: {len(breaks)} break(s)")
+        for start, end, mean in segments(frame[column], breaks):
+            print(f"   {start:%Y-%m} → {end:%Y-%m}   mean {mean:.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
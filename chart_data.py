@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Chart input data for EBM Dashboard
+Loads and validates the declarative chart spec (chart_data.json, or YAML
+if PyYAML is installed) that the create_* chart functions consume.
+
+The spec is loaded once per process; render workers forked from a build
+process inherit the parsed copy. Set EBM_CHART_DATA to point every chart
+at another dataset.
+
+Usage:
+    python chart_data.py [spec]             # validate a spec
+    python chart_data.py --diff OLD NEW     # list charts whose inputs changed
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+DEFAULT_SPEC = Path(__file__).resolve().parent / 'chart_data.json'
+
+# Field kinds: 'labels' = list of str, 'numbers' = list of int/float,
+# 'percents' = list of int/float within 0-100, 'number' = int/float,
+# 'records' = list of dicts with the listed keys
+SCHEMA = {
+    'evidence_quality': {
+        'fields': {'evidence_types': 'labels', 'quality_scores': 'numbers'},
+        'aligned': [('evidence_types', 'quality_scores')],
+    },
+    'retention_impact': {
+        'fields': {'scenarios': 'labels', 'retention_rates': 'percents',
+                   'manager_scenarios': 'labels', 'manager_retention': 'percents'},
+        'aligned': [('scenarios', 'retention_rates'),
+                    ('manager_scenarios', 'manager_retention')],
+    },
+    'progress_timeline': {
+        'fields': {'weeks': 'labels', 'milestones': 'labels', 'completion': 'percents'},
+        'aligned': [('weeks', 'milestones', 'completion')],
+    },
+    'cost_analysis': {
+        'fields': {'scenarios': 'labels', 'employees': 'number',
+                   'avg_cost': 'number', 'turnover_rates': 'numbers'},
+        'aligned': [('scenarios', 'turnover_rates')],
+    },
+    # sample_sizes: N of the cited study (checked by citation_db check-charts);
+    # 0 for rows with no single study behind them, which are shown but not pooled
+    'effect_sizes': {
+        'fields': {'relationships': 'labels', 'effect_sizes': 'numbers',
+                   'sample_sizes': 'numbers', 'confidence': 'numbers'},
+        'aligned': [('relationships', 'effect_sizes', 'sample_sizes', 'confidence')],
+    },
+    'evidence_overview': {
+        'fields': {'evidence_types': 'labels', 'quality_scores': 'numbers'},
+        'aligned': [('evidence_types', 'quality_scores')],
+    },
+    # sample_sizes: as for effect_sizes (the BLS rows count surveyed employers)
+    'scientific_studies': {
+        'fields': {'interventions': 'labels', 'impact': 'numbers',
+                   'studies': 'labels', 'sample_sizes': 'numbers'},
+        'aligned': [('interventions', 'impact'), ('studies', 'sample_sizes')],
+    },
+    'practitioner_consensus': {
+        'fields': {'strategies': 'labels', 'agreement': 'numbers',
+                   'effectiveness': 'numbers'},
+        'aligned': [('strategies', 'agreement', 'effectiveness')],
+    },
+    'organizational_metrics': {
+        'fields': {'turnover_years': 'labels', 'turnover_rates': 'numbers',
+                   'tenure_categories': 'labels', 'avg_tenure': 'numbers',
+                   'engagement_categories': 'labels', 'engagement_scores': 'numbers',
+                   'promotion_data': 'labels', 'promotion_pct': 'percents',
+                   'programs': 'labels', 'participation': 'percents',
+                   'manager_categories': 'labels', 'manager_scores': 'numbers'},
+        'aligned': [('turnover_years', 'turnover_rates'),
+                    ('tenure_categories', 'avg_tenure'),
+                    ('engagement_categories', 'engagement_scores'),
+                    ('promotion_data', 'promotion_pct'),
+                    ('programs', 'participation'),
+                    ('manager_categories', 'manager_scores')],
+    },
+    'stakeholder_priorities': {
+        'fields': {'priorities': 'labels', 'importance': 'numbers',
+                   'impact_categories': 'labels', 'manager_impact': 'numbers'},
+        'aligned': [('priorities', 'importance'),
+                    ('impact_categories', 'manager_impact')],
+    },
+    'evidence_synthesis': {
+        'fields': {'interventions': 'labels', 'scientific': 'numbers',
+                   'practitioner': 'numbers', 'organizational': 'numbers',
+                   'stakeholder': 'numbers'},
+        'aligned': [('interventions', 'scientific', 'practitioner',
+                     'organizational', 'stakeholder')],
+    },
+    'bayesian_journey': {
+        'fields': {'prior': 'number', 'prior_strength': 'number', 'sources': 'labels',
+                   'likelihood_ratios': 'numbers', 'log_lr_se': 'numbers'},
+        'aligned': [('sources', 'likelihood_ratios', 'log_lr_se')],
+    },
+    'implementation_timeline': {
+        'fields': {'phases': ('records', ('name', 'start', 'end', 'color')),
+                   'milestones': ('records', ('month', 'label'))},
+        'aligned': [],
+    },
+    'pilot_power': {
+        'fields': {'sample_sizes': 'numbers', 'baseline_rates': 'numbers', 'effects': 'numbers',
+                   'planned_size': 'number', 'control_ratio': 'number', 'team_size': 'number',
+                   'icc': 'number', 'alpha': 'number', 'replicates': 'number'},
+        'aligned': [],
+    },
+    'roi_projection': {
+        'fields': {'years': 'labels', 'investment': 'numbers', 'savings': 'numbers'},
+        'aligned': [('years', 'investment', 'savings')],
+    },
+}
+
+
+class ChartDataError(ValueError):
+    """Raised when a chart spec is missing fields or has inconsistent data"""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_field(chart, field, kind, value):
+    where = f"{chart}.{field}"
+    if isinstance(kind, tuple):
+        _, keys = kind
+        if not isinstance(value, list) or not all(isinstance(r, dict) for r in value):
+            raise ChartDataError(f"{where}: expected a list of objects")
+        for i, record in enumerate(value):
+            missing = [k for k in keys if k not in record]
+            if missing:
+                raise ChartDataError(f"{where}[{i}]: missing {', '.join(missing)}")
+    elif kind == 'number':
+        if not _is_number(value):
+            raise ChartDataError(f"{where}: expected a number, got {value!r}")
+    else:
+        if not isinstance(value, list) or not value:
+            raise ChartDataError(f"{where}: expected a non-empty list")
+        check = (lambda v: isinstance(v, str)) if kind == 'labels' else _is_number
+        bad = [v for v in value if not check(v)]
+        if bad:
+            raise ChartDataError(f"{where}: expected {kind}, got {bad[0]!r}")
+        if kind == 'percents':
+            bad = [v for v in value if not 0 <= v <= 100]
+            if bad:
+                raise ChartDataError(f"{where}: expected percentages in 0-100, got {bad[0]!r}")
+
+
+def validate(spec):
+    """Check a parsed spec against SCHEMA; raises ChartDataError"""
+    if not isinstance(spec, dict) or not isinstance(spec.get('charts'), dict):
+        raise ChartDataError("spec must be an object with a 'charts' mapping")
+    charts = spec['charts']
+    for chart, rules in SCHEMA.items():
+        if chart not in charts:
+            raise ChartDataError(f"missing chart '{chart}'")
+        data = charts[chart]
+        for field, kind in rules['fields'].items():
+            if field not in data:
+                raise ChartDataError(f"{chart}: missing field '{field}'")
+            _check_field(chart, field, kind, data[field])
+        for group in rules['aligned']:
+            lengths = {field: len(data[field]) for field in group}
+            if len(set(lengths.values())) > 1:
+                raise ChartDataError(f"{chart}: lengths differ {lengths}")
+    return spec
+
+
+def _read_spec(path):
+    path = Path(path)
+    text = path.read_text(encoding='utf-8')
+    if path.suffix in ('.yml', '.yaml'):
+        import yaml  # optional dependency, only needed for YAML specs
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+@lru_cache(maxsize=None)
+def load_chart_data(path=None):
+    """Load and validate a spec (cached, so each process parses it once)"""
+    path = path or os.environ.get('EBM_CHART_DATA') or DEFAULT_SPEC
+    return validate(_read_spec(path))
+
+
+def get_chart_data(chart, path=None):
+    """Inputs for one chart; a copy, so callers may modify it freely"""
+    return copy.deepcopy(load_chart_data(path)['charts'][chart])
+
+
+def chart_digest(data):
+    """Stable hash of one chart's inputs (used to decide re-rendering)"""
+    payload = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def diff_specs(old, new):
+    """Names of charts whose inputs differ between two parsed specs"""
+    old_charts, new_charts = old['charts'], new['charts']
+    return sorted(chart for chart in set(old_charts) | set(new_charts)
+                  if chart not in old_charts or chart not in new_charts
+                  or chart_digest(old_charts[chart]) != chart_digest(new_charts[chart]))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        if argv[:1] == ['--diff'] and len(argv) == 3:
+            old, new = (validate(_read_spec(p)) for p in argv[1:])
+            changed = diff_specs(old, new)
+            print(f"{len(changed)} chart(s) need re-rendering")
+            for chart in changed:
+                print(f"  - {chart}")
+            return 0
+        path = argv[0] if argv else None
+        spec = load_chart_data(path)
+    except ChartDataError as e:
+        print(f"✗ Invalid chart data: {e}")
+        return 1
+    print(f"✓ Chart data valid ({len(spec['charts'])} charts)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Chart output helpers for EBM Dashboard
+Saves every chart as PNG and, in vector mode, also tries a compact SVG
+for diagram-style charts, keeping the SVG only when it is lighter
+"""
+
+import io
+import json
+import os
+import re
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+OUTPUT_DIR = Path('visuals')
+FORMAT_REPORT = 'format_report.json'
+
+# Vector mode is opt-in: EBM_VECTOR_OUTPUT=1 or set_vector_output(True)
+VECTOR_OUTPUT = os.environ.get('EBM_VECTOR_OUTPUT', '') == '1'
+
+# 'path' converts text to glyph outlines; matplotlib defines each glyph once
+# in <defs> and reuses it, so only the glyphs a chart uses end up in the file.
+# A fixed hash salt keeps element ids stable between runs (clean diffs).
+SVG_RC = {
+    'svg.fonttype': 'path',
+    'svg.hashsalt': 'ebm-dashboard',
+}
+
+
+def set_vector_output(enabled=True):
+    """Turn the SVG comparison on or off for the current process"""
+    global VECTOR_OUTPUT
+    VECTOR_OUTPUT = enabled
+
+
+# Batch runs may trade resolution for speed; None keeps each chart's own dpi
+DPI_OVERRIDE = None
+
+
+def set_dpi_override(dpi):
+    """Force a savefig dpi for every chart in this process (None to reset)"""
+    global DPI_OVERRIDE
+    DPI_OVERRIDE = dpi
+
+
+def set_output_dir(path):
+    """Redirect chart output (used by batch and benchmark runs)"""
+    global OUTPUT_DIR
+    OUTPUT_DIR = Path(path)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _minify_svg(svg_text):
+    """Drop the metadata block and indentation whitespace between tags"""
+    svg_text = re.sub(r'<metadata>.*?</metadata>', '', svg_text, flags=re.S)
+    return re.sub(r'>\s+<', '><', svg_text)
+
+
+def _render_svg(fig, savefig_kwargs):
+    """Render the figure to a minified SVG string"""
+    kwargs = {k: v for k, v in savefig_kwargs.items() if k != 'dpi'}
+    buf = io.StringIO()
+    with plt.rc_context(SVG_RC):
+        fig.savefig(buf, format='svg', metadata={'Date': None}, **kwargs)
+    return _minify_svg(buf.getvalue())
+
+
+# Per-chart size comparisons from this process, written by write_format_report
+FORMAT_RESULTS = {}
+
+# The most recently saved figure and its savefig arguments. Batch rendering
+# keeps this figure as a template and re-saves it with updated artist data.
+LAST_SAVED = {}
+
+
+def record_format(filename, png_bytes, svg_bytes, chosen):
+    """Remember the PNG/SVG size comparison for one chart"""
+    FORMAT_RESULTS[Path(filename).stem] = {
+        'png_bytes': png_bytes,
+        'svg_bytes': svg_bytes,
+        'chosen': chosen,
+    }
+
+
+def write_format_report(results=None):
+    """Merge size comparisons into OUTPUT_DIR/format_report.json.
+
+    Render workers return their FORMAT_RESULTS to the parent, which calls
+    this once, so the report file is never written concurrently.
+    """
+    results = FORMAT_RESULTS if results is None else results
+    if not results:
+        return None
+    report_path = OUTPUT_DIR / FORMAT_REPORT
+    report = {}
+    if report_path.exists():
+        report = json.loads(report_path.read_text())
+    report.update(results)
+    report_path.write_text(json.dumps(report, indent=2, sort_keys=True) + '\n')
+    return report_path
+
+
+def save_chart(filename, vector=False, fig=None, **savefig_kwargs):
+    """Save the current figure to OUTPUT_DIR/filename.
+
+    The PNG is always written because index.html references it. When
+    ``vector`` is set and vector mode is on, an SVG sibling is rendered
+    too and kept only if it is smaller than the PNG; deploy_assets.py then
+    points the published pages at it. Returns the format the build should
+    serve ('png' or 'svg').
+    """
+    fig = fig or plt.gcf()
+    if DPI_OVERRIDE:
+        savefig_kwargs = dict(savefig_kwargs, dpi=DPI_OVERRIDE)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    png_path = OUTPUT_DIR / filename
+    fig.savefig(png_path, **savefig_kwargs)
+    LAST_SAVED.update(fig=fig, filename=filename, kwargs=savefig_kwargs)
+
+    svg_path = png_path.with_suffix('.svg')
+    if not (vector and VECTOR_OUTPUT):
+        # An SVG from an earlier vector run no longer matches this PNG
+        if svg_path.exists():
+            svg_path.unlink()
+        return 'png'
+
+    svg_text = _render_svg(fig, savefig_kwargs)
+    png_bytes = png_path.stat().st_size
+    svg_bytes = len(svg_text.encode('utf-8'))
+
+    if svg_bytes < png_bytes:
+        svg_path.write_text(svg_text, encoding='utf-8')
+        chosen = 'svg'
+    else:
+        if svg_path.exists():
+            svg_path.unlink()
+        chosen = 'png'
+
+    record_format(filename, png_bytes, svg_bytes, chosen)
+    print(f"   {png_path.stem}: PNG {png_bytes/1024:.0f} KB vs SVG {svg_bytes/1024:.0f} KB → {chosen.upper()}")
+    return chosen
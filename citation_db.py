@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Citation database for EBM Dashboard
+Extracts citations (authors, year, title, DOI/URL) and the sample size
+reported alongside them from the evidence source files into an indexed
+SQLite store. The same study cited in several files is stored once and
+linked to every mention.
+
+Extraction is incremental: each file's SHA-256 is recorded and only files
+whose content changed are re-parsed.
+
+A citation is a '### Citation' block or a '- **Citation:**' / '- **Source:**'
+bullet with a (year); its sample size is the first '**Sample Size:**' /
+'**Total Sample:**' bullet in the same '##' section.
+
+Usage:
+    python citation_db.py [extract] [--db citations.sqlite] [--force]
+    python citation_db.py list
+    python citation_db.py check-charts    # compare chart_data.json sample sizes
+                                          # (scientific_studies and effect_sizes)
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from prerender_content import CONTENT_DIR
+
+DEFAULT_DB = Path(__file__).resolve().parent / 'citations.sqlite'
+SOURCE_GLOB = 'evidence-*-sources.txt'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    file         TEXT PRIMARY KEY,
+    sha256       TEXT NOT NULL,
+    extracted_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS citations (
+    id           INTEGER PRIMARY KEY,
+    dedup_key    TEXT NOT NULL UNIQUE,
+    doi          TEXT,
+    url          TEXT,
+    first_author TEXT NOT NULL,
+    authors      TEXT NOT NULL,
+    year         INTEGER,
+    title        TEXT,
+    citation     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    citation_id  INTEGER NOT NULL REFERENCES citations(id),
+    file         TEXT NOT NULL REFERENCES files(file),
+    section      TEXT,
+    line         INTEGER NOT NULL,
+    sample_size  INTEGER,
+    sample_unit  TEXT,
+    sample_text  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_citations_doi ON citations(doi);
+CREATE INDEX IF NOT EXISTS idx_citations_author_year ON citations(first_author, year);
+CREATE INDEX IF NOT EXISTS idx_mentions_file ON mentions(file);
+CREATE INDEX IF NOT EXISTS idx_mentions_citation ON mentions(citation_id);
+'''
+
+_SECTION = re.compile(r'^## (.*)$')
+_HEADER = re.compile(r'^#{1,6} ')
+_CITATION_BLOCK = re.compile(r'^### Citation\s*$')
+_CITATION_BULLET = re.compile(r'^- \*\*(?:Citation|Source):\*\*\s*(.*)$')
+_SAMPLE_BULLET = re.compile(r'^- \*\*(?:Sample Size|Total Sample):\*\*\s*(.*)$')
+_YEAR = re.compile(r'\((\d{4})\)')
+_DOI = re.compile(r'\b(10\.\d{4,9}/[^\s"<>]+)', re.I)
+_URL = re.compile(r'https?://\S+')
+_SAMPLE = re.compile(r'([\d,]*\d(?:\.\d+)?)\s*(million|m\b|k\b)?\+?\s*(?:U\.S\.\s+)?([A-Za-z]+)?', re.I)
+_MULTIPLIERS = {'million': 1_000_000, 'm': 1_000_000, 'k': 1_000}
+
+
+def _strip_trailing(text):
+    return text.rstrip('.,;)')
+
+
+def parse_citation(text):
+    """Split an APA-style reference into its fields (None if it has no year)"""
+    year_match = _YEAR.search(text)
+    if not year_match or text.startswith('['):
+        return None
+    authors = text[:year_match.start()].strip().rstrip(',')
+    rest = text[year_match.end():].lstrip('. ')
+    # First sentence; 'U.S. Job' is not a sentence break
+    title = re.split(r'(?<![A-Z]\.)(?<=[.?!])\s', rest.replace('*', ''), maxsplit=1)[0].rstrip('.')
+    doi = _DOI.search(text)
+    url = _URL.search(text)
+    return {
+        'authors': authors,
+        'first_author': authors.split(',')[0].strip().rstrip('.'),
+        'year': int(year_match.group(1)),
+        'title': title or None,
+        'doi': _strip_trailing(doi.group(1)).lower() if doi else None,
+        'url': _strip_trailing(url.group(0)) if url else None,
+        'citation': text,
+    }
+
+
+def parse_sample(text):
+    """'13,346 employees from 142 companies' → (13346, 'employees')"""
+    match = _SAMPLE.search(text)
+    if not match:
+        return None, None
+    value = float(match.group(1).replace(',', ''))
+    value *= _MULTIPLIERS.get((match.group(2) or '').lower(), 1)
+    unit = match.group(3).lower() if match.group(3) else None
+    return int(value), unit
+
+
+def dedup_key(record):
+    """DOI when there is one, otherwise first author + year + title words"""
+    if record['doi']:
+        return f"doi:{record['doi']}"
+    title = ' '.join(re.findall(r'[a-z0-9]+', (record['title'] or '').lower())[:8])
+    author = ' '.join(re.findall(r'[a-z0-9]+', record['first_author'].lower()))
+    return f"ref:{author}|{record['year']}|{title}"
+
+
+def extract_file(text):
+    """Citations in one file: dicts with the parsed fields plus section/line/sample"""
+    found, pending = [], []
+    section, sample = None, (None, None, None)
+
+    def close_section():
+        for record in pending:
+            record['sample_size'], record['sample_unit'], record['sample_text'] = sample
+        found.extend(pending)
+        pending.clear()
+
+    def continuation(start):
+        parts = []
+        for raw in lines[start:]:
+            if not raw.strip() or _HEADER.match(raw) or raw.startswith('- '):
+                break
+            parts.append(raw.strip())
+        return parts
+
+    lines = text.splitlines()
+    for number, raw in enumerate(lines, 1):
+        if _SECTION.match(raw):
+            close_section()
+            section, sample = _SECTION.match(raw).group(1).strip(), (None, None, None)
+            continue
+        if _CITATION_BLOCK.match(raw):
+            parts, line = continuation(number), number + 1
+        elif _CITATION_BULLET.match(raw):
+            parts, line = [_CITATION_BULLET.match(raw).group(1)] + continuation(number), number
+        else:
+            match = _SAMPLE_BULLET.match(raw)
+            if match and sample[0] is None:
+                size, unit = parse_sample(match.group(1))
+                if size is not None:
+                    sample = (size, unit, match.group(1).strip())
+            continue
+        record = parse_citation(' '.join(' '.join(parts).split()))
+        if record:
+            record.update(section=section, line=line)
+            pending.append(record)
+    close_section()
+    return found
+
+
+def connect(path=DEFAULT_DB):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _store(conn, filename, digest, records):
+    conn.execute('DELETE FROM mentions WHERE file = ?', (filename,))
+    conn.execute('INSERT OR REPLACE INTO files (file, sha256, extracted_at) VALUES (?, ?, ?)',
+                 (filename, digest, datetime.now().isoformat(timespec='seconds')))
+    for r in records:
+        key = dedup_key(r)
+        conn.execute('''
+            INSERT INTO citations (dedup_key, doi, url, first_author, authors, year, title, citation)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(dedup_key) DO UPDATE SET
+                url = COALESCE(excluded.url, url), citation = excluded.citation''',
+                     (key, r['doi'], r['url'], r['first_author'], r['authors'], r['year'],
+                      r['title'], r['citation']))
+        citation_id = conn.execute('SELECT id FROM citations WHERE dedup_key = ?', (key,)).fetchone()[0]
+        conn.execute('''
+            INSERT INTO mentions (citation_id, file, section, line, sample_size, sample_unit, sample_text)
+            VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                     (citation_id, filename, r['section'], r['line'], r['sample_size'],
+                      r['sample_unit'], r['sample_text']))
+
+
+def extract(conn, content_dir=CONTENT_DIR, force=False):
+    """Re-extract changed source files; returns (changed files, unchanged count)"""
+    known = dict(conn.execute('SELECT file, sha256 FROM files'))
+    paths = sorted(Path(content_dir).glob(SOURCE_GLOB))
+    changed = []
+    with conn:
+        for path in paths:
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if not force and known.get(path.name) == digest:
+                continue
+            _store(conn, path.name, digest, extract_file(data.decode('utf-8')))
+            changed.append(path.name)
+
+        removed = set(known) - {p.name for p in paths}
+        for filename in removed:
+            conn.execute('DELETE FROM mentions WHERE file = ?', (filename,))
+            conn.execute('DELETE FROM files WHERE file = ?', (filename,))
+        # Citations no file mentions any more
+        conn.execute('DELETE FROM citations WHERE id NOT IN (SELECT citation_id FROM mentions)')
+    return changed, len(paths) - len(changed)
+
+
+def citations(conn):
+    """Every citation with its largest reported sample and mentioning files"""
+    return conn.execute('''
+        SELECT c.*, MAX(m.sample_size) AS sample_size, m.sample_unit,
+               GROUP_CONCAT(DISTINCT m.file) AS files
+        FROM citations c JOIN mentions m ON m.citation_id = c.id
+        GROUP BY c.id ORDER BY c.year, c.first_author''').fetchall()
+
+
+def find_citation(conn, label, year=None):
+    """Best match for a chart label like 'Trevor et al.' or 'BLS JOLTS' (in a year, if given)"""
+    words = [w for w in re.findall(r'[a-z]{3,}', label.lower()) if w not in ('al', 'et')]
+    for row in citations(conn):
+        if year is not None and row['year'] != year:
+            continue
+        haystack = f"{row['authors']} {row['title'] or ''}".lower()
+        if any(re.search(rf'\b{re.escape(w)}\b', haystack) for w in words):
+            return row
+    return None
+
+
+def check_charts(conn, spec=None):
+    """(label, chart value, extracted row or None) for the scientific studies and effect size charts
+
+    Effect size rows name their study in the last '(...)' of the label; rows
+    with no sample size (not pooled) are skipped.
+    """
+    from chart_data import load_chart_data
+    if spec is None:
+        spec = load_chart_data()
+    charts = spec['charts']
+    data = charts['scientific_studies']
+    results = []
+    for label, value in zip(data['studies'], data['sample_sizes']):
+        year = _YEAR.search(label.replace('\n', ' '))
+        row = find_citation(conn, label.split('(')[0], int(year.group(1))) if year else None
+        results.append((label.replace('\n', ' '), value, row))
+    data = charts['effect_sizes']
+    for label, value in zip(data['relationships'], data['sample_sizes']):
+        if value > 0:
+            study = label.rsplit('(', 1)[-1].rstrip(')')
+            results.append((label.replace('\n', ' '), value, find_citation(conn, study)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract and query the evidence citation database')
+    parser.add_argument('command', nargs='?', default='extract',
+                        choices=['extract', 'list', 'check-charts'])
+    parser.add_argument('--db', default=str(DEFAULT_DB))
+    parser.add_argument('--force', action='store_true', help='re-extract every file')
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    changed, unchanged = extract(conn, force=args.force)
+    if args.command == 'extract':
+        print(f"✓ Extracted {len(changed)} changed file(s), {unchanged} unchanged → {args.db}")
+        for filename in changed:
+            print(f"  - {filename}")
+        total = conn.execute('SELECT COUNT(*) FROM citations').fetchone()[0]
+        print(f"  {total} unique citation(s)")
+        return 0
+
+    if args.command == 'list':
+        for row in citations(conn):
+            sample = f"{row['sample_size']:,} {row['sample_unit'] or ''}".strip() if row['sample_size'] else '-'
+            print(f"  {row['year']}  {row['first_author'][:32]:<32} {sample:<22} {row['doi'] or row['url'] or ''}")
+        return 0
+
+    mismatches = 0
+    checks = check_charts(conn)
+    width = max(len(label) for label, _, _ in checks)
+    print(f"{'Chart label':<{width + 2}} {'Chart':>12} {'Extracted':>24}")
+    for label, value, row in checks:
+        if row is None or row['sample_size'] is None:
+            status, extracted = '?', 'not found'
+        else:
+            extracted = f"{row['sample_size']:,} {row['sample_unit'] or ''}".strip()
+            status = '✓' if row['sample_size'] == value else '✗'
+        mismatches += status != '✓'
+        print(f"{status} {label:<{width}} {value:>12,} {extracted:>24}")
+    if mismatches:
+        print(f"\n✗ {mismatches} chart value(s) differ from the source files")
+        return 1
+    print("\n✓ Chart sample sizes match the source files")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
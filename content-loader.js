@@ -1,22 +1,40 @@
 (function() {
-    console.log('Enhanced Content Loader v2.3 - Fixed logging & performance');
+    console.log('Enhanced Content Loader v2.6 - Live reload instead of polling');
+    
+    const contentFiles = [
+        'ask-problem-definition.txt', 'ask-stakeholder-analysis.txt', 'ask-success-criteria.txt',
+        'evidence-scientific-methods.txt', 'evidence-scientific-sources.txt', 'evidence-scientific-appraisal.txt',
+        'evidence-practitioner-methods.txt', 'evidence-practitioner-sources.txt', 'evidence-practitioner-appraisal.txt',
+        'evidence-organizational-methods.txt', 'evidence-organizational-sources.txt', 'evidence-organizational-appraisal.txt',
+        'evidence-stakeholder-methods.txt', 'evidence-stakeholder-sources.txt', 'evidence-stakeholder-appraisal.txt',
+        'synthesis-integration.txt', 'application-implementation.txt', 'assessment-monitoring.txt'
+    ];
     
     let loadedFiles = new Set(); // Track successfully loaded files
     let isInitialLoad = true;
+    const containers = new Map(); // filename → container, kept after onclick is removed
+    
+    // Hashed content bundle written by bundle_content.py (one request for all files)
+    const bundleUrl = document.currentScript ? document.currentScript.dataset.bundle : null;
+    let bundlePromise = null;
+    
+    // Event stream set by dev_server.py; the published page has none
+    const liveReloadUrl = document.currentScript ? document.currentScript.dataset.liveReload : null;
+    
+    // Containers filled at build time (prerender_content.py) need no fetch
+    document.querySelectorAll('[data-prerendered]').forEach(el => loadedFiles.add(el.dataset.prerendered));
+    
+    if (loadedFiles.size === contentFiles.length) {
+        console.log('📦 All content pre-rendered at build time - nothing to fetch');
+    } else {
+        document.addEventListener('DOMContentLoaded', loadAllContent);
+    }
     
-    document.addEventListener('DOMContentLoaded', loadAllContent);
-    const intervalId = setInterval(loadAllContent, 3000);
+    if (liveReloadUrl) {
+        connectLiveReload();
+    }
     
     async function loadAllContent() {
-        const contentFiles = [
-            'ask-problem-definition.txt', 'ask-stakeholder-analysis.txt', 'ask-success-criteria.txt',
-            'evidence-scientific-methods.txt', 'evidence-scientific-sources.txt', 'evidence-scientific-appraisal.txt',
-            'evidence-practitioner-methods.txt', 'evidence-practitioner-sources.txt', 'evidence-practitioner-appraisal.txt',
-            'evidence-organizational-methods.txt', 'evidence-organizational-sources.txt', 'evidence-organizational-appraisal.txt',
-            'evidence-stakeholder-methods.txt', 'evidence-stakeholder-sources.txt', 'evidence-stakeholder-appraisal.txt',
-            'synthesis-integration.txt', 'application-implementation.txt', 'assessment-monitoring.txt'
-        ];
-        
         let newFilesLoaded = 0;
         
         for (let filename of contentFiles) {
@@ -26,12 +44,12 @@
             }
             
             try {
-                const response = await fetch(`content/${filename}`);
+                const response = await fetchContent(filename);
                 if (response.ok) {
                     let content = await response.text();
                     
                     // Find the target container
-                    const targetDiv = document.querySelector(`[onclick*="${filename}"]`);
+                    const targetDiv = findContainer(filename);
                     if (targetDiv) {
                         const pre = targetDiv.querySelector('pre');
                         if (pre) {
@@ -39,29 +57,14 @@
                                 // Enhanced content processing
                                 content = processContent(content, filename);
                                 pre.innerHTML = content;
-                                
-                                // CLEAN UP PLACEHOLDERS (only once)
-                                removePlaceholderHints(targetDiv, filename);
-                                
-                                // DISABLE CLICK BEHAVIOR
-                                targetDiv.style.cursor = 'default';
-                                targetDiv.removeAttribute('onclick');
-                                targetDiv.title = 'Content loaded from ' + filename;
-                                
-                                // Mark as successfully loaded
-                                loadedFiles.add(filename);
+                                markLoaded(targetDiv, filename);
                                 newFilesLoaded++;
                                 
                                 console.log(`✅ Loaded ${filename}`);
                             } catch (processingError) {
                                 // Fallback to plain text
                                 pre.textContent = content;
-                                removePlaceholderHints(targetDiv, filename);
-                                targetDiv.style.cursor = 'default';
-                                targetDiv.removeAttribute('onclick');
-                                targetDiv.title = 'Content loaded from ' + filename;
-                                
-                                loadedFiles.add(filename);
+                                markLoaded(targetDiv, filename);
                                 newFilesLoaded++;
                                 
                                 console.log(`⚠️ Loaded ${filename} as plain text`);
@@ -80,14 +83,95 @@
             }
         }
         
-        // Stop checking once all files are loaded or containers are processed
-        if (loadedFiles.size === contentFiles.length || 
-            (isInitialLoad && newFilesLoaded === 0)) {
-            clearInterval(intervalId);
-            console.log(`🎉 Content loading complete! Loaded ${loadedFiles.size}/${contentFiles.length} files.`);
+        // One pass only: later edits arrive through live reload, not polling
+        console.log(`🎉 Content loading complete! Loaded ${loadedFiles.size}/${contentFiles.length} files.`);
+        isInitialLoad = false;
+    }
+    
+    function findContainer(filename) {
+        if (!containers.has(filename)) {
+            const container = document.querySelector(`[data-prerendered="${filename}"]`) ||
+                              document.querySelector(`[onclick*="${filename}"]`);
+            if (container) containers.set(filename, container);
         }
+        return containers.get(filename) || null;
+    }
+    
+    function markLoaded(targetDiv, filename) {
+        // CLEAN UP PLACEHOLDERS (only once)
+        removePlaceholderHints(targetDiv, filename);
         
-        isInitialLoad = false;
+        // DISABLE CLICK BEHAVIOR
+        targetDiv.style.cursor = 'default';
+        targetDiv.removeAttribute('onclick');
+        targetDiv.title = 'Content loaded from ' + filename;
+        
+        loadedFiles.add(filename);
+    }
+    
+    function connectLiveReload() {
+        const source = new EventSource(liveReloadUrl);
+        source.addEventListener('open', () => console.log('🔌 Live reload connected'));
+        source.addEventListener('change', event => {
+            for (const path of JSON.parse(event.data).files) {
+                if (path.startsWith('content/')) {
+                    reloadContent(path.slice('content/'.length));
+                } else if (path.startsWith('visuals/')) {
+                    reloadImage(path);
+                } else {
+                    location.reload(); // page or script changed
+                    return;
+                }
+            }
+        });
+    }
+    
+    async function reloadContent(filename) {
+        const targetDiv = findContainer(filename);
+        const pre = targetDiv ? targetDiv.querySelector('pre') : null;
+        if (!pre) return;
+        try {
+            const response = await fetch(`content/${filename}`, { cache: 'no-store' });
+            if (!response.ok) return;
+            pre.innerHTML = processContent(await response.text(), filename);
+            if (!loadedFiles.has(filename)) markLoaded(targetDiv, filename);
+            console.log(`🔄 Reloaded ${filename}`);
+        } catch (error) {
+            console.log(`❌ Live reload failed for ${filename}:`, error.message);
+        }
+    }
+    
+    function reloadImage(path) {
+        document.querySelectorAll('img').forEach(img => {
+            if ((img.getAttribute('src') || '').split('?')[0] === path) {
+                img.src = `${path}?v=${Date.now()}`;
+                console.log(`🔄 Reloaded ${path}`);
+            }
+        });
+    }
+    
+    function loadBundle() {
+        if (!bundlePromise) {
+            bundlePromise = fetch(bundleUrl)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.json();
+                })
+                .then(bundle => bundle.files)
+                .catch(error => {
+                    console.log(`⚠️ Content bundle unavailable (${error.message}), fetching files individually`);
+                    return null;
+                });
+        }
+        return bundlePromise;
+    }
+    
+    async function fetchContent(filename) {
+        const files = bundleUrl ? await loadBundle() : null;
+        if (files) {
+            return filename in files ? new Response(files[filename]) : new Response(null, { status: 404 });
+        }
+        return fetch(`content/${filename}`);
     }
     
     function removePlaceholderHints(container, filename) {
@@ -205,7 +289,7 @@
     
     window.debugContentLoader = function() {
         console.log('🔍 Content Loader Status:');
-        console.log(`📁 Files loaded: ${loadedFiles.size}/18`);
+        console.log(`📁 Files loaded: ${loadedFiles.size}/${contentFiles.length}`);
         console.log(`📋 Loaded files:`, Array.from(loadedFiles));
     };
     
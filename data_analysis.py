@@ -8,31 +8,88 @@ This script downloads, analyzes, and visualizes data from:
 - FEVS (M variable - satisfaction)
 """
 
+import glob
+import os
+import sys
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
+from scipy.stats import linregress
 from datetime import datetime
 import requests
 import json
 
-# Set style for professional visualizations
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 10
+import changepoints
+import fevs_ingest
+import forecasting
+import frequency_alignment
+import panel_regression
+import seasonal_adjustment
+from pipeline_trace import SUMMARY_FILE, TRACE_FILE, StageTracer
+from theme import apply_theme
 
-print("="*80)
-print("EBM DASHBOARD - COMPENSATION & RETENTION ANALYSIS")
-print("Conrad Dillman - MGT357 Fall 2025")
-print("="*80)
+# Set style for professional visualizations
+apply_theme('analysis')
+
+OUTPUT_DIR = 'analysis_output'
+
+# Skip the BLS API and use the sample data (repeatable runs, benchmarks)
+OFFLINE = os.environ.get('EBM_OFFLINE') == '1'
+
+# Compact mode: float32 metrics, categorical keys, no redundant columns and
+# fewer intermediate copies (EBM_COMPACT=1 or --compact). Off by default so
+# the exported CSVs keep full float64 precision.
+COMPACT = os.environ.get('EBM_COMPACT') == '1'
+
+# Record per-stage tracemalloc peaks (EBM_TRACE_MEMORY=1 or --memory)
+TRACE_MEMORY = os.environ.get('EBM_TRACE_MEMORY') == '1'
+
+# Respondent-level FEVS files to stream instead of the sample M data
+# (EBM_FEVS=glob, e.g. EBM_FEVS='data/FEVS_*_PRDF.csv' or data/fevs_fixture.csv)
+FEVS_FILES = os.environ.get('EBM_FEVS')
+
+# How each quarterly/annual variable reaches the monthly JOLTS grid - see
+# frequency_alignment.py (ffill, linear, cubic, denton). Override with
+# EBM_ALIGN / --align=METHOD (every variable) or --align=VAR=METHOD,VAR=METHOD
+ALIGNMENT = {
+    'compensation_change_pct': 'ffill',
+    'pay_satisfaction': 'ffill',
+    'supervisor_effectiveness': 'ffill',
+    'overall_satisfaction': 'ffill',
+    'intent_to_stay': 'ffill',
+}
+# Seasonally adjust quits and compensation before the correlations and trends
+# (EBM_SEASONAL_ADJUST=classical|stl or --seasonal-adjust[=stl]). Off by
+# default: the BLS quits series is already seasonally adjusted.
+SEASONAL_ADJUST = os.environ.get('EBM_SEASONAL_ADJUST')
+SEASONAL_SERIES = ['quits_rate', 'compensation_change_pct']
+
+# Detect regime breaks with PELT and mark them on the time-series figure
+# (EBM_CHANGEPOINTS=0 or --no-changepoints to skip)
+CHANGEPOINTS = os.environ.get('EBM_CHANGEPOINTS') != '0'
+CHANGEPOINT_SERIES = ['quits_rate', 'compensation_change_pct']
+
+# Forecast quits and compensation with holdout model selection - see
+# forecasting.py (EBM_FORECAST=0 or --no-forecast to skip; horizon in months
+# via EBM_FORECAST_HORIZON or --forecast-horizon=N, 1-24)
+FORECAST = os.environ.get('EBM_FORECAST') != '0'
+FORECAST_HORIZON = int(os.environ.get('EBM_FORECAST_HORIZON', forecasting.HORIZON))
+
+# Segment × month panel for the fixed-effects regression, which only runs
+# when one is given (EBM_PANEL=CSV or --panel=CSV with segment, date,
+# quits_rate, compensation_change_pct, overall_satisfaction)
+PANEL_FILE = os.environ.get('EBM_PANEL')
+PANEL_REGRESSORS = ['compensation_change_pct', 'overall_satisfaction']
+
+FEVS_METRICS = ['pay_satisfaction', 'supervisor_effectiveness', 'overall_satisfaction', 'intent_to_stay']
 
 # =============================================================================
 # PART 1: DOWNLOAD BLS DATA VIA API
 # =============================================================================
 
-print("\n[1/7] Downloading BLS JOLTS data (Quits Rate - Y variable)...")
-
 # BLS API Configuration
 BLS_API_URL = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
 HEADERS = {'Content-type': 'application/json'}
@@ -47,6 +104,9 @@ eci_series_id = "CIU2010000000000A"  # ECI, 12-month percent change
 # Function to fetch BLS data
 def fetch_bls_data(series_id, start_year, end_year):
     """Fetch data from BLS API"""
+    if OFFLINE:
+        return None
+
     payload = json.dumps({
         "seriesid": [series_id],
         "startyear": str(start_year),
@@ -67,479 +127,859 @@ def fetch_bls_data(series_id, start_year, end_year):
         print(f"Error fetching data: {e}")
         return None
 
-# Fetch JOLTS data (2010-2025)
-jolts_df = fetch_bls_data(jolts_series_id, 2010, 2025)
-
-# Check if API call succeeded, otherwise use realistic sample data
-if jolts_df is not None and 'value' in jolts_df.columns:
-    # Clean JOLTS data
-    jolts_df['value'] = pd.to_numeric(jolts_df['value'])
-    jolts_df['date'] = pd.to_datetime(jolts_df['year'] + '-' + jolts_df['period'].str.replace('M', ''))
-    jolts_df = jolts_df[['date', 'value']].rename(columns={'value': 'quits_rate'})
-    jolts_df = jolts_df.sort_values('date').reset_index(drop=True)
-    print(f"✓ Downloaded {len(jolts_df)} months of JOLTS data")
-else:
-    print("✗ BLS API unavailable - using realistic sample data based on actual trends")
-    # Create realistic JOLTS data based on actual BLS trends
-    date_range = pd.date_range(start='2010-01-01', end='2025-09-01', freq='MS')
-    np.random.seed(42)
-    
-    # Base quits rate with realistic trends
-    # 2010-2014: ~1.5% (recession recovery)
-    # 2015-2019: rising to 2.3% (tight labor market)
-    # 2020: drop to 1.6% (COVID)
-    # 2021-2022: surge to 3.0% (Great Resignation)
-    # 2023-2025: stabilizing around 2.3%
-    
-    quits_values = []
-    for date in date_range:
-        year = date.year
-        if year <= 2014:
-            base = 1.5 + (year - 2010) * 0.05
-        elif year <= 2019:
-            base = 1.75 + (year - 2015) * 0.11
-        elif year == 2020:
-            base = 2.3 - (date.month / 12) * 0.7 if date.month <= 6 else 1.6
-        elif year == 2021:
-            base = 1.6 + (date.month / 12) * 1.0
-        elif year == 2022:
-            base = 2.6 + (date.month / 12) * 0.2
-        else:
-            base = 2.3 + np.sin(date.month / 12 * 2 * np.pi) * 0.2
-        
-        # Add realistic monthly variation
-        quits_values.append(base + np.random.normal(0, 0.1))
-    
-    jolts_df = pd.DataFrame({
-        'date': date_range,
-        'quits_rate': quits_values
-    })
-    print(f"✓ Created {len(jolts_df)} months of sample JOLTS data")
-
-print("\n[2/7] Downloading BLS ECI data (Compensation - X variable)...")
-
-# Fetch ECI data (2010-2025)
-eci_df = fetch_bls_data(eci_series_id, 2010, 2025)
-
-if eci_df is not None and 'value' in eci_df.columns:
-    # Clean ECI data
-    eci_df['value'] = pd.to_numeric(eci_df['value'])
-    # ECI is quarterly: Q01, Q02, Q03, Q04
-    quarter_map = {'Q01': '03', 'Q02': '06', 'Q03': '09', 'Q04': '12'}
-    eci_df['month'] = eci_df['period'].map(quarter_map)
-    eci_df['date'] = pd.to_datetime(eci_df['year'] + '-' + eci_df['month'] + '-01')
-    eci_df = eci_df[['date', 'value']].rename(columns={'value': 'compensation_change_pct'})
-    eci_df = eci_df.sort_values('date').reset_index(drop=True)
-    print(f"✓ Downloaded {len(eci_df)} quarters of ECI data")
-else:
-    print("✗ BLS API unavailable - using realistic sample data based on actual trends")
-    # Create realistic ECI data based on actual BLS trends
-    date_range = pd.date_range(start='2010-03-01', end='2025-09-01', freq='QS-MAR')
-    np.random.seed(43)
-    
-    # Base compensation growth with realistic trends
-    # 2010-2012: 1.5-2.0% (slow recovery)
-    # 2013-2019: 2.0-2.8% (steady growth)
-    # 2020: drop to 2.5% (COVID freeze)
-    # 2021-2023: surge to 4.0-5.0% (inflation + tight labor market)
-    # 2024-2025: cooling to 3.5%
-    
-    comp_values = []
-    for date in date_range:
-        year = date.year
-        if year <= 2012:
-            base = 1.5 + (year - 2010) * 0.15
-        elif year <= 2019:
-            base = 1.8 + (year - 2013) * 0.10
-        elif year == 2020:
-            base = 2.5 - (date.month / 12) * 0.3
-        elif year <= 2023:
-            base = 2.8 + (year - 2020) * 0.6
-        else:
-            base = 4.2 - (year - 2023) * 0.35
-        
-        # Add quarterly variation
-        comp_values.append(base + np.random.normal(0, 0.15))
-    
-    eci_df = pd.DataFrame({
-        'date': date_range,
-        'compensation_change_pct': comp_values
-    })
-    print(f"✓ Created {len(eci_df)} quarters of sample ECI data")
+
+def load_jolts():
+    """Part 1a: JOLTS quits rate (Y), from the BLS API or realistic sample data"""
+    print("\n[1/7] Downloading BLS JOLTS data (Quits Rate - Y variable)...")
+
+    # Fetch JOLTS data (2010-2025)
+    jolts_df = fetch_bls_data(jolts_series_id, 2010, 2025)
+
+    # Check if API call succeeded, otherwise use realistic sample data
+    if jolts_df is not None and 'value' in jolts_df.columns:
+        # Clean JOLTS data
+        jolts_df['value'] = pd.to_numeric(jolts_df['value'])
+        jolts_df['date'] = pd.to_datetime(jolts_df['year'] + '-' + jolts_df['period'].str.replace('M', ''))
+        jolts_df = jolts_df[['date', 'value']].rename(columns={'value': 'quits_rate'})
+        jolts_df = jolts_df.sort_values('date').reset_index(drop=True)
+        print(f"✓ Downloaded {len(jolts_df)} months of JOLTS data")
+    else:
+        print("✗ BLS API unavailable - using realistic sample data based on actual trends")
+        # Create realistic JOLTS data based on actual BLS trends
+        date_range = pd.date_range(start='2010-01-01', end='2025-09-01', freq='MS')
+        np.random.seed(42)
+
+        # Base quits rate with realistic trends
+        # 2010-2014: ~1.5% (recession recovery)
+        # 2015-2019: rising to 2.3% (tight labor market)
+        # 2020: drop to 1.6% (COVID)
+        # 2021-2022: surge to 3.0% (Great Resignation)
+        # 2023-2025: stabilizing around 2.3%
+
+        quits_values = []
+        for date in date_range:
+            year = date.year
+            if year <= 2014:
+                base = 1.5 + (year - 2010) * 0.05
+            elif year <= 2019:
+                base = 1.75 + (year - 2015) * 0.11
+            elif year == 2020:
+                base = 2.3 - (date.month / 12) * 0.7 if date.month <= 6 else 1.6
+            elif year == 2021:
+                base = 1.6 + (date.month / 12) * 1.0
+            elif year == 2022:
+                base = 2.6 + (date.month / 12) * 0.2
+            else:
+                base = 2.3 + np.sin(date.month / 12 * 2 * np.pi) * 0.2
+
+            # Add realistic monthly variation
+            quits_values.append(base + np.random.normal(0, 0.1))
+
+        jolts_df = pd.DataFrame({
+            'date': date_range,
+            'quits_rate': quits_values
+        })
+        print(f"✓ Created {len(jolts_df)} months of sample JOLTS data")
+    return jolts_df
+
+
+def load_eci():
+    """Part 1b: ECI compensation change (X), from the BLS API or sample data"""
+    print("\n[2/7] Downloading BLS ECI data (Compensation - X variable)...")
+
+    # Fetch ECI data (2010-2025)
+    eci_df = fetch_bls_data(eci_series_id, 2010, 2025)
+
+    if eci_df is not None and 'value' in eci_df.columns:
+        # Clean ECI data
+        eci_df['value'] = pd.to_numeric(eci_df['value'])
+        # ECI is quarterly: Q01, Q02, Q03, Q04
+        quarter_map = {'Q01': '03', 'Q02': '06', 'Q03': '09', 'Q04': '12'}
+        eci_df['month'] = eci_df['period'].map(quarter_map)
+        eci_df['date'] = pd.to_datetime(eci_df['year'] + '-' + eci_df['month'] + '-01')
+        eci_df = eci_df[['date', 'value']].rename(columns={'value': 'compensation_change_pct'})
+        eci_df = eci_df.sort_values('date').reset_index(drop=True)
+        print(f"✓ Downloaded {len(eci_df)} quarters of ECI data")
+    else:
+        print("✗ BLS API unavailable - using realistic sample data based on actual trends")
+        # Create realistic ECI data based on actual BLS trends
+        date_range = pd.date_range(start='2010-03-01', end='2025-09-01', freq='QS-MAR')
+        np.random.seed(43)
+
+        # Base compensation growth with realistic trends
+        # 2010-2012: 1.5-2.0% (slow recovery)
+        # 2013-2019: 2.0-2.8% (steady growth)
+        # 2020: drop to 2.5% (COVID freeze)
+        # 2021-2023: surge to 4.0-5.0% (inflation + tight labor market)
+        # 2024-2025: cooling to 3.5%
+
+        comp_values = []
+        for date in date_range:
+            year = date.year
+            if year <= 2012:
+                base = 1.5 + (year - 2010) * 0.15
+            elif year <= 2019:
+                base = 1.8 + (year - 2013) * 0.10
+            elif year == 2020:
+                base = 2.5 - (date.month / 12) * 0.3
+            elif year <= 2023:
+                base = 2.8 + (year - 2020) * 0.6
+            else:
+                base = 4.2 - (year - 2023) * 0.35
+
+            # Add quarterly variation
+            comp_values.append(base + np.random.normal(0, 0.15))
+
+        eci_df = pd.DataFrame({
+            'date': date_range,
+            'compensation_change_pct': comp_values
+        })
+        print(f"✓ Created {len(eci_df)} quarters of sample ECI data")
+    return eci_df
+
 
 # =============================================================================
 # PART 2: CREATE SAMPLE FEVS DATA (PLACEHOLDER)
 # =============================================================================
 
-print("\n[3/7] Creating sample FEVS data (Employee Satisfaction - M variable)...")
-print("   Note: Full FEVS data requires manual download from OPM website")
-
-# Create sample FEVS data with realistic trends
-np.random.seed(42)
-fevs_years = range(2015, 2026)
-fevs_data = {
-    'year': fevs_years,
-    'pay_satisfaction': [3.2, 3.3, 3.4, 3.5, 3.3, 3.4, 3.6, 3.7, 3.5, 3.6, 3.8],
-    'supervisor_effectiveness': [3.6, 3.7, 3.7, 3.8, 3.7, 3.8, 3.9, 4.0, 3.9, 4.0, 4.1],
-    'overall_satisfaction': [3.4, 3.5, 3.6, 3.7, 3.6, 3.7, 3.8, 3.9, 3.8, 3.9, 4.0],
-    'intent_to_stay': [3.8, 3.9, 4.0, 4.1, 3.9, 4.0, 4.2, 4.3, 4.1, 4.2, 4.4],
-    'sample_size': [400000] * 11
-}
-fevs_df = pd.DataFrame(fevs_data)
-fevs_df['date'] = pd.to_datetime(fevs_df['year'].astype(str) + '-06-01')  # Mid-year
-print(f"✓ Created sample FEVS data for {len(fevs_df)} years")
+def load_fevs_microdata(pattern):
+    """Part 2: weighted FEVS satisfaction scores (M) streamed from respondent files"""
+    print("\n[3/7] Streaming FEVS respondent files (Employee Satisfaction - M variable)...")
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        raise FileNotFoundError(f"no FEVS files match {pattern}")
+    by_agency, rows = fevs_ingest.ingest(paths)
+    fevs_df = fevs_ingest.governmentwide(by_agency)
+    agencies = by_agency['agency'].nunique() - 1
+    print(f"✓ Aggregated {rows:,} responses from {len(paths)} file(s) "
+          f"into {len(fevs_df)} years across {agencies} agencies")
+    return fevs_df
+
+
+def load_fevs():
+    """Part 2: sample FEVS satisfaction scores (M)"""
+    if FEVS_FILES:
+        return load_fevs_microdata(FEVS_FILES)
+    print("\n[3/7] Creating sample FEVS data (Employee Satisfaction - M variable)...")
+    print("   Note: Full FEVS data requires manual download from OPM website")
+
+    # Create sample FEVS data with realistic trends
+    np.random.seed(42)
+    fevs_years = range(2015, 2026)
+    fevs_data = {
+        'year': fevs_years,
+        'pay_satisfaction': [3.2, 3.3, 3.4, 3.5, 3.3, 3.4, 3.6, 3.7, 3.5, 3.6, 3.8],
+        'supervisor_effectiveness': [3.6, 3.7, 3.7, 3.8, 3.7, 3.8, 3.9, 4.0, 3.9, 4.0, 4.1],
+        'overall_satisfaction': [3.4, 3.5, 3.6, 3.7, 3.6, 3.7, 3.8, 3.9, 3.8, 3.9, 4.0],
+        'intent_to_stay': [3.8, 3.9, 4.0, 4.1, 3.9, 4.0, 4.2, 4.3, 4.1, 4.2, 4.4],
+        'sample_size': [400000] * 11
+    }
+    fevs_df = pd.DataFrame(fevs_data)
+    fevs_df['date'] = pd.to_datetime(fevs_df['year'].astype(str) + '-06-01')  # Mid-year
+    print(f"✓ Created sample FEVS data for {len(fevs_df)} years")
+    return fevs_df
+
+
+def load_segment_panel(path):
+    """Part 2b: quits, compensation and satisfaction by segment × month"""
+    panel_df = pd.read_csv(path, parse_dates=['date'])
+    missing = [c for c in ['segment', 'date', 'quits_rate', *PANEL_REGRESSORS] if c not in panel_df]
+    if missing:
+        raise ValueError(f"{path}: missing column(s) {', '.join(missing)}")
+    print(f"✓ Loaded {len(panel_df):,} segment-months for "
+          f"{panel_df['segment'].nunique()} segments from {path}")
+    return panel_df
+
 
 # =============================================================================
 # PART 3: MERGE DATASETS
 # =============================================================================
 
-print("\n[4/7] Merging datasets...")
-
-# Merge JOLTS and ECI (align monthly JOLTS with quarterly ECI)
-# Use forward fill to propagate quarterly ECI values to monthly frequency
-merged_df = jolts_df.copy()
-merged_df['year_month'] = merged_df['date'].dt.to_period('M')
+def compact_frame(df):
+    """Downcast metrics to float32 / smallest int and string keys to category"""
+    dtypes = {}
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype):
+            dtypes[col] = 'float32'
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[col] = pd.to_numeric(df[col], downcast='integer').dtype
+        elif pd.api.types.is_string_dtype(dtype) or dtype == object:
+            dtypes[col] = 'category'
+    return df.astype(dtypes)
+
+
+def parse_alignment(spec):
+    """'linear' or 'compensation_change_pct=denton,overall_satisfaction=cubic' → ALIGNMENT updates"""
+    if '=' not in spec:
+        updates = dict.fromkeys(ALIGNMENT, spec)
+    else:
+        updates = dict(item.split('=', 1) for item in spec.split(','))
+    for variable, method in updates.items():
+        if variable not in ALIGNMENT:
+            raise ValueError(f"unknown variable {variable!r} in alignment (expected {', '.join(ALIGNMENT)})")
+        if method not in frequency_alignment.METHODS:
+            raise ValueError(f"unknown alignment method {method!r} (expected {', '.join(frequency_alignment.METHODS)})")
+    return updates
+
+
+def align_monthly(df, columns, freq, aggregation, monthly_dates):
+    """Align `columns` of a quarterly/annual frame to month starts, each with its ALIGNMENT method"""
+    frame = df.set_index('date')[columns]
+    target = frequency_alignment.monthly_grid(frame.index, monthly_dates)
+    by_method = {}
+    for column in columns:
+        by_method.setdefault(ALIGNMENT[column], []).append(column)
+    aligned = pd.concat([frequency_alignment.align(frame[cols], target, method, freq, aggregation)
+                         for method, cols in by_method.items()], axis=1)[columns]
+    aligned.index.name = 'date'
+    return aligned.dropna(how='all').reset_index()
+
+
+def merge_datasets(jolts_df, eci_df, fevs_df):
+    """Part 3: align quarterly ECI and annual FEVS to monthly JOLTS"""
+    print("\n[4/7] Merging datasets...")
+
+    # Merge JOLTS and ECI (align monthly JOLTS with quarterly ECI)
+    # ECI is a point-in-time reading in the quarter's last month; FEVS an annual level
+    if COMPACT:
+        # merge() below builds a new frame anyway, so skip the defensive
+        # copy and the year_month column (it duplicates 'date')
+        merged_df = compact_frame(jolts_df)
+        eci_df, fevs_df = compact_frame(eci_df), compact_frame(fevs_df)
+    else:
+        merged_df = jolts_df.copy()
+        merged_df['year_month'] = merged_df['date'].dt.to_period('M')
+
+    # Convert ECI to monthly frequency (forward fill unless ALIGNMENT says otherwise)
+    eci_monthly = align_monthly(eci_df, ['compensation_change_pct'], 'Q', 'last', merged_df['date'])
+
+    # Add FEVS data (annual to monthly)
+    fevs_monthly = align_monthly(fevs_df, FEVS_METRICS, 'Y', 'average', merged_df['date'])
+    if COMPACT:
+        eci_monthly, fevs_monthly = compact_frame(eci_monthly), compact_frame(fevs_monthly)
+
+    # Merge
+    merged_df = merged_df.merge(eci_monthly, on='date', how='left')
+    merged_df = merged_df.merge(fevs_monthly, on='date', how='left')
+
+    changed = {v: m for v, m in ALIGNMENT.items() if m != 'ffill'}
+    if changed:
+        print(f"   Alignment: {', '.join(f'{v}={m}' for v, m in changed.items())} (others forward-filled)")
+
+    print(f"✓ Merged dataset contains {len(merged_df)} observations")
+    print(f"   Date range: {merged_df['date'].min().strftime('%Y-%m')} to {merged_df['date'].max().strftime('%Y-%m')}")
+    return merged_df, eci_monthly
 
-# Convert ECI to monthly frequency via forward fill
-eci_monthly = eci_df.set_index('date').resample('MS').ffill().reset_index()
-
-# Merge
-merged_df = merged_df.merge(eci_monthly, on='date', how='left')
-
-# Add FEVS data (annual to monthly via forward fill)
-fevs_monthly = fevs_df.set_index('date').resample('MS').ffill().reset_index()
-merged_df = merged_df.merge(
-    fevs_monthly[['date', 'pay_satisfaction', 'supervisor_effectiveness', 'overall_satisfaction', 'intent_to_stay']], 
-    on='date', 
-    how='left'
-)
-
-print(f"✓ Merged dataset contains {len(merged_df)} observations")
-print(f"   Date range: {merged_df['date'].min().strftime('%Y-%m')} to {merged_df['date'].max().strftime('%Y-%m')}")
 
 # =============================================================================
 # PART 4: SUMMARY STATISTICS
 # =============================================================================
 
-print("\n[5/7] Calculating summary statistics...")
-print("\n" + "="*80)
-print("SUMMARY STATISTICS")
-print("="*80)
-
-# JOLTS Quits Rate (Y - Retention measure)
-print("\n📊 Y Variable - Employee Retention (inverse of quits rate)")
-print("-" * 80)
-print(f"Metric: Quits Rate (% of workforce voluntarily leaving per month)")
-print(f"   Mean:                {merged_df['quits_rate'].mean():.2f}%")
-print(f"   Median:              {merged_df['quits_rate'].median():.2f}%")
-print(f"   Std Deviation:       {merged_df['quits_rate'].std():.2f}%")
-print(f"   Min:                 {merged_df['quits_rate'].min():.2f}% ({merged_df.loc[merged_df['quits_rate'].idxmin(), 'date'].strftime('%Y-%m')})")
-print(f"   Max:                 {merged_df['quits_rate'].max():.2f}% ({merged_df.loc[merged_df['quits_rate'].idxmax(), 'date'].strftime('%Y-%m')})")
-print(f"   25th Percentile:     {merged_df['quits_rate'].quantile(0.25):.2f}%")
-print(f"   75th Percentile:     {merged_df['quits_rate'].quantile(0.75):.2f}%")
-print(f"\n   Interpretation: Higher quits rate = Lower retention")
-print(f"   Trend (2010-2025):   {merged_df.groupby(merged_df['date'].dt.year)['quits_rate'].mean().iloc[-1] - merged_df.groupby(merged_df['date'].dt.year)['quits_rate'].mean().iloc[0]:+.2f} percentage point change")
-
-# ECI Compensation Change (X)
-eci_clean = merged_df.dropna(subset=['compensation_change_pct'])
-print("\n📊 X Variable - Employee Compensation")
-print("-" * 80)
-print(f"Metric: Total Compensation 12-Month % Change (wages + benefits)")
-print(f"   Mean:                {eci_clean['compensation_change_pct'].mean():.2f}%")
-print(f"   Median:              {eci_clean['compensation_change_pct'].median():.2f}%")
-print(f"   Std Deviation:       {eci_clean['compensation_change_pct'].std():.2f}%")
-print(f"   Min:                 {eci_clean['compensation_change_pct'].min():.2f}% ({eci_clean.loc[eci_clean['compensation_change_pct'].idxmin(), 'date'].strftime('%Y-%m')})")
-print(f"   Max:                 {eci_clean['compensation_change_pct'].max():.2f}% ({eci_clean.loc[eci_clean['compensation_change_pct'].idxmax(), 'date'].strftime('%Y-%m')})")
-print(f"   25th Percentile:     {eci_clean['compensation_change_pct'].quantile(0.25):.2f}%")
-print(f"   75th Percentile:     {eci_clean['compensation_change_pct'].quantile(0.75):.2f}%")
-print(f"\n   Interpretation: Positive values = compensation increasing year-over-year")
-
-# FEVS Satisfaction (M)
-fevs_clean = merged_df.dropna(subset=['overall_satisfaction'])
-print("\n📊 M Variable - Employee Satisfaction")
-print("-" * 80)
-print(f"Metric: Overall Job Satisfaction (1-5 scale, 5=very satisfied)")
-print(f"   Mean:                {fevs_clean['overall_satisfaction'].mean():.2f}/5.0")
-print(f"   Median:              {fevs_clean['overall_satisfaction'].median():.2f}/5.0")
-print(f"   Std Deviation:       {fevs_clean['overall_satisfaction'].std():.2f}")
-print(f"   Min:                 {fevs_clean['overall_satisfaction'].min():.2f}/5.0")
-print(f"   Max:                 {fevs_clean['overall_satisfaction'].max():.2f}/5.0")
-print(f"\nMetric: Pay Satisfaction (1-5 scale)")
-print(f"   Mean:                {fevs_clean['pay_satisfaction'].mean():.2f}/5.0")
-print(f"\nMetric: Supervisor Effectiveness (1-5 scale)")
-print(f"   Mean:                {fevs_clean['supervisor_effectiveness'].mean():.2f}/5.0")
-print(f"\nMetric: Intent to Stay (1-5 scale, 5=definitely staying)")
-print(f"   Mean:                {fevs_clean['intent_to_stay'].mean():.2f}/5.0")
+def summary_statistics(merged_df, fevs_df=None):
+    """Part 4: descriptive statistics for X, M and Y
+
+    When `fevs_df` carries replicate-weight standard errors (streamed
+    microdata), the yearly survey estimates are reported with them.
+    """
+    print("\n[5/7] Calculating summary statistics...")
+    print("\n" + "="*80)
+    print("SUMMARY STATISTICS")
+    print("="*80)
+
+    # JOLTS Quits Rate (Y - Retention measure)
+    print("\n📊 Y Variable - Employee Retention (inverse of quits rate)")
+    print("-" * 80)
+    print(f"Metric: Quits Rate (% of workforce voluntarily leaving per month)")
+    print(f"   Mean:                {merged_df['quits_rate'].mean():.2f}%")
+    print(f"   Median:              {merged_df['quits_rate'].median():.2f}%")
+    print(f"   Std Deviation:       {merged_df['quits_rate'].std():.2f}%")
+    print(f"   Min:                 {merged_df['quits_rate'].min():.2f}% ({merged_df.loc[merged_df['quits_rate'].idxmin(), 'date'].strftime('%Y-%m')})")
+    print(f"   Max:                 {merged_df['quits_rate'].max():.2f}% ({merged_df.loc[merged_df['quits_rate'].idxmax(), 'date'].strftime('%Y-%m')})")
+    print(f"   25th Percentile:     {merged_df['quits_rate'].quantile(0.25):.2f}%")
+    print(f"   75th Percentile:     {merged_df['quits_rate'].quantile(0.75):.2f}%")
+    print(f"\n   Interpretation: Higher quits rate = Lower retention")
+    print(f"   Trend (2010-2025):   {merged_df.groupby(merged_df['date'].dt.year)['quits_rate'].mean().iloc[-1] - merged_df.groupby(merged_df['date'].dt.year)['quits_rate'].mean().iloc[0]:+.2f} percentage point change")
+
+    # ECI Compensation Change (X)
+    if COMPACT:
+        # Filter only the columns the stats use instead of copying every row
+        eci_clean = merged_df[['date', 'compensation_change_pct']].dropna()
+    else:
+        eci_clean = merged_df.dropna(subset=['compensation_change_pct'])
+    print("\n📊 X Variable - Employee Compensation")
+    print("-" * 80)
+    print(f"Metric: Total Compensation 12-Month % Change (wages + benefits)")
+    print(f"   Mean:                {eci_clean['compensation_change_pct'].mean():.2f}%")
+    print(f"   Median:              {eci_clean['compensation_change_pct'].median():.2f}%")
+    print(f"   Std Deviation:       {eci_clean['compensation_change_pct'].std():.2f}%")
+    print(f"   Min:                 {eci_clean['compensation_change_pct'].min():.2f}% ({eci_clean.loc[eci_clean['compensation_change_pct'].idxmin(), 'date'].strftime('%Y-%m')})")
+    print(f"   Max:                 {eci_clean['compensation_change_pct'].max():.2f}% ({eci_clean.loc[eci_clean['compensation_change_pct'].idxmax(), 'date'].strftime('%Y-%m')})")
+    print(f"   25th Percentile:     {eci_clean['compensation_change_pct'].quantile(0.25):.2f}%")
+    print(f"   75th Percentile:     {eci_clean['compensation_change_pct'].quantile(0.75):.2f}%")
+    print(f"\n   Interpretation: Positive values = compensation increasing year-over-year")
+
+    # FEVS Satisfaction (M)
+    if COMPACT:
+        fevs_clean = merged_df[['date', 'pay_satisfaction', 'supervisor_effectiveness',
+                                'overall_satisfaction', 'intent_to_stay']].dropna(
+                                    subset=['overall_satisfaction'])
+    else:
+        fevs_clean = merged_df.dropna(subset=['overall_satisfaction'])
+    print("\n📊 M Variable - Employee Satisfaction")
+    print("-" * 80)
+    print(f"Metric: Overall Job Satisfaction (1-5 scale, 5=very satisfied)")
+    print(f"   Mean:                {fevs_clean['overall_satisfaction'].mean():.2f}/5.0")
+    print(f"   Median:              {fevs_clean['overall_satisfaction'].median():.2f}/5.0")
+    print(f"   Std Deviation:       {fevs_clean['overall_satisfaction'].std():.2f}")
+    print(f"   Min:                 {fevs_clean['overall_satisfaction'].min():.2f}/5.0")
+    print(f"   Max:                 {fevs_clean['overall_satisfaction'].max():.2f}/5.0")
+    print(f"\nMetric: Pay Satisfaction (1-5 scale)")
+    print(f"   Mean:                {fevs_clean['pay_satisfaction'].mean():.2f}/5.0")
+    print(f"\nMetric: Supervisor Effectiveness (1-5 scale)")
+    print(f"   Mean:                {fevs_clean['supervisor_effectiveness'].mean():.2f}/5.0")
+    print(f"\nMetric: Intent to Stay (1-5 scale, 5=definitely staying)")
+    print(f"   Mean:                {fevs_clean['intent_to_stay'].mean():.2f}/5.0")
+    if fevs_df is not None and 'overall_satisfaction_se' in fevs_df:
+        # The monthly std above only reflects forward-filled annual values;
+        # the sampling error of each yearly estimate comes from the replicates
+        metrics = ['overall_satisfaction', 'pay_satisfaction', 'supervisor_effectiveness', 'intent_to_stay']
+        print(f"\nSurvey estimates by year (weighted mean ± replicate-weight SE)")
+        print(f"   {'Year':<6}" + ''.join(f"{m.replace('_', ' ').title():>27}" for m in metrics))
+        for _, row in fevs_df.iterrows():
+            cells = ''.join(f"{row[m]:>19.2f} ± {row[m + '_se']:.3f}" for m in metrics)
+            print(f"   {int(row['year']):<6}{cells}")
+    return eci_clean, fevs_clean
+
+
+def adjust_seasonality(merged_df, method='classical', cache_dir=seasonal_adjustment.DEFAULT_CACHE_DIR):
+    """Part 4b: remove the seasonal component from quits and compensation
+
+    Returns (adjusted copy of merged_df, components per series for export).
+    cache_dir=None decomposes every series afresh.
+    """
+    print(f"\n🗓  Seasonal adjustment ({method})")
+    print("-" * 80)
+    frame = merged_df.set_index('date')[SEASONAL_SERIES]
+    cache = seasonal_adjustment.DecompositionCache(cache_dir) if cache_dir else None
+    components = seasonal_adjustment.decompose(frame, method, cache=cache)
+    amplitude = seasonal_adjustment.seasonal_amplitude(components)
+    for column in SEASONAL_SERIES:
+        print(f"   {column:<26} seasonal amplitude {amplitude[column]:.3f}, "
+              f"residual std {components['resid'][column].std():.3f}")
+    if cache:
+        print(f"   ({cache.hits} series from cache, {cache.misses} decomposed)")
+
+    adjusted_df = merged_df.copy()
+    adjusted_df[SEASONAL_SERIES] = seasonal_adjustment.adjusted(frame, components).to_numpy()
+    decomposition_df = pd.concat(
+        {name: component for name, component in components.items()}, axis=1)
+    decomposition_df.columns = [f'{series}_{name}' for name, series in decomposition_df.columns]
+    return adjusted_df, decomposition_df.reset_index()
+
 
 # =============================================================================
 # PART 5: CORRELATION ANALYSIS
 # =============================================================================
 
-print("\n[6/7] Performing correlation analysis...")
-print("\n" + "="*80)
-print("CORRELATION ANALYSIS (Pearson's r)")
-print("="*80)
+def correlation_analysis(merged_df):
+    """Part 5: Pearson correlations along the X → M → Y logic model"""
+    print("\n[6/7] Performing correlation analysis...")
+    print("\n" + "="*80)
+    print("CORRELATION ANALYSIS (Pearson's r)")
+    print("="*80)
+
+    # Calculate correlations
+    corr_data = merged_df[['quits_rate', 'compensation_change_pct', 'pay_satisfaction', 
+                             'overall_satisfaction', 'intent_to_stay']].dropna()
 
-# Calculate correlations
-corr_data = merged_df[['quits_rate', 'compensation_change_pct', 'pay_satisfaction', 
-                         'overall_satisfaction', 'intent_to_stay']].dropna()
+    correlation_matrix = corr_data.corr()
 
-correlation_matrix = corr_data.corr()
+    print("\n🔍 Key Correlations:")
+    print("-" * 80)
 
-print("\n🔍 Key Correlations:")
-print("-" * 80)
+    # X → Y: Compensation → Retention (quits)
+    corr_xy = correlation_matrix.loc['compensation_change_pct', 'quits_rate']
+    print(f"X → Y: Compensation → Quits Rate:         r = {corr_xy:.3f}")
+    print(f"       Interpretation: {'Negative' if corr_xy < 0 else 'Positive'} relationship")
+    print(f"       (Higher compensation {'decreases' if corr_xy < 0 else 'increases'} quits)")
 
-# X → Y: Compensation → Retention (quits)
-corr_xy = correlation_matrix.loc['compensation_change_pct', 'quits_rate']
-print(f"X → Y: Compensation → Quits Rate:         r = {corr_xy:.3f}")
-print(f"       Interpretation: {'Negative' if corr_xy < 0 else 'Positive'} relationship")
-print(f"       (Higher compensation {'decreases' if corr_xy < 0 else 'increases'} quits)")
+    # X → M: Compensation → Satisfaction
+    corr_xm = correlation_matrix.loc['compensation_change_pct', 'pay_satisfaction']
+    print(f"\nX → M: Compensation → Pay Satisfaction:   r = {corr_xm:.3f}")
+    print(f"       Interpretation: {'Negative' if corr_xm < 0 else 'Positive'} relationship")
 
-# X → M: Compensation → Satisfaction
-corr_xm = correlation_matrix.loc['compensation_change_pct', 'pay_satisfaction']
-print(f"\nX → M: Compensation → Pay Satisfaction:   r = {corr_xm:.3f}")
-print(f"       Interpretation: {'Negative' if corr_xm < 0 else 'Positive'} relationship")
+    # M → Y: Satisfaction → Retention
+    corr_my = correlation_matrix.loc['overall_satisfaction', 'quits_rate']
+    print(f"\nM → Y: Satisfaction → Quits Rate:         r = {corr_my:.3f}")
+    print(f"       Interpretation: {'Negative' if corr_my < 0 else 'Positive'} relationship")
+    print(f"       (Higher satisfaction {'decreases' if corr_my < 0 else 'increases'} quits)")
 
-# M → Y: Satisfaction → Retention
-corr_my = correlation_matrix.loc['overall_satisfaction', 'quits_rate']
-print(f"\nM → Y: Satisfaction → Quits Rate:         r = {corr_my:.3f}")
-print(f"       Interpretation: {'Negative' if corr_my < 0 else 'Positive'} relationship")
-print(f"       (Higher satisfaction {'decreases' if corr_my < 0 else 'increases'} quits)")
+    # Intent to stay → Quits (validation check)
+    corr_intent = correlation_matrix.loc['intent_to_stay', 'quits_rate']
+    print(f"\nIntent to Stay → Quits Rate:              r = {corr_intent:.3f}")
+    print(f"       (Should be negative: people wanting to stay = lower quits)")
 
-# Intent to stay → Quits (validation check)
-corr_intent = correlation_matrix.loc['intent_to_stay', 'quits_rate']
-print(f"\nIntent to Stay → Quits Rate:              r = {corr_intent:.3f}")
-print(f"       (Should be negative: people wanting to stay = lower quits)")
+    # Statistical significance
+    n = len(corr_data)
+    print(f"\n📈 Sample size for correlations: n = {n}")
+    print(f"   Critical r for p<0.05 (two-tailed): ±{1.96/np.sqrt(n-3):.3f}")
+    print(f"   All correlations with |r| > this value are statistically significant")
+
+    corrs = {'xy': corr_xy, 'xm': corr_xm, 'my': corr_my, 'intent': corr_intent}
+    return corr_data, correlation_matrix, corrs
 
-# Statistical significance
-n = len(corr_data)
-print(f"\n📈 Sample size for correlations: n = {n}")
-print(f"   Critical r for p<0.05 (two-tailed): ±{1.96/np.sqrt(n-3):.3f}")
-print(f"   All correlations with |r| > this value are statistically significant")
 
 # =============================================================================
 # PART 6: TIME SERIES TRENDS
 # =============================================================================
 
-print("\n📊 Time Series Trends:")
-print("-" * 80)
-
-# Calculate trends by year
-yearly_stats = merged_df.groupby(merged_df['date'].dt.year).agg({
-    'quits_rate': 'mean',
-    'compensation_change_pct': 'mean',
-    'overall_satisfaction': 'mean'
-}).dropna()
-
-print("\nYear-by-Year Averages:")
-print(yearly_stats.to_string())
-
-# Trend analysis (linear regression)
-from scipy.stats import linregress
+def time_series_trends(merged_df):
+    """Part 6: yearly averages and linear trends"""
+    print("\n📊 Time Series Trends:")
+    print("-" * 80)
+
+    # Calculate trends by year
+    yearly_stats = merged_df.groupby(merged_df['date'].dt.year).agg({
+        'quits_rate': 'mean',
+        'compensation_change_pct': 'mean',
+        'overall_satisfaction': 'mean'
+    }).dropna()
+
+    print("\nYear-by-Year Averages:")
+    print(yearly_stats.to_string())
+
+
+    # Quits rate trend
+    years_numeric = yearly_stats.index.values
+    quits_trend = linregress(years_numeric, yearly_stats['quits_rate'].values)
+    print(f"\n📉 Quits Rate Trend:")
+    print(f"   Slope: {quits_trend.slope:.3f}% per year")
+    print(f"   Direction: {'Increasing' if quits_trend.slope > 0 else 'Decreasing'} quits (retention {'worsening' if quits_trend.slope > 0 else 'improving'})")
+    print(f"   p-value: {quits_trend.pvalue:.4f} {'(significant)' if quits_trend.pvalue < 0.05 else '(not significant)'}")
+
+    # Compensation trend
+    comp_clean = yearly_stats['compensation_change_pct'].dropna()
+    comp_years = comp_clean.index.values
+    comp_trend = linregress(comp_years, comp_clean.values)
+    print(f"\n📈 Compensation Growth Trend:")
+    print(f"   Slope: {comp_trend.slope:.3f} percentage points per year")
+    print(f"   Direction: {'Accelerating' if comp_trend.slope > 0 else 'Decelerating'} compensation growth")
+    print(f"   p-value: {comp_trend.pvalue:.4f} {'(significant)' if comp_trend.pvalue < 0.05 else '(not significant)'}")
+    return yearly_stats, quits_trend, comp_trend
+
+
+def detect_regimes(merged_df):
+    """Part 6b: regime breaks in quits and compensation (PELT), one series per worker"""
+    print("\n🔀 Regime Breaks (PELT change points):")
+    print("-" * 80)
+    frame = merged_df.set_index('date')[CHANGEPOINT_SERIES]
+    breaks = changepoints.detect(frame)
+    for column in CHANGEPOINT_SERIES:
+        print(f"\n{column}: {len(breaks[column])} break(s)")
+        for start, end, mean in changepoints.segments(frame[column], breaks[column]):
+            print(f"   {start.strftime('%Y-%m')} → {end.strftime('%Y-%m')}   mean {mean:.2f}")
+    return breaks
+
+
+def forecast_outcomes(merged_df, eci_df, horizon=FORECAST_HORIZON, cache_dir=forecasting.DEFAULT_CACHE_DIR):
+    """Part 6c: holdout-selected forecasts of quits (monthly) and compensation (quarterly)
+
+    cache_dir=None refits every series.
+    """
+    print(f"\n🔮 Forecasts ({horizon} months ahead, {forecasting.LEVEL:.0%} intervals):")
+    print("-" * 80)
+    series = {'quits_rate': merged_df.set_index('date')['quits_rate'],
+              'compensation_change_pct': eci_df.set_index('date')['compensation_change_pct']}
+    cache = forecasting.ForecastCache(cache_dir) if cache_dir else None
+    fits, forecast_df = forecasting.forecast(series, horizon, cache=cache)
+    for name, result in fits.items():
+        final = forecast_df[forecast_df['series'] == name].iloc[-1]
+        print(f"\n{name}: {result['model']} "
+              f"(holdout RMSE {result['scores'][result['model']]:.3f} over {result['holdout']} steps)")
+        print(f"   {final['date'].strftime('%Y-%m')}: {final['forecast']:.2f} "
+              f"[{final['lower']:.2f}, {final['upper']:.2f}]")
+    if cache:
+        print(f"\n   ({cache.hits} series from cache, {cache.misses} fitted)")
+    return forecast_df
+
+
+def panel_fixed_effects(panel_df):
+    """Part 6d: quits on compensation and satisfaction with segment and month fixed effects"""
+    print("\n🏭 Fixed-Effects Panel Regression (segment + month effects, clustered by segment):")
+    print("-" * 80)
+    table, summary = panel_regression.fit(panel_df, 'quits_rate', PANEL_REGRESSORS)
+    print(f"   {summary['observations']:,} segment-months, {summary['segments']} segments, "
+          f"{summary['periods']} months")
+    for variable, row in table.iterrows():
+        print(f"   {variable:<26} β = {row['coef']:+.3f} (SE {row['std_err']:.3f}, "
+              f"p = {row['p_value']:.4f}) {'(significant)' if row['p_value'] < 0.05 else '(not significant)'}")
+    print(f"   Within R² = {summary['r2_within']:.3f}")
+    if not summary['converged']:
+        print(f"   ⚠️  Fixed effects not fully absorbed after {summary['sweeps']} sweeps")
+    return table.reset_index()
 
-# Quits rate trend
-years_numeric = yearly_stats.index.values
-quits_trend = linregress(years_numeric, yearly_stats['quits_rate'].values)
-print(f"\n📉 Quits Rate Trend:")
-print(f"   Slope: {quits_trend.slope:.3f}% per year")
-print(f"   Direction: {'Increasing' if quits_trend.slope > 0 else 'Decreasing'} quits (retention {'worsening' if quits_trend.slope > 0 else 'improving'})")
-print(f"   p-value: {quits_trend.pvalue:.4f} {'(significant)' if quits_trend.pvalue < 0.05 else '(not significant)'}")
-
-# Compensation trend
-comp_clean = yearly_stats['compensation_change_pct'].dropna()
-comp_years = comp_clean.index.values
-comp_trend = linregress(comp_years, comp_clean.values)
-print(f"\n📈 Compensation Growth Trend:")
-print(f"   Slope: {comp_trend.slope:.3f} percentage points per year")
-print(f"   Direction: {'Accelerating' if comp_trend.slope > 0 else 'Decelerating'} compensation growth")
-print(f"   p-value: {comp_trend.pvalue:.4f} {'(significant)' if comp_trend.pvalue < 0.05 else '(not significant)'}")
 
 # =============================================================================
 # PART 7: CREATE VISUALIZATIONS
 # =============================================================================
 
-print("\n[7/7] Creating visualizations...")
+def mark_breaks(ax, dates):
+    """Dotted vertical line at each detected regime break"""
+    for i, date in enumerate(dates):
+        ax.axvline(x=date, color='#7f8c8d', linestyle=':', linewidth=1.5, alpha=0.9,
+                   label='Detected regime break' if i == 0 else None)
+
+
+def plot_time_series(merged_df, eci_monthly, fevs_df, breaks=None):
+    """Figure 1: Time Series - All Variables (with PELT regime breaks when given)"""
+    breaks = breaks or {}
+    fig, axes = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
+
+    # Plot 1: Quits Rate (Y variable)
+    axes[0].plot(merged_df['date'], merged_df['quits_rate'], color='#e74c3c', linewidth=2)
+    axes[0].set_ylabel('Quits Rate (%)', fontsize=12, fontweight='bold')
+    axes[0].set_title('Y Variable: Employee Retention (Quits Rate - Lower is Better)', 
+                       fontsize=14, fontweight='bold', pad=15)
+    axes[0].grid(True, alpha=0.3)
+    axes[0].axhline(y=merged_df['quits_rate'].mean(), color='gray', linestyle='--', 
+                    label=f'Mean: {merged_df["quits_rate"].mean():.2f}%', alpha=0.7)
+    mark_breaks(axes[0], breaks.get('quits_rate', []))
+    axes[0].legend()
+
+    # Plot 2: Compensation Change (X variable)
+    axes[1].plot(eci_monthly['date'], eci_monthly['compensation_change_pct'], 
+                 color='#27ae60', linewidth=2, marker='o', markersize=4)
+    axes[1].set_ylabel('12-Month % Change', fontsize=12, fontweight='bold')
+    axes[1].set_title('X Variable: Total Compensation Growth', 
+                       fontsize=14, fontweight='bold', pad=15)
+    axes[1].grid(True, alpha=0.3)
+    axes[1].axhline(y=eci_monthly['compensation_change_pct'].mean(), color='gray', linestyle='--',
+                    label=f'Mean: {eci_monthly["compensation_change_pct"].mean():.2f}%', alpha=0.7)
+    mark_breaks(axes[1], breaks.get('compensation_change_pct', []))
+    axes[1].legend()
+
+    # Plot 3: Satisfaction (M variable)
+    fevs_plot = fevs_df.copy()
+    axes[2].plot(fevs_plot['date'], fevs_plot['overall_satisfaction'], 
+                 color='#3498db', linewidth=2, marker='s', markersize=6, label='Overall Satisfaction')
+    axes[2].plot(fevs_plot['date'], fevs_plot['pay_satisfaction'], 
+                 color='#9b59b6', linewidth=2, marker='^', markersize=6, label='Pay Satisfaction')
+    axes[2].plot(fevs_plot['date'], fevs_plot['intent_to_stay'], 
+                 color='#f39c12', linewidth=2, marker='D', markersize=6, label='Intent to Stay')
+    axes[2].set_ylabel('Score (1-5 scale)', fontsize=12, fontweight='bold')
+    axes[2].set_xlabel('Date', fontsize=12, fontweight='bold')
+    axes[2].set_title('M Variable: Employee Satisfaction Metrics (FEVS)', 
+                       fontsize=14, fontweight='bold', pad=15)
+    axes[2].grid(True, alpha=0.3)
+    axes[2].legend(loc='lower right')
+
+    plt.tight_layout()
+    plt.savefig(f'{OUTPUT_DIR}/time_series_all_variables.png', dpi=300, bbox_inches='tight')
+    print(f"✓ Saved: {OUTPUT_DIR}/time_series_all_variables.png")
+    plt.close()
+
+
+def plot_correlation_heatmap(correlation_matrix):
+    """Figure 2: Correlation Matrix Heatmap"""
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(correlation_matrix, annot=True, fmt='.3f', cmap='RdYlGn', center=0,
+                square=True, linewidths=1, cbar_kws={"shrink": 0.8})
+    plt.title('Correlation Matrix: X, M, Y Variables', fontsize=16, fontweight='bold', pad=20)
+    plt.tight_layout()
+    plt.savefig(f'{OUTPUT_DIR}/correlation_heatmap.png', dpi=300, bbox_inches='tight')
+    print(f"✓ Saved: {OUTPUT_DIR}/correlation_heatmap.png")
+    plt.close()
+
+
+def plot_scatter_plots(corr_data, corrs):
+    """Figure 3: Scatter Plots (X→M→Y)"""
+    corr_xy, corr_xm, corr_my = corrs['xy'], corrs['xm'], corrs['my']
+
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+
+    # X → M: Compensation → Satisfaction
+    scatter_xm = corr_data[['compensation_change_pct', 'pay_satisfaction']].dropna()
+    axes[0].scatter(scatter_xm['compensation_change_pct'], scatter_xm['pay_satisfaction'], 
+                    alpha=0.6, s=50, color='#9b59b6')
+    axes[0].set_xlabel('Compensation Growth (%)', fontsize=11, fontweight='bold')
+    axes[0].set_ylabel('Pay Satisfaction (1-5)', fontsize=11, fontweight='bold')
+    axes[0].set_title(f'X → M\nr = {corr_xm:.3f}', fontsize=13, fontweight='bold')
+    axes[0].grid(True, alpha=0.3)
+    # Add trend line
+    z = np.polyfit(scatter_xm['compensation_change_pct'], scatter_xm['pay_satisfaction'], 1)
+    p = np.poly1d(z)
+    axes[0].plot(scatter_xm['compensation_change_pct'], 
+                 p(scatter_xm['compensation_change_pct']), "r--", alpha=0.8, linewidth=2)
+
+    # M → Y: Satisfaction → Quits
+    scatter_my = corr_data[['overall_satisfaction', 'quits_rate']].dropna()
+    axes[1].scatter(scatter_my['overall_satisfaction'], scatter_my['quits_rate'], 
+                    alpha=0.6, s=50, color='#3498db')
+    axes[1].set_xlabel('Overall Satisfaction (1-5)', fontsize=11, fontweight='bold')
+    axes[1].set_ylabel('Quits Rate (%)', fontsize=11, fontweight='bold')
+    axes[1].set_title(f'M → Y\nr = {corr_my:.3f}', fontsize=13, fontweight='bold')
+    axes[1].grid(True, alpha=0.3)
+    z = np.polyfit(scatter_my['overall_satisfaction'], scatter_my['quits_rate'], 1)
+    p = np.poly1d(z)
+    axes[1].plot(scatter_my['overall_satisfaction'], 
+                 p(scatter_my['overall_satisfaction']), "r--", alpha=0.8, linewidth=2)
+
+    # X → Y: Compensation → Quits (direct effect)
+    scatter_xy = corr_data[['compensation_change_pct', 'quits_rate']].dropna()
+    axes[2].scatter(scatter_xy['compensation_change_pct'], scatter_xy['quits_rate'], 
+                    alpha=0.6, s=50, color='#e74c3c')
+    axes[2].set_xlabel('Compensation Growth (%)', fontsize=11, fontweight='bold')
+    axes[2].set_ylabel('Quits Rate (%)', fontsize=11, fontweight='bold')
+    axes[2].set_title(f'X → Y (Direct)\nr = {corr_xy:.3f}', fontsize=13, fontweight='bold')
+    axes[2].grid(True, alpha=0.3)
+    z = np.polyfit(scatter_xy['compensation_change_pct'], scatter_xy['quits_rate'], 1)
+    p = np.poly1d(z)
+    axes[2].plot(scatter_xy['compensation_change_pct'], 
+                 p(scatter_xy['compensation_change_pct']), "r--", alpha=0.8, linewidth=2)
+
+    plt.suptitle('Logic Model Relationships: X → M → Y', fontsize=16, fontweight='bold', y=1.02)
+    plt.tight_layout()
+    plt.savefig(f'{OUTPUT_DIR}/scatter_plots_logic_model.png', dpi=300, bbox_inches='tight')
+    print(f"✓ Saved: {OUTPUT_DIR}/scatter_plots_logic_model.png")
+    plt.close()
+
+
+def plot_forecasts(merged_df, eci_df, forecast_df):
+    """Figure 4: Quits and compensation with forecasts and prediction intervals"""
+    fig, axes = plt.subplots(2, 1, figsize=(14, 8), sharex=True)
+    panels = [
+        ('quits_rate', merged_df, 'Quits Rate (%)', '#e74c3c', 'Y Variable: Quits Rate Forecast'),
+        ('compensation_change_pct', eci_df, '12-Month % Change', '#27ae60',
+         'X Variable: Compensation Growth Forecast'),
+    ]
+    for ax, (column, history, ylabel, color, title) in zip(axes, panels):
+        future = forecast_df[forecast_df['series'] == column]
+        ax.plot(history['date'], history[column], color=color, linewidth=2, label='Observed')
+        ax.plot(future['date'], future['forecast'], color=color, linewidth=2, linestyle='--',
+                label=f"Forecast ({future['model'].iloc[0]})")
+        ax.fill_between(future['date'], future['lower'], future['upper'], color=color, alpha=0.2,
+                        label=f'{forecasting.LEVEL:.0%} interval')
+        ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='upper left')
+    axes[1].set_xlabel('Date', fontsize=12, fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig(f'{OUTPUT_DIR}/forecast_quits_compensation.png', dpi=300, bbox_inches='tight')
+    print(f"✓ Saved: {OUTPUT_DIR}/forecast_quits_compensation.png")
+    plt.close()
 
-# Create output directory
-import os
-os.makedirs('analysis_output', exist_ok=True)
-
-# Figure 1: Time Series - All Variables
-fig, axes = plt.subplots(3, 1, figsize=(14, 10), sharex=True)
-
-# Plot 1: Quits Rate (Y variable)
-axes[0].plot(merged_df['date'], merged_df['quits_rate'], color='#e74c3c', linewidth=2)
-axes[0].set_ylabel('Quits Rate (%)', fontsize=12, fontweight='bold')
-axes[0].set_title('Y Variable: Employee Retention (Quits Rate - Lower is Better)', 
-                   fontsize=14, fontweight='bold', pad=15)
-axes[0].grid(True, alpha=0.3)
-axes[0].axhline(y=merged_df['quits_rate'].mean(), color='gray', linestyle='--', 
-                label=f'Mean: {merged_df["quits_rate"].mean():.2f}%', alpha=0.7)
-axes[0].legend()
-
-# Plot 2: Compensation Change (X variable)
-axes[1].plot(eci_monthly['date'], eci_monthly['compensation_change_pct'], 
-             color='#27ae60', linewidth=2, marker='o', markersize=4)
-axes[1].set_ylabel('12-Month % Change', fontsize=12, fontweight='bold')
-axes[1].set_title('X Variable: Total Compensation Growth', 
-                   fontsize=14, fontweight='bold', pad=15)
-axes[1].grid(True, alpha=0.3)
-axes[1].axhline(y=eci_monthly['compensation_change_pct'].mean(), color='gray', linestyle='--',
-                label=f'Mean: {eci_monthly["compensation_change_pct"].mean():.2f}%', alpha=0.7)
-axes[1].legend()
-
-# Plot 3: Satisfaction (M variable)
-fevs_plot = fevs_df.copy()
-axes[2].plot(fevs_plot['date'], fevs_plot['overall_satisfaction'], 
-             color='#3498db', linewidth=2, marker='s', markersize=6, label='Overall Satisfaction')
-axes[2].plot(fevs_plot['date'], fevs_plot['pay_satisfaction'], 
-             color='#9b59b6', linewidth=2, marker='^', markersize=6, label='Pay Satisfaction')
-axes[2].plot(fevs_plot['date'], fevs_plot['intent_to_stay'], 
-             color='#f39c12', linewidth=2, marker='D', markersize=6, label='Intent to Stay')
-axes[2].set_ylabel('Score (1-5 scale)', fontsize=12, fontweight='bold')
-axes[2].set_xlabel('Date', fontsize=12, fontweight='bold')
-axes[2].set_title('M Variable: Employee Satisfaction Metrics (FEVS)', 
-                   fontsize=14, fontweight='bold', pad=15)
-axes[2].grid(True, alpha=0.3)
-axes[2].legend(loc='lower right')
-
-plt.tight_layout()
-plt.savefig('analysis_output/time_series_all_variables.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: analysis_output/time_series_all_variables.png")
-
-# Figure 2: Correlation Matrix Heatmap
-plt.figure(figsize=(10, 8))
-sns.heatmap(correlation_matrix, annot=True, fmt='.3f', cmap='RdYlGn', center=0,
-            square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-plt.title('Correlation Matrix: X, M, Y Variables', fontsize=16, fontweight='bold', pad=20)
-plt.tight_layout()
-plt.savefig('analysis_output/correlation_heatmap.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: analysis_output/correlation_heatmap.png")
-
-# Figure 3: Scatter Plots (X→M→Y)
-fig, axes = plt.subplots(1, 3, figsize=(16, 5))
-
-# X → M: Compensation → Satisfaction
-scatter_xm = corr_data[['compensation_change_pct', 'pay_satisfaction']].dropna()
-axes[0].scatter(scatter_xm['compensation_change_pct'], scatter_xm['pay_satisfaction'], 
-                alpha=0.6, s=50, color='#9b59b6')
-axes[0].set_xlabel('Compensation Growth (%)', fontsize=11, fontweight='bold')
-axes[0].set_ylabel('Pay Satisfaction (1-5)', fontsize=11, fontweight='bold')
-axes[0].set_title(f'X → M\nr = {corr_xm:.3f}', fontsize=13, fontweight='bold')
-axes[0].grid(True, alpha=0.3)
-# Add trend line
-z = np.polyfit(scatter_xm['compensation_change_pct'], scatter_xm['pay_satisfaction'], 1)
-p = np.poly1d(z)
-axes[0].plot(scatter_xm['compensation_change_pct'], 
-             p(scatter_xm['compensation_change_pct']), "r--", alpha=0.8, linewidth=2)
-
-# M → Y: Satisfaction → Quits
-scatter_my = corr_data[['overall_satisfaction', 'quits_rate']].dropna()
-axes[1].scatter(scatter_my['overall_satisfaction'], scatter_my['quits_rate'], 
-                alpha=0.6, s=50, color='#3498db')
-axes[1].set_xlabel('Overall Satisfaction (1-5)', fontsize=11, fontweight='bold')
-axes[1].set_ylabel('Quits Rate (%)', fontsize=11, fontweight='bold')
-axes[1].set_title(f'M → Y\nr = {corr_my:.3f}', fontsize=13, fontweight='bold')
-axes[1].grid(True, alpha=0.3)
-z = np.polyfit(scatter_my['overall_satisfaction'], scatter_my['quits_rate'], 1)
-p = np.poly1d(z)
-axes[1].plot(scatter_my['overall_satisfaction'], 
-             p(scatter_my['overall_satisfaction']), "r--", alpha=0.8, linewidth=2)
-
-# X → Y: Compensation → Quits (direct effect)
-scatter_xy = corr_data[['compensation_change_pct', 'quits_rate']].dropna()
-axes[2].scatter(scatter_xy['compensation_change_pct'], scatter_xy['quits_rate'], 
-                alpha=0.6, s=50, color='#e74c3c')
-axes[2].set_xlabel('Compensation Growth (%)', fontsize=11, fontweight='bold')
-axes[2].set_ylabel('Quits Rate (%)', fontsize=11, fontweight='bold')
-axes[2].set_title(f'X → Y (Direct)\nr = {corr_xy:.3f}', fontsize=13, fontweight='bold')
-axes[2].grid(True, alpha=0.3)
-z = np.polyfit(scatter_xy['compensation_change_pct'], scatter_xy['quits_rate'], 1)
-p = np.poly1d(z)
-axes[2].plot(scatter_xy['compensation_change_pct'], 
-             p(scatter_xy['compensation_change_pct']), "r--", alpha=0.8, linewidth=2)
-
-plt.suptitle('Logic Model Relationships: X → M → Y', fontsize=16, fontweight='bold', y=1.02)
-plt.tight_layout()
-plt.savefig('analysis_output/scatter_plots_logic_model.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: analysis_output/scatter_plots_logic_model.png")
 
 # =============================================================================
 # EXPORT SUMMARY TABLE
 # =============================================================================
 
-print("\nExporting summary statistics table...")
-
-summary_stats = pd.DataFrame({
-    'Variable': ['Quits Rate (Y)', 'Compensation Change (X)', 'Pay Satisfaction (M)', 
-                 'Overall Satisfaction (M)', 'Intent to Stay (M)'],
-    'Mean': [
-        merged_df['quits_rate'].mean(),
-        eci_clean['compensation_change_pct'].mean(),
-        fevs_clean['pay_satisfaction'].mean(),
-        fevs_clean['overall_satisfaction'].mean(),
-        fevs_clean['intent_to_stay'].mean()
-    ],
-    'Median': [
-        merged_df['quits_rate'].median(),
-        eci_clean['compensation_change_pct'].median(),
-        fevs_clean['pay_satisfaction'].median(),
-        fevs_clean['overall_satisfaction'].median(),
-        fevs_clean['intent_to_stay'].median()
-    ],
-    'Std Dev': [
-        merged_df['quits_rate'].std(),
-        eci_clean['compensation_change_pct'].std(),
-        fevs_clean['pay_satisfaction'].std(),
-        fevs_clean['overall_satisfaction'].std(),
-        fevs_clean['intent_to_stay'].std()
-    ],
-    'Min': [
-        merged_df['quits_rate'].min(),
-        eci_clean['compensation_change_pct'].min(),
-        fevs_clean['pay_satisfaction'].min(),
-        fevs_clean['overall_satisfaction'].min(),
-        fevs_clean['intent_to_stay'].min()
-    ],
-    'Max': [
-        merged_df['quits_rate'].max(),
-        eci_clean['compensation_change_pct'].max(),
-        fevs_clean['pay_satisfaction'].max(),
-        fevs_clean['overall_satisfaction'].max(),
-        fevs_clean['intent_to_stay'].max()
-    ],
-    'N': [
-        len(merged_df),
-        len(eci_clean),
-        len(fevs_clean),
-        len(fevs_clean),
-        len(fevs_clean)
-    ]
-})
-
-summary_stats.to_csv('analysis_output/summary_statistics.csv', index=False)
-print("✓ Saved: analysis_output/summary_statistics.csv")
-
-# Export correlation matrix
-correlation_matrix.to_csv('analysis_output/correlation_matrix.csv')
-print("✓ Saved: analysis_output/correlation_matrix.csv")
-
-# Export merged dataset
-merged_df.to_csv('analysis_output/merged_dataset.csv', index=False)
-print("✓ Saved: analysis_output/merged_dataset.csv")
-
-print("\n" + "="*80)
-print("ANALYSIS COMPLETE!")
-print("="*80)
-print(f"\n📁 Output files saved to: analysis_output/")
-print(f"   - time_series_all_variables.png")
-print(f"   - correlation_heatmap.png")
-print(f"   - scatter_plots_logic_model.png")
-print(f"   - summary_statistics.csv")
-print(f"   - correlation_matrix.csv")
-print(f"   - merged_dataset.csv")
-print(f"\n🎯 Key Finding:")
-print(f"   Compensation → Quits correlation: r = {corr_xy:.3f}")
-print(f"   {'Strong' if abs(corr_xy) > 0.5 else 'Moderate' if abs(corr_xy) > 0.3 else 'Weak'} {'negative' if corr_xy < 0 else 'positive'} relationship")
-print(f"   Interpretation: {'Higher compensation is associated with lower turnover' if corr_xy < 0 else 'Higher compensation is associated with higher turnover (unexpected!)'}")
-print("\n" + "="*80)
+def export_results(merged_df, eci_clean, fevs_clean, correlation_matrix, decomposition_df=None,
+                   forecast_df=None, panel_df=None):
+    """Write the summary table, correlation matrix and merged dataset as CSV"""
+    print("\nExporting summary statistics table...")
+
+    summary_stats = pd.DataFrame({
+        'Variable': ['Quits Rate (Y)', 'Compensation Change (X)', 'Pay Satisfaction (M)', 
+                     'Overall Satisfaction (M)', 'Intent to Stay (M)'],
+        'Mean': [
+            merged_df['quits_rate'].mean(),
+            eci_clean['compensation_change_pct'].mean(),
+            fevs_clean['pay_satisfaction'].mean(),
+            fevs_clean['overall_satisfaction'].mean(),
+            fevs_clean['intent_to_stay'].mean()
+        ],
+        'Median': [
+            merged_df['quits_rate'].median(),
+            eci_clean['compensation_change_pct'].median(),
+            fevs_clean['pay_satisfaction'].median(),
+            fevs_clean['overall_satisfaction'].median(),
+            fevs_clean['intent_to_stay'].median()
+        ],
+        'Std Dev': [
+            merged_df['quits_rate'].std(),
+            eci_clean['compensation_change_pct'].std(),
+            fevs_clean['pay_satisfaction'].std(),
+            fevs_clean['overall_satisfaction'].std(),
+            fevs_clean['intent_to_stay'].std()
+        ],
+        'Min': [
+            merged_df['quits_rate'].min(),
+            eci_clean['compensation_change_pct'].min(),
+            fevs_clean['pay_satisfaction'].min(),
+            fevs_clean['overall_satisfaction'].min(),
+            fevs_clean['intent_to_stay'].min()
+        ],
+        'Max': [
+            merged_df['quits_rate'].max(),
+            eci_clean['compensation_change_pct'].max(),
+            fevs_clean['pay_satisfaction'].max(),
+            fevs_clean['overall_satisfaction'].max(),
+            fevs_clean['intent_to_stay'].max()
+        ],
+        'N': [
+            len(merged_df),
+            len(eci_clean),
+            len(fevs_clean),
+            len(fevs_clean),
+            len(fevs_clean)
+        ]
+    })
+
+    summary_stats.to_csv(f'{OUTPUT_DIR}/summary_statistics.csv', index=False)
+    print(f"✓ Saved: {OUTPUT_DIR}/summary_statistics.csv")
+
+    # Export correlation matrix
+    correlation_matrix.to_csv(f'{OUTPUT_DIR}/correlation_matrix.csv')
+    print(f"✓ Saved: {OUTPUT_DIR}/correlation_matrix.csv")
+
+    # Export merged dataset
+    merged_df.to_csv(f'{OUTPUT_DIR}/merged_dataset.csv', index=False)
+    print(f"✓ Saved: {OUTPUT_DIR}/merged_dataset.csv")
+
+    if decomposition_df is not None:
+        decomposition_df.to_csv(f'{OUTPUT_DIR}/seasonal_decomposition.csv', index=False)
+        print(f"✓ Saved: {OUTPUT_DIR}/seasonal_decomposition.csv")
+
+    if forecast_df is not None:
+        forecast_df.to_csv(f'{OUTPUT_DIR}/forecasts.csv', index=False)
+        print(f"✓ Saved: {OUTPUT_DIR}/forecasts.csv")
+
+    if panel_df is not None:
+        panel_df.to_csv(f'{OUTPUT_DIR}/panel_regression.csv', index=False)
+        print(f"✓ Saved: {OUTPUT_DIR}/panel_regression.csv")
+
+
+def main():
+    global COMPACT, TRACE_MEMORY, SEASONAL_ADJUST, CHANGEPOINTS, FORECAST, FORECAST_HORIZON
+    global PANEL_FILE
+    COMPACT = COMPACT or '--compact' in sys.argv
+    TRACE_MEMORY = TRACE_MEMORY or '--memory' in sys.argv
+    alignment = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--align=')),
+                     os.environ.get('EBM_ALIGN'))
+    if alignment:
+        ALIGNMENT.update(parse_alignment(alignment))
+    for arg in sys.argv:
+        if arg == '--seasonal-adjust' or arg.startswith('--seasonal-adjust='):
+            SEASONAL_ADJUST = arg.partition('=')[2] or 'classical'
+    if SEASONAL_ADJUST == '1':
+        SEASONAL_ADJUST = 'classical'
+    CHANGEPOINTS = CHANGEPOINTS and '--no-changepoints' not in sys.argv
+    FORECAST = FORECAST and '--no-forecast' not in sys.argv
+    PANEL_FILE = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--panel=')),
+                      PANEL_FILE)
+    for arg in sys.argv:
+        if arg.startswith('--forecast-horizon='):
+            FORECAST_HORIZON = int(arg.partition('=')[2])
+
+    print("="*80)
+    print("EBM DASHBOARD - COMPENSATION & RETENTION ANALYSIS")
+    print("Conrad Dillman - MGT357 Fall 2025")
+    print("="*80)
+
+    tracer = StageTracer('data_analysis', memory=TRACE_MEMORY)
+
+    with tracer.stage('fetch JOLTS') as span:
+        jolts_df = load_jolts()
+        span['rows'] = len(jolts_df)
+    with tracer.stage('fetch ECI') as span:
+        eci_df = load_eci()
+        span['rows'] = len(eci_df)
+    with tracer.stage('load FEVS') as span:
+        fevs_df = load_fevs()
+        span['rows'] = len(fevs_df)
+    with tracer.stage('merge') as span:
+        merged_df, eci_monthly = merge_datasets(jolts_df, eci_df, fevs_df)
+        span['rows'] = len(merged_df)
+        span['frame_kb'] = round(merged_df.memory_usage(deep=True).sum() / 1024, 1)
+    with tracer.stage('summary statistics') as span:
+        eci_clean, fevs_clean = summary_statistics(merged_df, fevs_df)
+        span['rows'] = len(merged_df)
+    analysis_df, decomposition_df = merged_df, None
+    if SEASONAL_ADJUST:
+        with tracer.stage('seasonal adjustment') as span:
+            analysis_df, decomposition_df = adjust_seasonality(merged_df, SEASONAL_ADJUST)
+            span['rows'] = len(analysis_df)
+    with tracer.stage('correlation') as span:
+        corr_data, correlation_matrix, corrs = correlation_analysis(analysis_df)
+        span['rows'] = len(corr_data)
+    with tracer.stage('trends') as span:
+        yearly_stats, _, _ = time_series_trends(analysis_df)
+        span['rows'] = len(yearly_stats)
+    breaks = None
+    if CHANGEPOINTS:
+        with tracer.stage('change points') as span:
+            breaks = detect_regimes(analysis_df)
+            span['rows'] = len(analysis_df)
+    forecast_df = None
+    if FORECAST:
+        with tracer.stage('forecast') as span:
+            forecast_df = forecast_outcomes(merged_df, eci_df, FORECAST_HORIZON)
+            span['rows'] = len(forecast_df)
+    panel_table = None
+    if PANEL_FILE:
+        with tracer.stage('panel regression') as span:
+            panel_df = load_segment_panel(PANEL_FILE)
+            panel_table = panel_fixed_effects(panel_df)
+            span['rows'] = len(panel_df)
+
+    print("\n[7/7] Creating visualizations...")
+
+    # Create output directory
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    with tracer.stage('visualize'):
+        with tracer.stage('figure: time series', 'figure') as span:
+            plot_time_series(merged_df, eci_monthly, fevs_df, breaks)
+            span['rows'] = len(merged_df)
+        with tracer.stage('figure: correlation heatmap', 'figure') as span:
+            plot_correlation_heatmap(correlation_matrix)
+            span['rows'] = len(correlation_matrix)
+        with tracer.stage('figure: scatter plots', 'figure') as span:
+            plot_scatter_plots(corr_data, corrs)
+            span['rows'] = len(corr_data)
+        if forecast_df is not None:
+            with tracer.stage('figure: forecasts', 'figure') as span:
+                plot_forecasts(merged_df, eci_df, forecast_df)
+                span['rows'] = len(forecast_df)
+
+    with tracer.stage('export') as span:
+        export_results(merged_df, eci_clean, fevs_clean, correlation_matrix, decomposition_df,
+                       forecast_df, panel_table)
+        span['rows'] = len(merged_df)
+
+    tracer.print_table()
+    trace_path, summary_path = tracer.write(OUTPUT_DIR)
+    print(f"✓ Saved: {trace_path} (Chrome trace)")
+    print(f"✓ Saved: {summary_path}")
+
+    corr_xy = corrs['xy']
+    print("\n" + "="*80)
+    print("ANALYSIS COMPLETE!")
+    print("="*80)
+    print(f"\n📁 Output files saved to: {OUTPUT_DIR}/")
+    print(f"   - time_series_all_variables.png")
+    print(f"   - correlation_heatmap.png")
+    print(f"   - scatter_plots_logic_model.png")
+    if forecast_df is not None:
+        print(f"   - forecast_quits_compensation.png")
+    print(f"   - summary_statistics.csv")
+    print(f"   - correlation_matrix.csv")
+    print(f"   - merged_dataset.csv")
+    if decomposition_df is not None:
+        print(f"   - seasonal_decomposition.csv")
+    if forecast_df is not None:
+        print(f"   - forecasts.csv")
+    if panel_table is not None:
+        print(f"   - panel_regression.csv")
+    print(f"   - {TRACE_FILE}, {SUMMARY_FILE}")
+    print(f"\n🎯 Key Finding:")
+    print(f"   Compensation → Quits correlation: r = {corr_xy:.3f}")
+    print(f"   {'Strong' if abs(corr_xy) > 0.5 else 'Moderate' if abs(corr_xy) > 0.3 else 'Weak'} {'negative' if corr_xy < 0 else 'positive'} relationship")
+    print(f"   Interpretation: {'Higher compensation is associated with lower turnover' if corr_xy < 0 else 'Higher compensation is associated with higher turnover (unexpected!)'}")
+    print("\n" + "="*80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Deployment stage for EBM Dashboard
+Prepares a published dist/ directory for static hosting:
+
+    0. Charts where the vector build (--vector) found the SVG lighter than
+       the PNG (visuals/format_report.json) are referenced as SVG
+    1. Content-hashed names for immutable assets (chart images, scripts)
+       that the HTML pages reference: visuals/roi_projection.png →
+       visuals/roi_projection.<hash>.png, with every reference rewritten to
+       match. Assets no page references keep their names, since whatever
+       loads them asks for them by name.
+    2. Precompressed .gz and .br siblings for every text asset (HTML, JS,
+       JSON, TXT, SVG) where compression actually saves bytes
+    3. A cache-header manifest (_headers.json): hashed files are cached for
+       a year as immutable, everything else is revalidated on each visit
+
+dev_server.py --root dist honours the manifest, so the deployed behaviour
+(encodings, Cache-Control, 304s) can be checked locally.
+
+Usage:
+    python deploy_assets.py [--dist dist] [--no-hash] [--png-only]
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from bundle_content import brotli, compress
+from chart_output import FORMAT_REPORT
+from prerender_content import DIST_DIR
+
+MANIFEST_FILE = '_headers.json'
+HASH_LENGTH = 12
+MIN_COMPRESS_BYTES = 1024
+
+# Renamed only when an HTML page references them (and is rewritten to match)
+IMMUTABLE_PATTERNS = ['visuals/*.png', 'visuals/*.svg', '*.js']
+TEXT_SUFFIXES = {'.html', '.js', '.json', '.txt', '.svg', '.css'}
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+CACHE_IMMUTABLE = 'public, max-age=31536000, immutable'
+CACHE_REVALIDATE = 'no-cache'
+
+_HASHED = re.compile(rf'\.[0-9a-f]{{{HASH_LENGTH}}}(\.[a-z0-9]+)$')
+_QUOTED = re.compile(r'''(["'])([^"'<>\s]+)\1''')
+
+
+def hashed_name(path, data):
+    return f"{path.stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{path.suffix}"
+
+
+def is_hashed(name):
+    return bool(_HASHED.search(name))
+
+
+def _relative(path, dist):
+    return path.relative_to(dist).as_posix()
+
+
+def page_references(dist):
+    """Quoted attribute values in the HTML pages (candidate asset paths)"""
+    references = set()
+    for page in dist.glob('*.html'):
+        references.update(m.group(2) for m in _QUOTED.finditer(page.read_text(encoding='utf-8')))
+    return references
+
+
+def vector_choices(dist):
+    """{visuals/X.png: visuals/X.svg} for charts whose SVG won the size comparison"""
+    report_path = dist / 'visuals' / FORMAT_REPORT
+    if not report_path.exists():
+        return {}
+    report = json.loads(report_path.read_text(encoding='utf-8'))
+    return {f'visuals/{stem}.png': f'visuals/{stem}.svg' for stem, result in sorted(report.items())
+            if result.get('chosen') == 'svg' and (dist / 'visuals' / f'{stem}.svg').exists()}
+
+
+def hash_assets(dist):
+    """Rename referenced immutable assets to content-hashed names; returns {old: new} relative paths"""
+    renamed = {}
+    references = page_references(dist)
+    for path in sorted(p for p in dist.rglob('*') if p.is_file()):
+        rel = _relative(path, dist)
+        if is_hashed(path.name) or not any(fnmatch.fnmatch(rel, pat) for pat in IMMUTABLE_PATTERNS):
+            continue
+        target = path.with_name(hashed_name(path, path.read_bytes())) if rel in references else path
+        # Drop versions (and their compressed siblings) from earlier builds
+        stale = re.compile(rf'{re.escape(path.stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(path.suffix)}(\.gz|\.br)?$')
+        for old in path.parent.iterdir():
+            if stale.match(old.name) and not old.name.startswith(target.name):
+                old.unlink()
+        if target == path:
+            continue
+        path.replace(target)
+        renamed[rel] = _relative(target, dist)
+    return renamed
+
+
+def rewrite_references(dist, renamed):
+    """Point src/href/data-* attributes in the HTML pages at the renamed assets"""
+    if not renamed:
+        return []
+    pattern = re.compile(r'''(["'])(%s)\1''' % '|'.join(re.escape(old) for old in renamed))
+    pages = []
+    for page in dist.glob('*.html'):
+        html = page.read_text(encoding='utf-8')
+        updated = pattern.sub(lambda m: f"{m.group(1)}{renamed[m.group(2)]}{m.group(1)}", html)
+        if updated != html:
+            page.write_text(updated, encoding='utf-8')
+            pages.append(page.name)
+    return pages
+
+
+def precompress(dist):
+    """Write .gz/.br siblings for text assets; returns (bytes before, bytes after best encoding)"""
+    before = after = 0
+    for path in sorted(p for p in dist.rglob('*') if p.is_file()):
+        if path.suffix not in TEXT_SUFFIXES or path.name == MANIFEST_FILE:
+            continue
+        data = path.read_bytes()
+        best = len(data)
+        for suffix, blob in (compress(data) if len(data) >= MIN_COMPRESS_BYTES else {}).items():
+            sibling = path.with_name(path.name + suffix)
+            if len(blob) < len(data):
+                sibling.write_bytes(blob)
+                best = min(best, len(blob))
+            elif sibling.exists():
+                sibling.unlink()
+        before += len(data)
+        after += best
+    return before, after
+
+
+def build_manifest(dist):
+    """{path: {cache_control, encodings}} for every servable file, plus the hashed-name map"""
+    files, assets = {}, {}
+    for path in sorted(p for p in dist.rglob('*') if p.is_file()):
+        if path.suffix in ('.gz', '.br') or path.name == MANIFEST_FILE:
+            continue
+        rel = _relative(path, dist)
+        hashed = is_hashed(path.name)
+        files[rel] = {
+            'cache_control': CACHE_IMMUTABLE if hashed else CACHE_REVALIDATE,
+            'encodings': [name for name, suffix in ENCODINGS
+                          if path.with_name(path.name + suffix).exists()],
+        }
+        if hashed:
+            assets[_HASHED.sub(r'\1', rel)] = rel
+    return {'version': 1, 'files': files, 'assets': assets}
+
+
+def load_manifest(dist):
+    """The manifest written by a previous run, or None"""
+    path = Path(dist) / MANIFEST_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Hash, precompress and write cache headers for dist/')
+    parser.add_argument('--dist', default=str(DIST_DIR), help='published directory (default: dist)')
+    parser.add_argument('--no-hash', action='store_true', help='keep original asset names')
+    parser.add_argument('--png-only', action='store_true', help='ignore the format report, serve PNGs')
+    args = parser.parse_args(argv)
+
+    dist = Path(args.dist)
+    if not (dist / 'index.html').exists():
+        print(f"✗ {dist / 'index.html'} not found - publish the page first")
+        return 1
+
+    print("\n▶ Preparing dist/ for deployment...")
+    if not args.png_only:
+        vectors = vector_choices(dist)
+        if vectors:
+            pages = rewrite_references(dist, vectors)
+            print(f"✓ Serving {len(vectors)} chart(s) as SVG, updated {', '.join(pages) or 'no pages'}")
+    if not args.no_hash:
+        renamed = hash_assets(dist)
+        pages = rewrite_references(dist, renamed)
+        print(f"✓ Hashed {len(renamed)} immutable asset(s), updated {', '.join(pages) or 'no pages'}")
+
+    before, after = precompress(dist)
+    if brotli is None:
+        print("  (brotli not installed - skipping .br)")
+    saved = 100 * (1 - after / before) if before else 0
+    print(f"✓ Precompressed text assets: {before / 1024:.1f} KB → {after / 1024:.1f} KB ({saved:.0f}% smaller)")
+
+    manifest = build_manifest(dist)
+    (dist / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    immutable = sum(entry['cache_control'] == CACHE_IMMUTABLE for entry in manifest['files'].values())
+    print(f"✓ Saved: {dist / MANIFEST_FILE} ({len(manifest['files'])} files, {immutable} immutable)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
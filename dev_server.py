@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Local dev server for EBM Dashboard
+Serves the dashboard and pushes change notifications over server-sent
+events (/__events). content-loader.js re-fetches only the content file
+that changed and cache-busts only the chart image that changed; edits to
+the page itself trigger a full reload. Nothing polls while idle.
+
+index.html is served with data-live-reload on the content-loader.js tag,
+so the published page never opens an event stream. Run watch_dashboard.py
+alongside to regenerate charts from spec/script edits - the new PNGs are
+pushed like any other change.
+
+When the root holds a deploy_assets.py manifest (--root dist), files are
+served the way a production host should: the precompressed .br/.gz
+sibling the browser accepts, the manifest's Cache-Control, and 304 for
+an unchanged ETag.
+
+Usage:
+    python dev_server.py [--port 8000] [--root .]
+"""
+
+import argparse
+import email.utils
+import json
+import os
+import queue
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from deploy_assets import ENCODINGS, load_manifest
+from file_events import DEBOUNCE_S, collect, watch_events
+
+ROOT = Path(__file__).resolve().parent
+EVENTS_PATH = '/__events'
+KEEPALIVE_S = 15
+LOADER_TAG = '<script src="content-loader.js"'
+
+# Relative paths whose changes are pushed to the page
+WATCHED = ['content/*.txt', 'visuals/*.png', 'visuals/*.svg',
+           'index.html', 'content-loader.js', 'search-client.js']
+
+
+class Broadcaster:
+    """Fan-out of change batches to every connected event stream"""
+
+    def __init__(self):
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        client = queue.Queue()
+        with self._lock:
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client):
+        with self._lock:
+            self._clients.discard(client)
+
+    def publish(self, files):
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.put(files)
+        return len(clients)
+
+
+class DevHandler(SimpleHTTPRequestHandler):
+    broadcaster = None
+    manifest = None  # deploy_assets.py manifest files, when serving dist/
+
+    def end_headers(self):
+        # Without a manifest always revalidate so a reload never shows stale files
+        self.send_header('Cache-Control', getattr(self, 'cache_control', 'no-cache'))
+        super().end_headers()
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == EVENTS_PATH:
+            return self.stream_events()
+        if path in ('/', '/index.html') and self.manifest is None:
+            return self.send_index()
+        return super().do_GET()
+
+    def send_head(self):
+        path = self.path.split('?', 1)[0].split('#', 1)[0]
+        rel = 'index.html' if path == '/' else path.lstrip('/')
+        entry = (self.manifest or {}).get(rel)
+        if entry is None:
+            return super().send_head()
+
+        file_path = Path(self.directory) / rel
+        accepted = {e.split(';')[0].strip() for e in self.headers.get('Accept-Encoding', '').split(',')}
+        encoding = next((name for name in entry['encodings'] if name in accepted), None)
+        if encoding:
+            file_path = file_path.with_name(file_path.name + dict(ENCODINGS)[encoding])
+        try:
+            f = open(file_path, 'rb')
+        except OSError:
+            self.send_error(404, 'File not found')
+            return None
+        st = os.fstat(f.fileno())
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        self.cache_control = entry['cache_control']
+
+        if self.headers.get('If-None-Match') == etag:
+            f.close()
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return None
+
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(rel))
+        self.send_header('Content-Length', str(st.st_size))
+        self.send_header('Last-Modified', email.utils.formatdate(st.st_mtime, usegmt=True))
+        self.send_header('ETag', etag)
+        if entry['encodings']:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        return f
+
+    def send_index(self):
+        page = (Path(self.directory) / 'index.html').read_text(encoding='utf-8')
+        page = page.replace(LOADER_TAG, f'{LOADER_TAG} data-live-reload="{EVENTS_PATH}"', 1)
+        body = page.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        client = self.broadcaster.subscribe()
+        try:
+            self.wfile.write(b'retry: 1000\n\n')
+            self.wfile.flush()
+            while True:
+                try:
+                    files = client.get(timeout=KEEPALIVE_S)
+                    message = f"event: change\ndata: {json.dumps({'files': files})}\n\n"
+                except queue.Empty:
+                    message = ': keepalive\n\n'
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.broadcaster.unsubscribe(client)
+
+    def log_message(self, format, *args):
+        if self.path.split('?', 1)[0] != EVENTS_PATH:
+            super().log_message(format, *args)
+
+
+def notify_changes(root, broadcaster, debounce=DEBOUNCE_S):
+    """Watch `root` and push each debounced batch of changed files"""
+    events = queue.Queue()
+
+    def files():
+        return {path for pattern in WATCHED for path in root.glob(pattern)}
+
+    watch_events(events, root, {root, root / 'content', root / 'visuals'}, files)
+
+    def run():
+        while True:
+            changed = sorted(path for path in collect(events, debounce)
+                             if any(Path(path).match(pattern) for pattern in WATCHED))
+            if changed:
+                clients = broadcaster.publish(changed)
+                print(f"↻ {', '.join(changed)} → {clients} client(s)")
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the dashboard with live reload')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--bind', default='127.0.0.1')
+    parser.add_argument('--root', default=str(ROOT),
+                        help='directory to serve (the repo, or dist/ for the built page)')
+    args = parser.parse_args(argv)
+
+    root = Path(args.root).resolve()
+    broadcaster = Broadcaster()
+    DevHandler.broadcaster = broadcaster
+    manifest = load_manifest(root)
+    if manifest:
+        DevHandler.manifest = manifest['files']
+    notify_changes(root, broadcaster)
+
+    server = ThreadingHTTPServer((args.bind, args.port), partial(DevHandler, directory=str(root)))
+    server.daemon_threads = True
+    mode = 'deploy manifest' if manifest else 'live reload on'
+    print(f"✓ Serving {root} at http://{args.bind}:{args.port}/ ({mode})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+FEVS microdata ingestion for EBM Dashboard
+Streams respondent-level FEVS public release files (hundreds of thousands
+of rows per year) in fixed-size chunks and reduces each chunk to weighted
+sums per agency and year, so memory stays bounded by the chunk size no
+matter how large the files are. Weighted means are formed only at the end:
+
+    mean = Σ(weight × score) / Σ(weight)    over respondents who answered
+
+Governmentwide rows (agency 'ALL') are summed from the same partials, so
+they are exact rather than averages of agency means.
+
+When the files carry replicate weights (REPWT1..REPWTn) the same sums are
+kept for every replicate and each mean gets a replicate-weight standard
+error (<metric>_se, jackknife by default - see survey_estimation.py).
+
+Item numbers change between survey years - check the codebook and pass
+--item metric=COLUMN when a file differs from DEFAULT_ITEMS. The year comes
+from a YEAR column when present, otherwise from the file name.
+
+Usage:
+    python fevs_ingest.py data/fevs_fixture.csv [more files...] [--chunk-rows N]
+                          [--item pay_satisfaction=Q70] [--method jk1|brr|fay]
+                          [--out fevs_agency_year.csv]
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from survey_estimation import METHODS, ratio_estimates, replicate_columns, weighted_totals
+
+CHUNK_ROWS = 100_000
+WEIGHT_COLUMN = 'POSTWT'
+AGENCY_COLUMN = 'AGENCY'
+YEAR_COLUMN = 'YEAR'
+ALL_AGENCIES = 'ALL'
+
+# Metric → item column (1-5 Likert; 'X' = do not know, excluded)
+DEFAULT_ITEMS = {
+    'pay_satisfaction': 'Q70',          # satisfied with your pay?
+    'supervisor_effectiveness': 'Q52',  # overall job done by your supervisor?
+    'overall_satisfaction': 'Q71',      # satisfied with your organization?
+    'intent_to_stay': 'LEAVING',        # considering leaving within the year?
+}
+
+# Non-Likert items mapped onto the 1-5 scale so every metric is comparable:
+# staying ('A' = No) scores 5, any kind of leaving scores 1
+RECODES = {
+    'intent_to_stay': {'A': 5.0, 'B': 1.0, 'C': 1.0, 'D': 1.0},
+}
+
+_YEAR_IN_NAME = re.compile(r'(?<![0-9])(20[0-9]{2})(?![0-9])')
+
+
+def _score(values, metric):
+    """Chunk column → float scores, NaN where the respondent gave no usable answer"""
+    if metric in RECODES:
+        return values.str.strip().map(RECODES[metric]).astype('float64')
+    scores = pd.to_numeric(values, errors='coerce')
+    return scores.where(scores.between(1, 5))
+
+
+def _sum_columns(metric, replicates):
+    """Accumulator columns for one metric: full sample first, then each replicate"""
+    suffixes = ['', *(f'_r{r}' for r in range(1, replicates + 1))]
+    return [f'{metric}_wx{s}' for s in suffixes], [f'{metric}_w{s}' for s in suffixes]
+
+
+def chunk_sums(chunk, items=DEFAULT_ITEMS, year=None, replicates=()):
+    """Reduce one chunk to Σw·x and Σw per metric and weight column, by (year, agency)"""
+    missing = [c for c in (WEIGHT_COLUMN, AGENCY_COLUMN, *items.values()) if c not in chunk]
+    if missing:
+        raise ValueError(f"missing column(s) {', '.join(missing)}")
+    if YEAR_COLUMN in chunk:
+        year = pd.to_numeric(chunk[YEAR_COLUMN], errors='coerce')
+    elif year is None:
+        raise ValueError(f"no {YEAR_COLUMN} column and no year in the file name")
+    else:
+        year = pd.Series(year, index=chunk.index)
+    chunk = chunk[year.notna()]
+    codes, groups = pd.MultiIndex.from_arrays(
+        [year[year.notna()].astype('int64'), chunk[AGENCY_COLUMN].fillna('UNKNOWN')]).factorize()
+    groups = groups.set_names(['year', 'agency'])
+
+    # respondents × (1 + R): full-sample weight, then the replicates
+    weights = chunk[[WEIGHT_COLUMN, *replicates]].fillna(0.0).to_numpy(dtype='float64')
+    columns = {
+        'respondents': np.bincount(codes, minlength=len(groups)),
+        'weight': np.bincount(codes, weights[:, 0], minlength=len(groups)),
+    }
+    for metric, column in items.items():
+        score = _score(chunk[column], metric).to_numpy(dtype='float64')
+        wx, w = weighted_totals(codes, len(groups), weights, score)
+        wx_names, w_names = _sum_columns(metric, len(replicates))
+        columns.update(zip(wx_names, wx.T))
+        columns.update(zip(w_names, w.T))
+    return pd.DataFrame(columns, index=groups)
+
+
+def ingest(paths, items=DEFAULT_ITEMS, chunk_rows=CHUNK_ROWS, method='jk1', rho=0.0):
+    """Stream every file; returns (agency-year weighted means, respondent rows read)"""
+    totals, rows, replicates = None, 0, None
+    for path in paths:
+        match = _YEAR_IN_NAME.search(Path(path).name)
+        year = int(match.group(1)) if match else None
+        header = pd.read_csv(path, nrows=0).columns
+        if replicates is None:
+            replicates = replicate_columns(header)
+        elif replicate_columns(header) != replicates:
+            raise ValueError(f"{path}: replicate weights differ from the first file")
+        # Weights parse straight to float64; answers stay text ('X' = do not know)
+        dtype = {column: str for column in (AGENCY_COLUMN, YEAR_COLUMN, *items.values())}
+        dtype.update({column: 'float64' for column in (WEIGHT_COLUMN, *replicates)})
+        reader = pd.read_csv(path, chunksize=chunk_rows, dtype=dtype,
+                             usecols=lambda column: column in dtype)
+        for chunk in reader:
+            part = chunk_sums(chunk, items, year, replicates)
+            totals = part if totals is None else totals.add(part, fill_value=0)
+            rows += len(chunk)
+    if totals is None:
+        raise ValueError("no FEVS rows read")
+    return weighted_means(totals, items, len(replicates), method, rho), rows
+
+
+def weighted_means(totals, items=DEFAULT_ITEMS, replicates=0, method='jk1', rho=0.0):
+    """Turn accumulated sums into means (and replicate SEs), adding governmentwide rows"""
+    overall = totals.groupby(level='year').sum()
+    overall.index = pd.MultiIndex.from_product([overall.index, [ALL_AGENCIES]], names=['year', 'agency'])
+    totals = pd.concat([totals, overall]).sort_index()
+
+    result = totals[['respondents', 'weight']].astype({'respondents': 'int64'})
+    for metric in items:
+        wx_names, w_names = _sum_columns(metric, replicates)
+        mean, se = ratio_estimates(totals[wx_names].to_numpy(), totals[w_names].to_numpy(), method, rho)
+        result[metric] = mean
+        if se is not None:
+            result[f'{metric}_se'] = se
+    return result.reset_index()
+
+
+def governmentwide(by_agency):
+    """One row per year in the shape data_analysis.load_fevs() returns"""
+    df = by_agency[by_agency['agency'] == ALL_AGENCIES].drop(columns=['agency', 'weight'])
+    df = df.rename(columns={'respondents': 'sample_size'}).reset_index(drop=True)
+    df['date'] = pd.to_datetime(df['year'].astype(str) + '-06-01')  # Mid-year
+    return df
+
+
+def _parse_items(pairs):
+    items = dict(DEFAULT_ITEMS)
+    for pair in pairs:
+        metric, _, column = pair.partition('=')
+        if metric not in items or not column:
+            raise argparse.ArgumentTypeError(f"expected one of {', '.join(items)}=COLUMN, got {pair!r}")
+        items[metric] = column
+    return items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Weighted agency/year FEVS means from respondent files')
+    parser.add_argument('files', nargs='+', help='FEVS public release data files (CSV)')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS,
+                        help=f'rows held in memory at once (default: {CHUNK_ROWS:,})')
+    parser.add_argument('--item', action='append', default=[], metavar='METRIC=COLUMN',
+                        help='override the item column for a metric')
+    parser.add_argument('--method', choices=METHODS, default='jk1',
+                        help='replicate variance method (when the files carry REPWT columns)')
+    parser.add_argument('--rho', type=float, default=0.5, help="Fay's coefficient (--method fay)")
+    parser.add_argument('--out', default=None, help='write the agency/year table as CSV')
+    args = parser.parse_args(argv)
+
+    try:
+        items = _parse_items(args.item)
+        by_agency, rows = ingest(args.files, items, args.chunk_rows, args.method, args.rho)
+    except (argparse.ArgumentTypeError, ValueError) as e:
+        print(f"✗ {e}")
+        return 1
+
+    agencies = by_agency.loc[by_agency['agency'] != ALL_AGENCIES, 'agency'].nunique()
+    print(f"✓ Read {rows:,} responses from {len(args.files)} file(s): "
+          f"{agencies} agencies, {by_agency['year'].nunique()} years")
+    print(governmentwide(by_agency).drop(columns=['date']).to_string(index=False, float_format='%.3f'))
+    if args.out:
+        by_agency.to_csv(args.out, index=False)
+        print(f"✓ Saved: {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+File change events for the EBM Dashboard dev tools
+Shared by watch_dashboard.py and dev_server.py. Uses watchdog
+(inotify/FSEvents) when installed, otherwise polls mtimes; either way
+changed paths are put on a queue relative to a root directory.
+"""
+
+import contextlib
+import queue
+import threading
+from pathlib import Path
+
+DEBOUNCE_S = 0.25
+POLL_INTERVAL_S = 0.2
+
+
+def relative(path, root):
+    try:
+        return Path(path).resolve().relative_to(root).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def watch_events(events, root, directories, files):
+    """Feed changed paths into `events`; returns a stop() callable.
+
+    `directories` are watched (non-recursively) when watchdog is available;
+    `files()` returns the paths to poll otherwise.
+    """
+    root = Path(root).resolve()
+    try:
+        from watchdog.events import FileSystemEventHandler  # optional dependency
+        from watchdog.observers import Observer
+    except ImportError:
+        return _poll_events(events, root, files)
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if not event.is_directory:
+                for path in (event.src_path, getattr(event, 'dest_path', None)):
+                    if path:
+                        events.put(relative(path, root))
+
+    observer = Observer()
+    for directory in set(directories):
+        if Path(directory).is_dir():
+            observer.schedule(Handler(), str(directory), recursive=False)
+    observer.start()
+    print("  (watching with watchdog)")
+
+    def stop():
+        observer.stop()
+        observer.join()
+    return stop
+
+
+def _poll_events(events, root, files):
+    stopped = threading.Event()
+
+    def snapshot():
+        state = {}
+        for path in files():
+            with contextlib.suppress(OSError):
+                st = path.stat()
+                state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def run():
+        before = snapshot()
+        while not stopped.wait(POLL_INTERVAL_S):
+            after = snapshot()
+            for path in before.keys() | after.keys():
+                if before.get(path) != after.get(path):
+                    events.put(relative(path, root))
+            before = after
+
+    threading.Thread(target=run, daemon=True).start()
+    print(f"  (watchdog not installed - polling every {POLL_INTERVAL_S}s)")
+    return stopped.set
+
+
+def collect(events, debounce=DEBOUNCE_S, timeout=None):
+    """Block for the first change, then gather until `debounce` seconds of quiet.
+
+    Returns an empty set if nothing arrives within `timeout`.
+    """
+    try:
+        changed = {events.get(timeout=timeout)}
+    except queue.Empty:
+        return set()
+    while True:
+        try:
+            changed.add(events.get(timeout=debounce))
+        except queue.Empty:
+            return changed
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Forecasting for EBM Dashboard
+Projects quits and compensation 12-24 months ahead. Every series is fitted
+with a small family of models and the one with the lowest error on the
+held-out final stretch is refitted on the full series:
+
+    naive           random walk (the benchmark every model has to beat)
+    ses             simple exponential smoothing
+    holt            damped additive-trend exponential smoothing
+    holt_winters    additive trend + additive seasonality (period = 1 year)
+    arima(p,1,0)    AR(p) on first differences, p = 1..3
+    arima(2,0,0)    AR(2) with a constant, on levels
+
+The smoothing models are fitted by least squares on one-step errors and the
+ARIMA models by OLS, so nothing beyond numpy/scipy is needed. Each model is
+linear in its innovations, so h-step intervals follow from its ψ-weights:
+
+    var(h) = σ² · Σ_{j<h} ψ_j²
+
+Series are independent and fitted in parallel worker processes. Fits are
+cached on disk keyed by the model set, horizon, dates and values, so an
+unchanged series is not refitted on the next run.
+
+Usage:
+    python forecasting.py [--horizon MONTHS] [--no-cache]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.optimize import minimize
+
+MODELS = ('naive', 'ses', 'holt', 'holt_winters',
+          'arima(1,1,0)', 'arima(2,1,0)', 'arima(3,1,0)', 'arima(2,0,0)')
+HORIZON = 12                  # months
+MAX_HORIZON = 24
+LEVEL = 0.95                  # prediction interval coverage
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.cache' / 'forecasts'
+
+
+# --- Exponential smoothing (additive errors, error-correction form) ----------
+
+def _ets_filter(x, alpha, beta, phi, gamma, period, trend, seasonal):
+    """One-step errors and final (level, trend, seasonal states) of an ETS model"""
+    level = x[0]
+    slope = x[1] - x[0] if trend else 0.0
+    if seasonal:
+        first = x[:period]
+        season = list(first - first.mean())
+        level = first.mean()
+        slope = (x[period:2 * period].mean() - first.mean()) / period if trend else 0.0
+    else:
+        season = []
+    errors = np.empty(len(x))
+    for t, value in enumerate(x):
+        s = season[t % period] if seasonal else 0.0
+        error = value - (level + phi * slope + s)
+        errors[t] = error
+        level = level + phi * slope + alpha * error
+        slope = phi * slope + beta * error
+        if seasonal:
+            season[t % period] = s + gamma * error
+    return errors, (level, slope, season, len(x) % period if seasonal else 0)
+
+
+def _ets_spec(name):
+    """(trend, seasonal, damped) for a smoothing model name"""
+    return {'ses': (False, False, False), 'holt': (True, False, True),
+            'holt_winters': (True, True, False)}[name]
+
+
+def _fit_ets(x, name, period):
+    trend, seasonal, damped = _ets_spec(name)
+    names = ['alpha'] + (['beta'] if trend else []) + (['phi'] if damped else []) + \
+            (['gamma'] if seasonal else [])
+    start = {'alpha': 0.5, 'beta': 0.05, 'phi': 0.95, 'gamma': 0.1}
+    bounds = {'alpha': (1e-4, 1.0), 'beta': (0.0, 0.5), 'phi': (0.8, 0.995), 'gamma': (0.0, 0.5)}
+
+    def unpack(theta):
+        params = dict(zip(names, theta))
+        return (params['alpha'], params.get('beta', 0.0),
+                params.get('phi', 1.0 if trend else 0.0), params.get('gamma', 0.0))
+
+    def sse(theta):
+        errors, _ = _ets_filter(x, *unpack(theta), period, trend, seasonal)
+        return float(errors @ errors)
+
+    result = minimize(sse, [start[n] for n in names], method='L-BFGS-B',
+                      bounds=[bounds[n] for n in names])
+    params = dict(zip(names, map(float, result.x)))
+    errors, _ = _ets_filter(x, *unpack(result.x), period, trend, seasonal)
+    return {'params': params, 'sigma': float(np.std(errors[1:], ddof=len(names)))}
+
+
+def _ets_forecast(x, name, period, params, steps):
+    trend, seasonal, damped = _ets_spec(name)
+    alpha = params['alpha']
+    beta = params.get('beta', 0.0)
+    phi = params.get('phi', 1.0 if trend else 0.0)
+    gamma = params.get('gamma', 0.0)
+    _, (level, slope, season, phase) = _ets_filter(x, alpha, beta, phi, gamma, period, trend, seasonal)
+    h = np.arange(1, steps + 1)
+    damping = np.cumsum(phi ** h)
+    point = level + damping * slope
+    if seasonal:
+        point = point + np.asarray(season)[(phase + h - 1) % period]
+    # ψ_0 = 1, ψ_j = α + β(φ + … + φ^j) + γ·[j ≡ 0 mod period]
+    psi = np.concatenate([[1.0], alpha + beta * damping[:-1]])
+    if seasonal:
+        psi[1:] += gamma * (h[:-1] % period == 0)
+    return point, psi
+
+
+# --- ARIMA(p,d,0) by least squares ------------------------------------------
+
+def _arima_order(name):
+    p, d, _ = name[len('arima('):-1].split(',')
+    return int(p), int(d)
+
+
+def _fit_arima(x, name, period):
+    p, d = _arima_order(name)
+    z = np.diff(x, n=d)
+    lags = np.column_stack([z[p - i - 1:len(z) - i - 1] for i in range(p)])
+    design = np.column_stack([np.ones(len(lags)), lags])
+    coef, *_ = np.linalg.lstsq(design, z[p:], rcond=None)
+    resid = z[p:] - design @ coef
+    return {'params': {'const': float(coef[0]), 'ar': [float(c) for c in coef[1:]]},
+            'sigma': float(np.std(resid, ddof=p + 1))}
+
+
+def _arima_forecast(x, name, period, params, steps):
+    p, d = _arima_order(name)
+    const, ar = params['const'], np.asarray(params['ar'])
+    z = list(np.diff(x, n=d)[-p:])
+    for _ in range(steps):
+        z.append(const + ar @ np.asarray(z[-1:-p - 1:-1]))
+    point = np.asarray(z[p:])
+    if d:
+        point = x[-1] + np.cumsum(point)
+    # ψ-weights of 1 / (φ(B)(1 - B)^d)
+    poly = np.polymul(np.r_[1.0, -ar], [1.0, -1.0]) if d else np.r_[1.0, -ar]
+    psi = np.zeros(steps)
+    psi[0] = 1.0
+    for j in range(1, steps):
+        k = min(j, len(poly) - 1)
+        psi[j] = -poly[1:k + 1] @ psi[j - 1::-1][:k]
+    return point, psi
+
+
+# --- Model dispatch -----------------------------------------------------------
+
+def _min_length(name, period):
+    """Shortest training series a model can be fitted to"""
+    if name == 'holt_winters':
+        return 2 * period + 2
+    if name.startswith('arima'):
+        p, d = _arima_order(name)
+        return 3 * (p + 1) + d
+    if name == 'naive':
+        return 3
+    trend, seasonal, damped = _ets_spec(name)
+    return 3 + trend + damped + seasonal  # σ needs more errors than parameters
+
+
+def fit(x, name, period=12):
+    """Fitted parameters and one-step residual σ of one model"""
+    if name == 'naive':
+        return {'params': {}, 'sigma': float(np.std(np.diff(x), ddof=1))}
+    if name.startswith('arima'):
+        return _fit_arima(x, name, period)
+    return _fit_ets(x, name, period)
+
+
+def predict(x, name, period, fitted, steps):
+    """(point forecast, ψ-weights) for `steps` periods past the end of x"""
+    if name == 'naive':
+        return np.full(steps, x[-1]), np.ones(steps)
+    if name.startswith('arima'):
+        return _arima_forecast(x, name, period, fitted['params'], steps)
+    return _ets_forecast(x, name, period, fitted['params'], steps)
+
+
+def intervals(point, psi, sigma, level=LEVEL):
+    """Lower/upper prediction bounds from the ψ-weights"""
+    half = stats.norm.ppf(0.5 + level / 2) * sigma * np.sqrt(np.cumsum(psi ** 2))
+    return point - half, point + half
+
+
+def select(x, models=MODELS, period=12, holdout=12):
+    """{model: holdout RMSE} for every model that fits the training stretch"""
+    train, test = x[:-holdout], x[-holdout:]
+    scores = {}
+    for name in models:
+        if len(train) < _min_length(name, period):
+            continue
+        point, _ = predict(train, name, period, fit(train, name, period), holdout)
+        if np.all(np.isfinite(point)):
+            scores[name] = float(np.sqrt(np.mean((point - test) ** 2)))
+    return scores
+
+
+def _forecast_one(args):
+    """Worker: choose a model by holdout RMSE, refit on the full series, forecast
+
+    Falls back to the naive model when no candidate can be fitted to the
+    training stretch (short series).
+    """
+    values, period, steps, models, level = args
+    x = values[~np.isnan(values)]
+    holdout = max(min(steps, len(x) // 4), 1)
+    scores = select(x, models, period, holdout)
+    best = min(scores, key=scores.get) if scores else 'naive'
+    fitted = fit(x, best, period)
+    point, psi = predict(x, best, period, fitted, steps)
+    lower, upper = intervals(point, psi, fitted['sigma'], level)
+    return {'model': best, 'params': fitted['params'], 'sigma': fitted['sigma'],
+            'holdout': holdout, 'scores': scores,
+            'forecast': point.tolist(), 'lower': lower.tolist(), 'upper': upper.tolist()}
+
+
+def _months_per_step(index):
+    """Spacing of a regular date index in months (1 monthly, 3 quarterly, 12 annual)"""
+    months = pd.PeriodIndex(index, freq='M')
+    months = months.year.to_numpy() * 12 + months.month.to_numpy()
+    return max(int(np.median(np.diff(months))), 1)
+
+
+class ForecastCache:
+    """One JSON file per fitted series, keyed by settings, dates and values"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(models, period, steps, level, dates, values):
+        digest = hashlib.sha256(f"{','.join(models)}:{period}:{steps}:{level}".encode())
+        digest.update(pd.DatetimeIndex(dates).asi8.tobytes())
+        digest.update(np.ascontiguousarray(values, dtype='float64').tobytes())
+        return digest.hexdigest()[:24]
+
+    def get(self, key):
+        path = self.directory / f"{key}.json"
+        if not path.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(path.read_text())
+
+    def put(self, key, result):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{key}.json").write_text(json.dumps(result))
+
+
+def forecast(series, horizon=HORIZON, models=MODELS, level=LEVEL, cache=None, workers=None):
+    """Forecast each {name: date-indexed Series} `horizon` months ahead
+
+    Series may differ in frequency (monthly quits, quarterly ECI); each is
+    forecast in its own steps. Returns ({name: fit summary}, long-format
+    DataFrame of series, date, model, forecast, lower, upper).
+    """
+    if not 1 <= horizon <= MAX_HORIZON:
+        raise ValueError(f"forecast horizon must be 1-{MAX_HORIZON} months, got {horizon}")
+    unknown = [m for m in models if m not in MODELS]
+    if unknown:
+        raise ValueError(f"unknown model(s) {', '.join(unknown)} (expected {', '.join(MODELS)})")
+
+    jobs, keys, results = {}, {}, {}
+    for name, s in series.items():
+        s = s.sort_index()
+        step = _months_per_step(s.index)
+        period, steps = max(12 // step, 1), -(-horizon // step)
+        values = s.to_numpy(dtype='float64')
+        observed = int(np.count_nonzero(~np.isnan(values)))
+        if observed < _min_length('naive', period):
+            raise ValueError(f"{name}: {observed} observation(s), need at least "
+                             f"{_min_length('naive', period)} to forecast")
+        keys[name] = cache.key(models, period, steps, level, s.index, values) if cache else None
+        cached = cache.get(keys[name]) if cache else None
+        if cached is None:
+            jobs[name] = (values, period, steps, tuple(models), level)
+        else:
+            results[name] = cached
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results.update(zip(jobs, pool.map(_forecast_one, jobs.values())))
+    else:
+        results.update((name, _forecast_one(job)) for name, job in jobs.items())
+    if cache:
+        for name in jobs:
+            cache.put(keys[name], results[name])
+
+    rows = []
+    for name, s in series.items():
+        result = results[name]
+        last = s.dropna().index.max()
+        step = _months_per_step(s.sort_index().index)
+        dates = [last + pd.DateOffset(months=step * h) for h in range(1, len(result['forecast']) + 1)]
+        rows.append(pd.DataFrame({'series': name, 'date': dates, 'model': result['model'],
+                                  'forecast': result['forecast'], 'lower': result['lower'],
+                                  'upper': result['upper']}))
+    return {name: results[name] for name in series}, pd.concat(rows, ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Forecast quits and compensation with model selection')
+    parser.add_argument('--horizon', type=int, default=HORIZON, help=f'months ahead (1-{MAX_HORIZON})')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    from data_analysis import load_eci, load_jolts
+
+    series = {'quits_rate': load_jolts().set_index('date')['quits_rate'],
+              'compensation_change_pct': load_eci().set_index('date')['compensation_change_pct']}
+    cache = None if args.no_cache else ForecastCache()
+    try:
+        fits, table = forecast(series, args.horizon, cache=cache)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 1
+    for name, result in fits.items():
+        ranked = sorted(result['scores'].items(), key=lambda item: item[1])
+        print(f"\n✓ {name}: {result['model']} (holdout RMSE {ranked[0][1]:.3f} over {result['holdout']} steps)")
+        for model, rmse in ranked[1:]:
+            print(f"   {model:<14} {rmse:.3f}")
+    print()
+    print(table.to_string(index=False, float_format='%.3f'))
+    if cache:
+        print(f"  cache: {cache.hits} hit(s), {cache.misses} miss(es) in {cache.directory}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Frequency alignment for EBM Dashboard
+Aligns low-frequency series (quarterly ECI, annual FEVS) to a monthly grid.
+Every method is linear in the observations, so each is built once as a
+months × observations operator A and applied to all series together:
+
+    monthly = A @ observations        (one matrix product for every column)
+
+Methods:
+    ffill   step function - each value holds until the next (the old
+            resample('MS').ffill() behaviour)
+    linear  straight lines between observations
+    cubic   natural cubic spline through the observations
+    denton  additive first-difference Denton: the smoothest monthly path
+            whose months reproduce each observation over its period
+            ('average' for survey/rate levels, 'sum' for flows, 'last'
+            for point-in-time readings)
+
+ffill/linear/cubic place each observation at the month of its date and do
+not extrapolate. Denton covers every month of every observed period, so a
+quarter or year that is only partly inside the monthly range still
+contributes values instead of leading NaNs.
+
+Usage:
+    python frequency_alignment.py    # compare methods on the sample ECI/FEVS data
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy.interpolate import CubicSpline
+
+METHODS = ('ffill', 'linear', 'cubic', 'denton')
+AGGREGATIONS = ('average', 'sum', 'last')
+
+
+def _month_number(index):
+    """Months since year 0 - a uniform grid regardless of month lengths"""
+    periods = pd.PeriodIndex(index, freq='M')
+    return periods.year.to_numpy() * 12 + periods.month.to_numpy() - 1
+
+
+def _ffill_operator(obs, months):
+    position = np.searchsorted(obs, months, side='right') - 1
+    A = np.zeros((len(months), len(obs)))
+    inside = (position >= 0) & (months <= obs[-1])
+    A[np.flatnonzero(inside), position[inside]] = 1.0
+    return A, inside
+
+
+def _linear_operator(obs, months):
+    inside = (months >= obs[0]) & (months <= obs[-1])
+    A = np.zeros((len(months), len(obs)))
+    if len(obs) == 1:
+        A[inside, 0] = 1.0
+        return A, inside
+    rows = np.flatnonzero(inside)
+    left = np.clip(np.searchsorted(obs, months[inside], side='right') - 1, 0, len(obs) - 2)
+    frac = (months[inside] - obs[left]) / (obs[left + 1] - obs[left])
+    A[rows, left] = 1.0 - frac
+    A[rows, left + 1] += frac
+    return A, inside
+
+
+def _cubic_operator(obs, months):
+    if len(obs) < 3:
+        return _linear_operator(obs, months)
+    inside = (months >= obs[0]) & (months <= obs[-1])
+    A = np.zeros((len(months), len(obs)))
+    # The spline of the identity matrix is the operator (the spline is linear in y)
+    A[inside] = CubicSpline(obs, np.eye(len(obs)), bc_type='natural')(months[inside])
+    return A, inside
+
+
+def _denton_operator(starts, ends, months, aggregation):
+    """Solve min Σ(Δy)² s.t. C y = x once for the identity right-hand side"""
+    grid = np.arange(starts.min(), ends.max() + 1)
+    T, n = len(grid), len(starts)
+    C = np.zeros((n, T))
+    for j, (start, end) in enumerate(zip(starts - grid[0], ends - grid[0])):
+        if aggregation == 'last':
+            C[j, end] = 1.0
+        else:
+            C[j, start:end + 1] = 1.0 / (end - start + 1) if aggregation == 'average' else 1.0
+    D = np.diff(np.eye(T), axis=0)
+    kkt = np.block([[2 * D.T @ D, C.T], [C, np.zeros((n, n))]])
+    rhs = np.vstack([np.zeros((T, n)), np.eye(n)])
+    operator = np.linalg.solve(kkt, rhs)[:T]
+
+    inside = (months >= grid[0]) & (months <= grid[-1])
+    A = np.zeros((len(months), n))
+    A[inside] = operator[months[inside] - grid[0]]
+    return A, inside
+
+
+def operator(dates, target, method='ffill', freq=None, aggregation='average'):
+    """(A, inside): months × observations matrix and the target rows it defines
+
+    `dates` are the observation dates, `target` the monthly dates to fill;
+    Denton also needs the observation frequency (`freq`, e.g. 'Q' or 'Y').
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown alignment method {method!r} (expected {', '.join(METHODS)})")
+    months = _month_number(target)
+    if method == 'denton':
+        if freq is None:
+            raise ValueError("denton needs the observation frequency (freq='Q' or 'Y')")
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"unknown aggregation {aggregation!r} (expected {', '.join(AGGREGATIONS)})")
+        periods = pd.DatetimeIndex(dates).to_period(freq)
+        starts = _month_number(periods.start_time)
+        ends = _month_number(periods.end_time)
+        if aggregation == 'last':
+            # Point-in-time readings are taken in the month of the date
+            ends = _month_number(dates)
+        return _denton_operator(starts, ends, months, aggregation)
+    build = {'ffill': _ffill_operator, 'linear': _linear_operator, 'cubic': _cubic_operator}[method]
+    return build(_month_number(dates), months)
+
+
+def align(frame, target, method='ffill', freq=None, aggregation='average'):
+    """Align every column of `frame` (indexed by observation date) to `target` months
+
+    Columns sharing a missing-value pattern share one operator, so the
+    usual case is a single matrix product for all series.
+    """
+    frame = frame.sort_index()
+    target = pd.DatetimeIndex(target)
+    result = pd.DataFrame(np.nan, index=target, columns=frame.columns)
+    patterns = {}
+    for column in frame.columns:
+        patterns.setdefault(tuple(frame[column].notna()), []).append(column)
+    for pattern, columns in patterns.items():
+        rows = np.asarray(pattern, dtype=bool)
+        if not rows.any():
+            continue
+        obs = frame.loc[rows, columns]
+        A, inside = operator(obs.index, target, method, freq, aggregation)
+        result.loc[target[inside], columns] = A[inside] @ obs.to_numpy(dtype='float64')
+    return result
+
+
+def monthly_grid(*indexes):
+    """Month-start dates spanning every given date index"""
+    dates = pd.DatetimeIndex(np.concatenate([pd.DatetimeIndex(i).to_numpy() for i in indexes]))
+    return pd.date_range(dates.min().to_period('M').start_time,
+                         dates.max().to_period('M').start_time, freq='MS')
+
+
+def main(argv=None):
+    from data_analysis import load_eci, load_fevs
+
+    eci = load_eci().set_index('date')[['compensation_change_pct']]
+    fevs = load_fevs().set_index('date')[['overall_satisfaction']]
+    for name, frame, freq, aggregation in [('ECI', eci, 'Q', 'last'), ('FEVS', fevs, 'Y', 'average')]:
+        start = frame.index.min().to_period(freq).start_time
+        end = frame.index.max().to_period(freq).end_time
+        target = pd.date_range(start, end, freq='MS')
+        print(f"\n{name} {frame.columns[0]} → {len(target)} months")
+        print(f"   {'method':<8} {'months':>7} {'mean':>8} {'mean |Δ|':>10}")
+        for method in METHODS:
+            series = align(frame, target, method, freq, aggregation).iloc[:, 0].dropna()
+            print(f"   {method:<8} {len(series):>7} {series.mean():>8.3f} {series.diff().abs().mean():>10.4f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
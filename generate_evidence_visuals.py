@@ -9,27 +9,26 @@ import matplotlib.patches as mpatches
 import numpy as np
 from matplotlib.patches import FancyBboxPatch
 import warnings
+
+from chart_data import get_chart_data
+from chart_output import save_chart
+from theme import PALETTE, apply_theme
 warnings.filterwarnings('ignore')
 
 # Professional color scheme
-COLORS = {
-    'primary': '#2c3e50',
-    'secondary': '#34495e',
-    'accent': '#3498db',
-    'success': '#27ae60',
-    'warning': '#f39c12',
-    'danger': '#e74c3c',
-    'light': '#ecf0f1',
-    'medium': '#95a5a6'
-}
+COLORS = PALETTE
+
+THEME = 'clean'
+apply_theme(THEME)
 
-def create_evidence_overview_chart():
+def create_evidence_overview_chart(data=None):
     """Create overview chart showing all 4 evidence types quality"""
+    if data is None:
+        data = get_chart_data('evidence_overview')
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    evidence_types = ['Scientific\n(5 Studies)', 'Practitioner\n(5 Experts)', 
-                      'Organizational\n(Google Data)', 'Stakeholder\n(Gallup/LinkedIn)']
-    quality_scores = [90, 85, 65, 75]  # Out of 100
+    evidence_types = data['evidence_types']
+    quality_scores = data['quality_scores']  # Out of 100
     colors = [COLORS['success'], COLORS['success'], COLORS['warning'], COLORS['accent']]
     
     bars = ax.barh(evidence_types, quality_scores, color=colors, alpha=0.8, edgecolor=COLORS['primary'], linewidth=2)
@@ -52,19 +51,20 @@ def create_evidence_overview_chart():
     ax.spines['right'].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig('visuals/evidence_overview.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('evidence_overview.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Created evidence_overview.png")
 
 
-def create_scientific_studies_chart():
+def create_scientific_studies_chart(data=None):
     """Chart showing key findings from 5 scientific studies"""
+    if data is None:
+        data = get_chart_data('scientific_studies')
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Left: Retention impact by intervention
-    interventions = ['Competitive\nPay', 'Pay\nSatisfaction', 'Manager\nQuality', 
-                     'Career\nDevelopment', 'Combined\nApproach']
-    impact = [28, 35, 42, 38, 55]  # % reduction in turnover
+    interventions = data['interventions']
+    impact = data['impact']  # % reduction in turnover
     colors_impact = [COLORS['accent'], COLORS['accent'], COLORS['success'], 
                      COLORS['accent'], COLORS['success']]
     
@@ -86,9 +86,8 @@ def create_scientific_studies_chart():
     ax1.spines['right'].set_visible(False)
     
     # Right: Sample sizes and quality
-    studies = ['Trevor et al.\n(2017)', 'Williams et al.\n(2020)', 'Allen et al.\n(2010)', 
-               'BLS JOLTS\n(2024)', 'BLS ECI\n(2024)']
-    sample_sizes = [13346, 99531, 50000, 4200000, 2800000]  # Log scale for visualization
+    studies = data['studies']
+    sample_sizes = data['sample_sizes']  # Log scale for visualization
     log_samples = np.log10(sample_sizes)
     
     bars2 = ax2.barh(studies, log_samples, color=COLORS['success'], alpha=0.8,
@@ -105,7 +104,7 @@ def create_scientific_studies_chart():
         ax2.text(width + 0.1, bar.get_y() + bar.get_height()/2,
                 label, va='center', fontweight='bold', fontsize=10, color=COLORS['primary'])
     
-    ax2.set_xlabel('Sample Size (log scale)', fontsize=11, fontweight='bold', color=COLORS['primary'])
+    ax2.set_xlabel('Sample Size (log scale; BLS rows = employers)', fontsize=11, fontweight='bold', color=COLORS['primary'])
     ax2.set_title('Scientific Evidence: Study Rigor & Sample Sizes', 
                   fontsize=13, fontweight='bold', color=COLORS['primary'])
     ax2.grid(axis='x', alpha=0.3, linestyle='--')
@@ -113,29 +112,22 @@ def create_scientific_studies_chart():
     ax2.spines['right'].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig('visuals/scientific_evidence_summary.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('scientific_evidence_summary.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Created scientific_evidence_summary.png")
 
 
-def create_practitioner_consensus_chart():
+def create_practitioner_consensus_chart(data=None):
     """Chart showing practitioner consensus on key strategies"""
+    if data is None:
+        data = get_chart_data('practitioner_consensus')
     fig, ax = plt.subplots(figsize=(12, 7))
     
-    strategies = [
-        'Competitive\nCompensation',
-        'Manager\nTraining',
-        'Career Path\nClarity',
-        'Mentorship\nPrograms',
-        'Regular\nFeedback',
-        'Recognition\nSystems',
-        'Development\nOpportunities',
-        'Transparent\nCommunication'
-    ]
+    strategies = data['strategies']
     
     # Expert agreement (out of 5 experts)
-    agreement = [5, 5, 4, 4, 5, 3, 5, 4]
-    effectiveness = [90, 85, 80, 75, 80, 65, 85, 70]  # Estimated effectiveness %
+    agreement = data['agreement']
+    effectiveness = data['effectiveness']  # Estimated effectiveness %
     
     # Color by consensus level
     colors_consensus = [COLORS['success'] if a >= 4 else COLORS['warning'] for a in agreement]
@@ -167,20 +159,22 @@ def create_practitioner_consensus_chart():
     ax.legend(handles=legend_elements, loc='lower right', frameon=True, fontsize=10)
     
     plt.tight_layout()
-    plt.savefig('visuals/practitioner_consensus.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('practitioner_consensus.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Created practitioner_consensus.png")
 
 
-def create_organizational_metrics_dashboard():
+def create_organizational_metrics_dashboard(data=None):
     """Dashboard of key organizational metrics"""
+    if data is None:
+        data = get_chart_data('organizational_metrics')
     fig = plt.figure(figsize=(14, 8))
     gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
     
     # Metric 1: Turnover Rate
     ax1 = fig.add_subplot(gs[0, 0])
-    turnover_years = ['2022', '2023', '2024']
-    turnover_rates = [10, 11, 12]
+    turnover_years = data['turnover_years']
+    turnover_rates = data['turnover_rates']
     ax1.plot(turnover_years, turnover_rates, marker='o', linewidth=3, markersize=10,
             color=COLORS['danger'], label='Overall Turnover')
     ax1.fill_between(range(len(turnover_years)), turnover_rates, alpha=0.3, color=COLORS['danger'])
@@ -192,8 +186,8 @@ def create_organizational_metrics_dashboard():
     
     # Metric 2: Average Tenure
     ax2 = fig.add_subplot(gs[0, 1])
-    tenure_categories = ['Early-Career\n(0-3 yrs)', 'Mid-Career\n(3-7 yrs)', 'Senior\n(7+ yrs)']
-    avg_tenure = [2.1, 4.8, 9.2]
+    tenure_categories = data['tenure_categories']
+    avg_tenure = data['avg_tenure']
     bars2 = ax2.bar(tenure_categories, avg_tenure, color=[COLORS['danger'], COLORS['warning'], COLORS['success']],
                    alpha=0.8, edgecolor=COLORS['primary'], linewidth=2)
     for bar in bars2:
@@ -208,8 +202,8 @@ def create_organizational_metrics_dashboard():
     
     # Metric 3: Engagement Scores
     ax3 = fig.add_subplot(gs[0, 2])
-    engagement_categories = ['Early-Career', 'Mid-Career', 'Senior']
-    engagement_scores = [68, 75, 82]
+    engagement_categories = data['engagement_categories']
+    engagement_scores = data['engagement_scores']
     colors3 = [COLORS['warning'], COLORS['accent'], COLORS['success']]
     bars3 = ax3.bar(engagement_categories, engagement_scores, color=colors3, alpha=0.8,
                    edgecolor=COLORS['primary'], linewidth=2)
@@ -227,8 +221,8 @@ def create_organizational_metrics_dashboard():
     
     # Metric 4: Promotion Rates
     ax4 = fig.add_subplot(gs[1, 0])
-    promotion_data = ['Internal\nPromotions', 'External\nHires', 'Target\nInternal']
-    promotion_pct = [15, 85, 35]
+    promotion_data = data['promotion_data']
+    promotion_pct = data['promotion_pct']
     colors4 = [COLORS['warning'], COLORS['danger'], COLORS['success']]
     bars4 = ax4.bar(promotion_data, promotion_pct, color=colors4, alpha=0.8,
                    edgecolor=COLORS['primary'], linewidth=2)
@@ -245,8 +239,8 @@ def create_organizational_metrics_dashboard():
     
     # Metric 5: Development Program Participation
     ax5 = fig.add_subplot(gs[1, 1])
-    programs = ['Mentorship', 'Training', 'Career\nPlanning']
-    participation = [45, 60, 30]
+    programs = data['programs']
+    participation = data['participation']
     bars5 = ax5.barh(programs, participation, color=COLORS['accent'], alpha=0.8,
                     edgecolor=COLORS['primary'], linewidth=2)
     for bar in bars5:
@@ -264,8 +258,8 @@ def create_organizational_metrics_dashboard():
     
     # Metric 6: Manager Effectiveness Scores
     ax6 = fig.add_subplot(gs[1, 2])
-    categories = ['Communication', 'Development', 'Recognition', 'Support']
-    scores = [72, 65, 58, 75]
+    categories = data['manager_categories']
+    scores = data['manager_scores']
     colors6 = [COLORS['accent'], COLORS['warning'], COLORS['warning'], COLORS['accent']]
     bars6 = ax6.barh(categories, scores, color=colors6, alpha=0.8,
                     edgecolor=COLORS['primary'], linewidth=2)
@@ -284,19 +278,20 @@ def create_organizational_metrics_dashboard():
     fig.suptitle('Organizational Evidence: Key Performance Metrics Dashboard', 
                  fontsize=16, fontweight='bold', color=COLORS['primary'], y=0.98)
     
-    plt.savefig('visuals/organizational_metrics_dashboard.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('organizational_metrics_dashboard.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Created organizational_metrics_dashboard.png")
 
 
-def create_stakeholder_priorities_chart():
+def create_stakeholder_priorities_chart(data=None):
     """Chart showing what stakeholders value most for retention"""
+    if data is None:
+        data = get_chart_data('stakeholder_priorities')
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Left: Employee priorities (LinkedIn data)
-    priorities = ['Manager\nQuality', 'Career\nGrowth', 'Competitive\nPay', 
-                  'Recognition', 'Work-Life\nBalance', 'Company\nCulture']
-    importance = [87, 83, 79, 68, 75, 71]  # % saying "very important"
+    priorities = data['priorities']
+    importance = data['importance']  # % saying "very important"
     
     bars1 = ax1.barh(priorities, importance, color=COLORS['accent'], alpha=0.8,
                     edgecolor=COLORS['primary'], linewidth=2)
@@ -316,8 +311,8 @@ def create_stakeholder_priorities_chart():
     ax1.spines['right'].set_visible(False)
     
     # Right: Manager impact (Gallup data)
-    impact_categories = ['Engagement\nVariance', 'Turnover\nPrevention', 'Performance\nImprovement']
-    manager_impact = [70, 50, 55]  # % attributed to manager quality
+    impact_categories = data['impact_categories']
+    manager_impact = data['manager_impact']  # % attributed to manager quality
     
     bars2 = ax2.bar(impact_categories, manager_impact, color=COLORS['success'], alpha=0.8,
                    edgecolor=COLORS['primary'], linewidth=2)
@@ -337,29 +332,25 @@ def create_stakeholder_priorities_chart():
     ax2.spines['right'].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig('visuals/stakeholder_priorities.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('stakeholder_priorities.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Created stakeholder_priorities.png")
 
 
-def create_evidence_synthesis_chart():
+def create_evidence_synthesis_chart(data=None):
     """Final synthesis chart showing convergence across all evidence types"""
+    if data is None:
+        data = get_chart_data('evidence_synthesis')
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Key findings from all 4 evidence types
-    interventions = [
-        'Competitive\nCompensation',
-        'Manager Quality\n& Training',
-        'Career Development\nOpportunities',
-        'Mentorship\nPrograms',
-        'Regular Feedback\n& Recognition'
-    ]
+    interventions = data['interventions']
     
     # Support level from each evidence type (0-100 scale)
-    scientific = [90, 85, 80, 75, 80]
-    practitioner = [90, 85, 80, 75, 80]
-    organizational = [65, 70, 60, 45, 58]
-    stakeholder = [79, 87, 83, 70, 68]
+    scientific = data['scientific']
+    practitioner = data['practitioner']
+    organizational = data['organizational']
+    stakeholder = data['stakeholder']
     
     x = np.arange(len(interventions))
     width = 0.2
@@ -392,7 +383,7 @@ def create_evidence_synthesis_chart():
         ax.text(i+1.8*width, avg, f'{int(avg)}', fontsize=9, fontweight='bold', va='center')
     
     plt.tight_layout()
-    plt.savefig('visuals/evidence_synthesis.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('evidence_synthesis.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
     print("✓ Created evidence_synthesis.png")
 
@@ -8,28 +8,45 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 import numpy as np
+import sys
+
+import power_analysis
+from bayesian_updating import journey
+from chart_data import get_chart_data
+from chart_output import save_chart, set_vector_output, write_format_report
+from theme import PALETTE, apply_theme
 
 # Professional color scheme (matching dashboard)
-PRIMARY_COLOR = '#2c3e50'
-ACCENT_COLOR = '#3498db'
-SUCCESS_COLOR = '#27ae60'
-WARNING_COLOR = '#f39c12'
-DANGER_COLOR = '#e74c3c'
-LIGHT_BG = '#ecf0f1'
+PRIMARY_COLOR = PALETTE['primary']
+ACCENT_COLOR = PALETTE['accent']
+SUCCESS_COLOR = PALETTE['success']
+WARNING_COLOR = PALETTE['warning']
+DANGER_COLOR = PALETTE['danger']
+LIGHT_BG = PALETTE['light']
+
+THEME = 'clean'
+apply_theme(THEME)
 
-def create_bayesian_journey_chart():
-    """Chart 1: Bayesian Confidence Journey (30% → 85%)"""
+def create_bayesian_journey_chart(data=None):
+    """Chart 1: Bayesian Confidence Journey, computed from the prior and likelihood ratios"""
+    if data is None:
+        data = get_chart_data('bayesian_journey')
+    result = journey(data)
     
     fig, ax = plt.subplots(figsize=(12, 7), facecolor='white')
     
     # Data points
-    stages = ['Initial\nBelief', 'After\nScientific', 'After\nPractitioner', 'After\nOrganizational', 'After\nStakeholder']
-    confidence = [30, 55, 72, 77, 85]
-    boosts = [0, 25, 17, 5, 8]
+    stages = result['stages']
+    confidence = result['confidence']
+    boosts = [0] + [after - before for before, after in zip(confidence, confidence[1:])]
     
     # Create stepped line chart
     x_positions = range(len(stages))
     
+    # Sensitivity band over sampled priors and likelihood ratios
+    ax.fill_between(x_positions, result['low'], result['high'], color=ACCENT_COLOR, alpha=0.15,
+                    label='Sensitivity (5-95%)')
+    
     # Plot confidence line
     ax.plot(x_positions, confidence, marker='o', linewidth=3, markersize=12, 
             color=ACCENT_COLOR, label='Confidence Level')
@@ -43,14 +60,14 @@ def create_bayesian_journey_chart():
         
         # Boost amount text
         mid_y = (confidence[i] + confidence[i-1]) / 2
-        ax.text(x_positions[i] - 0.5, mid_y + 3, f'+{boosts[i]}%', 
+        ax.text(x_positions[i] - 0.5, mid_y + 3, f'{boosts[i]:+.0f}%', 
                fontsize=11, fontweight='bold', color=SUCCESS_COLOR,
                ha='center', bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
     
     # Highlight final confidence
     ax.scatter([x_positions[-1]], [confidence[-1]], s=400, c=SUCCESS_COLOR, 
               alpha=0.3, zorder=2)
-    ax.text(x_positions[-1], confidence[-1] + 5, '85% FINAL', 
+    ax.text(x_positions[-1], confidence[-1] + 5, f'{confidence[-1]:.0f}% FINAL', 
            fontsize=13, fontweight='bold', ha='center', color=SUCCESS_COLOR)
     
     # Add reference zones
@@ -69,13 +86,13 @@ def create_bayesian_journey_chart():
     ax.legend(loc='upper left', fontsize=10, framealpha=0.9)
     
     # Add total gain annotation
-    ax.text(2, 15, f'Total Gain: +55 percentage points', 
+    ax.text((len(stages) - 1) / 2, 15, f'Total Gain: {confidence[-1] - confidence[0]:+.0f} percentage points', 
            fontsize=12, fontweight='bold', ha='center',
            bbox=dict(boxstyle='round,pad=0.5', facecolor=ACCENT_COLOR, 
                     edgecolor='none', alpha=0.2))
     
     plt.tight_layout()
-    plt.savefig('visuals/bayesian_confidence_journey.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('bayesian_confidence_journey.png', dpi=300, bbox_inches='tight', facecolor='white')
     print("✓ Created bayesian_confidence_journey.png")
     plt.close()
 
@@ -172,37 +189,24 @@ def create_logic_model_diagram():
            fontsize=8, ha='center', color=PRIMARY_COLOR, style='italic', alpha=0.7)
     
     plt.tight_layout()
-    plt.savefig('visuals/logic_model_diagram.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('logic_model_diagram.png', vector=True, dpi=300, bbox_inches='tight', facecolor='white')
     print("✓ Created logic_model_diagram.png")
     plt.close()
 
 
-def create_implementation_timeline():
+def create_implementation_timeline(data=None):
     """Chart 3: 5-Phase Implementation Timeline (Gantt-style)"""
+    if data is None:
+        data = get_chart_data('implementation_timeline')
     
     fig, ax = plt.subplots(figsize=(14, 8), facecolor='white')
     
-    # Phases with durations
-    phases = [
-        ('Phase 1: Preparation', 0, 1, ACCENT_COLOR),
-        ('Phase 2: Pilot', 1, 4, WARNING_COLOR),
-        ('Phase 3: Evaluation & Scale Decision', 4, 5, '#9b59b6'),
-        ('Phase 4: Full Rollout', 5, 18, SUCCESS_COLOR),
-        ('Phase 5: Sustainability', 18, 24, '#34495e')
-    ]
+    # Phases with durations (colors are palette names)
+    phases = [(p['name'], p['start'], p['end'], PALETTE.get(p['color'], p['color']))
+              for p in data['phases']]
     
     # Key milestones
-    milestones = [
-        (1, 'Budget Approved'),
-        (2, 'Training Launched'),
-        (3, 'Compensation Adjusted'),
-        (4, 'Pilot Complete'),
-        (5, 'Scale Decision'),
-        (9, 'All Managers Trained'),
-        (12, '12-Month Evaluation'),
-        (18, 'Full Impact Expected'),
-        (24, 'Program Self-Sustaining')
-    ]
+    milestones = [(m['month'], m['label']) for m in data['milestones']]
     
     # Draw phase bars
     for i, (phase_name, start, end, color) in enumerate(phases):
@@ -255,22 +259,77 @@ def create_implementation_timeline():
                         alpha=0.2, edgecolor=ACCENT_COLOR, linewidth=1.5))
     
     plt.tight_layout()
-    plt.savefig('visuals/implementation_timeline.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('implementation_timeline.png', dpi=300, bbox_inches='tight', facecolor='white')
     print("✓ Created implementation_timeline.png")
     plt.close()
 
 
-def create_roi_projection():
+def create_power_curve(data=None):
+    """Chart 7: Pilot Power Curve (simulated power vs pilot size)"""
+    if data is None:
+        data = get_chart_data('pilot_power')
+    grid = power_analysis.from_chart_data(data, workers=1, cache_dir=power_analysis.CACHE_DIR)
+    
+    fig, ax = plt.subplots(figsize=(12, 7), facecolor='white')
+    
+    # One curve per effect at the middle baseline, band across the baseline range
+    baselines = sorted(data['baseline_rates'])
+    baseline = baselines[len(baselines) // 2]
+    effect_colors = [WARNING_COLOR, ACCENT_COLOR, SUCCESS_COLOR, DANGER_COLOR, PRIMARY_COLOR]
+    for i, effect in enumerate(data['effects']):
+        color = effect_colors[i % len(effect_colors)]
+        cells = grid[grid['effect'] == effect]
+        band = cells.groupby('pilot_size')['power'].agg(['min', 'max'])
+        curve = cells[cells['baseline'] == baseline]
+        ax.fill_between(band.index, band['min'] * 100, band['max'] * 100, color=color, alpha=0.15)
+        ax.plot(curve['pilot_size'], curve['power'] * 100, marker='o', linewidth=3, markersize=7,
+                color=color, label=f'+{effect * 100:.0f} pts retention ({baseline:.0%} → {baseline + effect:.0%})')
+    
+    # 80% power target and the planned pilot
+    ax.axhline(power_analysis.TARGET_POWER * 100, color=PRIMARY_COLOR, linestyle='--', linewidth=1.5,
+               alpha=0.7)
+    ax.text(max(data['sample_sizes']), power_analysis.TARGET_POWER * 100 + 1.5,
+            f'{power_analysis.TARGET_POWER:.0%} power target', ha='right', fontsize=10, color=PRIMARY_COLOR)
+    planned = data['planned_size']
+    ax.axvline(planned, color=DANGER_COLOR, linestyle=':', linewidth=2)
+    planned_power = grid[(grid['pilot_size'] == planned) & (grid['baseline'] == baseline)]['power']
+    if len(planned_power):
+        ax.text(planned + 5, 92, f'Planned pilot: {planned} employees\n'
+                f'power {planned_power.min():.0%}-{planned_power.max():.0%}',
+                fontsize=10, fontweight='bold', color=DANGER_COLOR, va='top',
+                bbox=dict(boxstyle='round,pad=0.4', facecolor='white', edgecolor=DANGER_COLOR, linewidth=1.5))
+    
+    # Formatting
+    ax.set_xlabel(f"Pilot Employees (control: {data['control_ratio']:g}× pilot, teams of {data['team_size']:g})",
+                  fontsize=13, fontweight='bold')
+    ax.set_ylabel('Power to Detect Improvement (%)', fontsize=13, fontweight='bold')
+    ax.set_title('Pilot Evaluation: Power to Detect Retention Gains', 
+                fontsize=15, fontweight='bold', pad=20, color=PRIMARY_COLOR)
+    ax.set_ylim(0, 100)
+    ax.set_xlim(0, max(data['sample_sizes']) * 1.02)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.legend(loc='lower right', fontsize=10, framealpha=0.9,
+              title=f'Bands: baseline {baselines[0]:.0%}-{baselines[-1]:.0%}', title_fontsize=9)
+    
+    plt.tight_layout()
+    save_chart('pilot_power_curve.png', dpi=300, bbox_inches='tight', facecolor='white')
+    print("✓ Created pilot_power_curve.png")
+    plt.close()
+
+
+def create_roi_projection(data=None):
     """Chart 4: 3-Year ROI Projection"""
+    if data is None:
+        data = get_chart_data('roi_projection')
     
     fig, ax = plt.subplots(figsize=(12, 7), facecolor='white')
     
-    years = ['Year 1', 'Year 2', 'Year 3', '3-Year Total']
+    years = data['years']
     
     # Financial data
-    investment = [610, 160, 160, 930]  # Cumulative would be 930K
-    savings = [600, 600, 600, 1800]     # Annual savings
-    net_benefit = [-10, 440, 440, 870]  # Savings - Investment
+    investment = data['investment']
+    savings = data['savings']     # Annual savings
+    net_benefit = [s - i for s, i in zip(savings, investment)]  # Savings - Investment
     
     x = np.arange(len(years))
     width = 0.25
@@ -295,7 +354,7 @@ def create_roi_projection():
     
     # Add break-even line
     ax.axhline(y=0, color='black', linestyle='-', linewidth=2, alpha=0.5)
-    ax.text(3.5, 50, 'Break-Even Line', fontsize=9, style='italic')
+    ax.text(len(years) - 0.5, 50, 'Break-Even Line', fontsize=9, style='italic')
     
     # Formatting
     ax.set_ylabel('Amount ($K)', fontsize=13, fontweight='bold')
@@ -307,7 +366,16 @@ def create_roi_projection():
     ax.grid(True, axis='y', alpha=0.3, linestyle='--')
     
     # Add ROI summary box
-    summary_text = 'ROI Summary:\n• Year 1: Break-even (~0% ROI)\n• Year 2: 275% ROI ($440K return on $160K)\n• Year 3: 275% ROI (sustained)\n• 3-Year Total: 94% ROI ($870K net benefit)'
+    summary_lines = ['ROI Summary:']
+    for year, inv, net in zip(years, investment, net_benefit):
+        roi = net / inv * 100 if inv else 0
+        if abs(roi) < 5:
+            summary_lines.append(f'• {year}: Break-even (~0% ROI)')
+        elif year == years[-1]:
+            summary_lines.append(f'• {year}: {roi:.0f}% ROI (${net}K net benefit)')
+        else:
+            summary_lines.append(f'• {year}: {roi:.0f}% ROI (${net}K return on ${inv}K)')
+    summary_text = '\n'.join(summary_lines)
     ax.text(0.02, 0.98, summary_text, transform=ax.transAxes,
            fontsize=10, verticalalignment='top',
            bbox=dict(boxstyle='round,pad=0.8', facecolor=LIGHT_BG, 
@@ -319,7 +387,7 @@ def create_roi_projection():
            bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.8))
     
     plt.tight_layout()
-    plt.savefig('visuals/roi_projection.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('roi_projection.png', dpi=300, bbox_inches='tight', facecolor='white')
     print("✓ Created roi_projection.png")
     plt.close()
 
@@ -421,7 +489,7 @@ def create_evaluation_framework():
                     edgecolor=ACCENT_COLOR, linewidth=2))
     
     plt.tight_layout()
-    plt.savefig('visuals/evaluation_framework.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('evaluation_framework.png', vector=True, dpi=300, bbox_inches='tight', facecolor='white')
     print("✓ Created evaluation_framework.png")
     plt.close()
 
@@ -499,7 +567,7 @@ def create_7questions_summary():
            fontsize=10, ha='center', color='white', style='italic')
     
     plt.tight_layout()
-    plt.savefig('visuals/7questions_summary.png', dpi=300, bbox_inches='tight', facecolor='white')
+    save_chart('7questions_summary.png', vector=True, dpi=300, bbox_inches='tight', facecolor='white')
     print("✓ Created 7questions_summary.png")
     plt.close()
 
@@ -507,23 +575,31 @@ def create_7questions_summary():
 def main():
     print("\n📊 Generating Milestone 3 Visualizations...\n")
     
+    # --vector: also emit SVG for diagram charts when it beats the PNG
+    if '--vector' in sys.argv:
+        set_vector_output(True)
+    
     # Create all charts
     create_bayesian_journey_chart()
     create_logic_model_diagram()
     create_implementation_timeline()
     create_roi_projection()
+    create_power_curve()
     create_evaluation_framework()
     create_7questions_summary()
     
     print("\n✅ All Milestone 3 visualizations created successfully!")
     print("   Files saved to: visuals/")
-    print("\n   Created 6 charts:")
-    print("   1. bayesian_confidence_journey.png - Confidence evolution 30%→85%")
+    print("\n   Created 7 charts:")
+    print("   1. bayesian_confidence_journey.png - Confidence evolution from the evidence likelihood ratios")
     print("   2. logic_model_diagram.png - X→M→Y causal framework")
     print("   3. implementation_timeline.png - 24-month Gantt chart")
     print("   4. roi_projection.png - 3-year financial analysis")
     print("   5. evaluation_framework.png - KPIs dashboard")
     print("   6. 7questions_summary.png - Critical assessment results")
+    print("   7. pilot_power_curve.png - Simulated pilot power by sample size")
+    if write_format_report():
+        print("\n   Format comparison written to visuals/format_report.json")
 
 if __name__ == "__main__":
     main()
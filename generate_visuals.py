@@ -7,20 +7,27 @@ import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+import meta_analysis
+from chart_data import get_chart_data
+from chart_output import save_chart
+from theme import PALETTE, apply_theme
+
 # Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-colors = {'primary': '#2c3e50', 'accent': '#3498db', 'success': '#27ae60', 'warning': '#f39c12'}
+THEME = 'darkgrid'
+apply_theme(THEME)
+colors = PALETTE
 
 # Create visuals directory
 Path('visuals').mkdir(exist_ok=True)
 
 # 1. Evidence Quality Matrix
-def create_evidence_quality_chart():
+def create_evidence_quality_chart(data=None):
+    if data is None:
+        data = get_chart_data('evidence_quality')
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    evidence_types = ['Scientific\nEvidence', 'Practitioner\nEvidence', 
-                      'Organizational\nEvidence', 'Stakeholder\nEvidence']
-    quality_scores = [90, 85, 80, 75]  # Based on appraisal ratings
+    evidence_types = data['evidence_types']
+    quality_scores = data['quality_scores']  # Based on appraisal ratings
     bar_colors = [colors['accent'], colors['primary'], colors['accent'], colors['success']]
     
     bars = ax.barh(evidence_types, quality_scores, color=bar_colors, alpha=0.8)
@@ -36,16 +43,18 @@ def create_evidence_quality_chart():
     ax.grid(axis='x', alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('visuals/evidence_quality.png', dpi=300, bbox_inches='tight')
+    save_chart('evidence_quality.png', dpi=300, bbox_inches='tight')
     plt.close()
 
 # 2. Retention Impact Visualization
-def create_retention_impact_chart():
+def create_retention_impact_chart(data=None):
+    if data is None:
+        data = get_chart_data('retention_impact')
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Left: Compensation Impact
-    scenarios = ['Low Pay\nSatisfaction', 'Medium Pay\nSatisfaction', 'High Pay\nSatisfaction']
-    retention_rates = [65, 78, 92]  # Based on Trevor et al. findings
+    scenarios = data['scenarios']
+    retention_rates = data['retention_rates']  # Based on Trevor et al. findings
     
     bars1 = ax1.bar(scenarios, retention_rates, color=colors['accent'], alpha=0.8)
     for bar, rate in zip(bars1, retention_rates):
@@ -59,8 +68,8 @@ def create_retention_impact_chart():
     ax1.grid(axis='y', alpha=0.3)
     
     # Right: Manager Quality Impact
-    manager_scenarios = ['Poor\nManager', 'Average\nManager', 'Excellent\nManager']
-    manager_retention = [58, 75, 95]  # Based on Google case + Gallup data
+    manager_scenarios = data['manager_scenarios']
+    manager_retention = data['manager_retention']  # Based on Google case + Gallup data
     
     bars2 = ax2.bar(manager_scenarios, manager_retention, color=colors['primary'], alpha=0.8)
     for bar, rate in zip(bars2, manager_retention):
@@ -76,19 +85,19 @@ def create_retention_impact_chart():
     plt.suptitle('Predicted Retention Rates by Intervention Type', 
                  fontsize=15, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig('visuals/retention_impact.png', dpi=300, bbox_inches='tight')
+    save_chart('retention_impact.png', dpi=300, bbox_inches='tight')
     plt.close()
 
 # 3. Evidence Collection Progress
-def create_progress_timeline():
+def create_progress_timeline(data=None):
+    if data is None:
+        data = get_chart_data('progress_timeline')
     fig, ax = plt.subplots(figsize=(12, 6))
     
-    weeks = ['Week 3', 'Week 6', 'Week 9', 'Week 12', 'Week 16']
-    milestones = ['Problem\nFramework', 'Scientific &\nPractitioner', 
-                  'Organizational &\nStakeholder', 'Evidence\nSynthesis', 
-                  'Implementation\nPlan']
+    weeks = data['weeks']
+    milestones = data['milestones']
     
-    completion = [100, 100, 100, 85, 75]  # Completion percentages
+    completion = data['completion']  # Completion percentages
     
     x = np.arange(len(weeks))
     bars = ax.bar(x, completion, color=[colors['success'] if c == 100 else colors['accent'] 
@@ -111,21 +120,22 @@ def create_progress_timeline():
         ax.text(i, -8, milestone, ha='center', fontsize=9, style='italic')
     
     plt.tight_layout()
-    plt.savefig('visuals/progress_timeline.png', dpi=300, bbox_inches='tight')
+    save_chart('progress_timeline.png', dpi=300, bbox_inches='tight')
     plt.close()
 
 # 4. Turnover Cost Analysis
-def create_cost_analysis():
+def create_cost_analysis(data=None):
+    if data is None:
+        data = get_chart_data('cost_analysis')
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Data from BLS and practitioner sources
-    scenarios = ['Current\nTurnover\n(25%)', 'With Compensation\nImprovement\n(18%)', 
-                 'With Manager\nTraining\n(15%)', 'Combined\nIntervention\n(10%)']
+    scenarios = data['scenarios']
     
-    employees = 100  # Assume 100 employee cohort
-    avg_cost = 15000  # Average turnover cost per employee
+    employees = data['employees']  # Employee cohort size
+    avg_cost = data['avg_cost']  # Average turnover cost per employee
     
-    turnover_rates = [0.25, 0.18, 0.15, 0.10]
+    turnover_rates = data['turnover_rates']
     annual_costs = [employees * rate * avg_cost / 1000 for rate in turnover_rates]  # In thousands
     
     bars = ax.bar(scenarios, annual_costs, 
@@ -138,42 +148,41 @@ def create_cost_analysis():
                f'${cost:.0f}K', ha='center', va='bottom', fontweight='bold')
     
     ax.set_ylabel('Annual Turnover Cost ($1000s)', fontsize=12, fontweight='bold')
-    ax.set_title('Estimated Annual Turnover Costs\nBy Intervention Strategy (100 Employees)', 
+    ax.set_title(f'Estimated Annual Turnover Costs\nBy Intervention Strategy ({employees} Employees)', 
                  fontsize=14, fontweight='bold', pad=20)
     ax.set_ylim(0, max(annual_costs) * 1.2)
     ax.grid(axis='y', alpha=0.3)
     
-    # Add savings annotation
+    # Add savings annotation (baseline vs. last scenario)
     baseline = annual_costs[0]
-    combined_savings = baseline - annual_costs[3]
+    last = len(annual_costs) - 1
+    combined_savings = baseline - annual_costs[last]
     ax.annotate(f'Potential Savings: ${combined_savings:.0f}K/year', 
-                xy=(3, annual_costs[3]), xytext=(2, annual_costs[0] * 0.7),
+                xy=(last, annual_costs[last]), xytext=(last - 1, annual_costs[0] * 0.7),
                 arrowprops=dict(arrowstyle='->', color=colors['success'], lw=2),
                 fontsize=11, fontweight='bold', color=colors['success'],
                 bbox=dict(boxstyle='round,pad=0.5', facecolor='white', edgecolor=colors['success']))
     
     plt.tight_layout()
-    plt.savefig('visuals/cost_analysis.png', dpi=300, bbox_inches='tight')
+    save_chart('cost_analysis.png', dpi=300, bbox_inches='tight')
     plt.close()
 
 # 5. Logic Model Effect Sizes
-def create_effect_sizes_chart():
+def create_effect_sizes_chart(data=None):
+    if data is None:
+        data = get_chart_data('effect_sizes')
     fig, ax = plt.subplots(figsize=(10, 7))
     
-    relationships = [
-        'Pay Satisfaction\n→ Retention\n(Trevor et al.)',
-        'Compensation\n→ Job Satisfaction\n(Williams et al.)',
-        'Manager Quality\n→ Retention\n(Allen et al.)',
-        'Pay + Training\n→ Satisfaction\n(Combined)',
-        'Overall Model\nX → M → Y'
-    ]
-    
-    effect_sizes = [0.67, 0.52, 0.48, 0.71, 0.65]  # Cohen's d values
-    confidence = [90, 85, 88, 87, 89]  # Confidence levels
+    # Effects (Cohen's d) plus the random-effects estimate pooled over the cited studies
+    _, effects, variances = meta_analysis.from_chart_data(data)
+    pooled = meta_analysis.pool(effects, variances)
+    relationships = [*data['relationships'], 'Overall Model\nX → M → Y\n(random effects)']
+    effect_sizes = [*data['effect_sizes'], pooled['random']]
+    confidence = data['confidence']  # Confidence levels
     
     # Create horizontal bar chart with gradient based on confidence
     y_pos = np.arange(len(relationships))
-    colors_bars = plt.cm.Blues([c/100 for c in confidence])
+    colors_bars = [*plt.cm.Blues([c/100 for c in confidence]), colors['primary']]
     
     bars = ax.barh(y_pos, effect_sizes, color=colors_bars, alpha=0.9)
     
@@ -181,6 +190,9 @@ def create_effect_sizes_chart():
     for i, (bar, es, conf) in enumerate(zip(bars, effect_sizes, confidence)):
         ax.text(es + 0.03, i, f'd = {es:.2f}\n({conf}% conf.)', 
                va='center', fontweight='bold', fontsize=10)
+    ax.text(pooled['random'] + 0.03, len(data['effect_sizes']), f"d = {pooled['random']:.2f}\n"
+            f"[{pooled['random_low']:.2f}, {pooled['random_high']:.2f}]",
+            va='center', fontweight='bold', fontsize=10)
     
     # Add reference lines for effect size interpretation
     ax.axvline(0.2, color='gray', linestyle='--', alpha=0.5, linewidth=1)
@@ -200,7 +212,63 @@ def create_effect_sizes_chart():
     ax.grid(axis='x', alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('visuals/effect_sizes.png', dpi=300, bbox_inches='tight')
+    save_chart('effect_sizes.png', dpi=300, bbox_inches='tight')
+    plt.close()
+
+# 6. Forest Plot (random-effects meta-analysis)
+def create_forest_plot(data=None):
+    if data is None:
+        data = get_chart_data('effect_sizes')
+    labels, effects, variances = meta_analysis.from_chart_data(data)
+    pooled = meta_analysis.pool(effects, variances)
+    k = len(labels)
+    fig, ax = plt.subplots(figsize=(11, 1.2 * k + 3))
+    
+    # One row per study, top to bottom, then the fixed and random pooled rows
+    se = np.sqrt(variances)
+    y_pos = np.arange(k + 2)[::-1] + 1
+    study_y, fixed_y, random_y = y_pos[:k], y_pos[k], y_pos[k + 1]
+    weights = pooled['weights']
+    ax.errorbar(effects, study_y, xerr=1.96 * se, fmt='none', ecolor=colors['primary'],
+                elinewidth=2, capsize=4)
+    ax.scatter(effects, study_y, s=80 + 1200 * weights, marker='s', color=colors['accent'],
+               zorder=3)
+    
+    def diamond(center, low, high, y, color):
+        ax.fill([low, center, high, center], [y, y + 0.25, y, y - 0.25], color=color, zorder=3)
+    
+    diamond(pooled['fixed'], pooled['fixed'] - 1.96 * pooled['fixed_se'],
+            pooled['fixed'] + 1.96 * pooled['fixed_se'], fixed_y, colors['secondary'])
+    diamond(pooled['random'], pooled['random_low'], pooled['random_high'], random_y, colors['success'])
+    ax.hlines(random_y, pooled['prediction_low'], pooled['prediction_high'], color=colors['success'],
+              linestyle=':', linewidth=2, label='95% prediction interval')
+    ax.axvline(pooled['random'], color=colors['success'], linestyle='--', alpha=0.5, linewidth=1)
+    ax.axvline(0, color='gray', linewidth=1)
+    
+    # Estimate, interval and weight beside each row
+    x_text = max(pooled['prediction_high'], (effects + 1.96 * se).max()) + 0.05
+    for y, es, low, high, w in zip(study_y, effects, effects - 1.96 * se, effects + 1.96 * se, weights):
+        ax.text(x_text, y, f'{es:.2f} [{low:.2f}, {high:.2f}]   {w:.0%}', va='center', fontsize=10)
+    ax.text(x_text, fixed_y, f"{pooled['fixed']:.2f} [{pooled['fixed'] - 1.96 * pooled['fixed_se']:.2f}, "
+            f"{pooled['fixed'] + 1.96 * pooled['fixed_se']:.2f}]", va='center', fontsize=10)
+    ax.text(x_text, random_y, f"{pooled['random']:.2f} [{pooled['random_low']:.2f}, "
+            f"{pooled['random_high']:.2f}]   100%", va='center', fontsize=10, fontweight='bold')
+    
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels([label.replace('\n', ' ') for label in labels]
+                       + ['Fixed effect', 'Random effects (DerSimonian-Laird)'], fontsize=10)
+    ax.set_xlabel("Effect Size (Cohen's d) with 95% CI", fontsize=12, fontweight='bold')
+    ax.set_title('Meta-Analysis: Pooled Effect Across Studies', fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlim(min(0, pooled['prediction_low']) - 0.05, x_text + 0.45)
+    ax.set_ylim(0.3, k + 2.7)
+    ax.grid(axis='x', alpha=0.3)
+    ax.legend(loc='lower left', fontsize=9)
+    ax.text(0.99, 0.02, f"Heterogeneity: Q = {pooled['q']:.1f} (df = {int(pooled['df'])}, "
+            f"p = {pooled['p_q']:.2g}), I² = {pooled['i2']:.0%}, τ² = {pooled['tau2']:.4f}",
+            transform=ax.transAxes, ha='right', fontsize=9, style='italic', color='gray')
+    
+    plt.tight_layout()
+    save_chart('forest_plot.png', dpi=300, bbox_inches='tight')
     plt.close()
 
 # Generate all visualizations
@@ -220,6 +288,9 @@ if __name__ == '__main__':
     print("Generating Effect Sizes Chart...")
     create_effect_sizes_chart()
     
+    print("Generating Forest Plot...")
+    create_forest_plot()
+    
     print("\n✅ All visualizations generated successfully!")
     print("📁 Saved to: /visuals/ directory")
     print("\nGenerated files:")
@@ -228,3 +299,4 @@ if __name__ == '__main__':
     print("  - progress_timeline.png")
     print("  - cost_analysis.png")
     print("  - effect_sizes.png")
+    print("  - forest_plot.png")
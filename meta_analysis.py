@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Meta-analysis for EBM Dashboard
+Pools study effect sizes (Cohen's d) into the overall effect the
+effect-size chart and forest plot show:
+
+    fixed effect     θ_F = Σ w_i y_i / Σ w_i,          w_i = 1 / v_i
+    random effects   θ_R = Σ w*_i y_i / Σ w*_i,        w*_i = 1 / (v_i + τ²)
+
+with the DerSimonian-Laird between-study variance
+
+    τ² = max(0, (Q - (k-1)) / (Σw - Σw²/Σw)),   Q = Σ w_i (y_i - θ_F)²
+
+and heterogeneity reported as Q (with its χ² p-value), I² and τ².
+
+Every estimate is a handful of sums over studies, so pool() works on any
+stack of study subsets at once: a boolean mask (subsets × k) selects the
+studies in each row. Leave-one-out is the mask ~I and cumulative analysis
+the lower-triangular mask, so both are one vectorised call rather than k
+separate fits - hundreds of effects take milliseconds.
+
+Only rows of the effect_sizes spec with a sample size are studies; the
+others (N = 0) are shown on the chart but not pooled.
+
+Usage:
+    python meta_analysis.py [spec]          # pool the effect_sizes chart studies
+    python meta_analysis.py --simulate 500  # timing on synthetic effects
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+Z95 = stats.norm.ppf(0.975)
+
+
+def cohens_d_variance(d, n1, n2=None):
+    """Sampling variance of Cohen's d; with only a total N, groups are taken as equal halves"""
+    d = np.asarray(d, dtype='float64')
+    if n2 is None:
+        n1 = n2 = np.asarray(n1, dtype='float64') / 2
+    n1, n2 = np.asarray(n1, dtype='float64'), np.asarray(n2, dtype='float64')
+    return (n1 + n2) / (n1 * n2) + d ** 2 / (2 * (n1 + n2))
+
+
+def pool(effects, variances, mask=None):
+    """Fixed- and random-effects (DerSimonian-Laird) estimates for each row of `mask`
+
+    `effects` and `variances` hold k studies; `mask` (... × k, default all
+    studies) picks the studies pooled in each row. Returns a dict of arrays
+    shaped like mask without its last axis.
+    """
+    y = np.asarray(effects, dtype='float64')
+    v = np.asarray(variances, dtype='float64')
+    if y.shape != v.shape or y.ndim != 1:
+        raise ValueError("effects and variances must be 1-d arrays of the same length")
+    if np.any(v <= 0):
+        raise ValueError("variances must be positive")
+    mask = np.ones(y.shape, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+
+    w = np.where(mask, 1.0 / v, 0.0)
+    k = mask.sum(axis=-1)
+    sw = w.sum(axis=-1)
+    fixed = (w * y).sum(axis=-1) / sw
+    q = (w * (y - fixed[..., None]) ** 2).sum(axis=-1)
+    df = k - 1
+    c = sw - (w ** 2).sum(axis=-1) / sw
+    with np.errstate(invalid='ignore', divide='ignore'):
+        tau2 = np.where(c > 0, np.maximum(0.0, (q - df) / c), 0.0)
+        i2 = np.where(q > 0, np.maximum(0.0, (q - df) / q), 0.0)
+
+    w_star = np.where(mask, 1.0 / (v + tau2[..., None]), 0.0)
+    sw_star = w_star.sum(axis=-1)
+    random = (w_star * y).sum(axis=-1) / sw_star
+    random_se = np.sqrt(1.0 / sw_star)
+    with np.errstate(invalid='ignore'):
+        t_crit = stats.t.ppf(0.975, k - 2)  # NaN for fewer than 3 studies
+    prediction = t_crit * np.sqrt(tau2 + random_se ** 2)
+    return {
+        'k': k, 'fixed': fixed, 'fixed_se': np.sqrt(1.0 / sw),
+        'random': random, 'random_se': random_se,
+        'random_low': random - Z95 * random_se, 'random_high': random + Z95 * random_se,
+        'prediction_low': random - prediction, 'prediction_high': random + prediction,
+        'q': q, 'df': df, 'p_q': stats.chi2.sf(q, np.maximum(df, 1)), 'i2': i2, 'tau2': tau2,
+        'weights': w_star / sw_star[..., None],
+    }
+
+
+def leave_one_out(effects, variances, labels=None):
+    """Pooled estimates with each study omitted in turn"""
+    k = len(effects)
+    result = pool(effects, variances, ~np.eye(k, dtype=bool))
+    return pd.DataFrame({name: result[name] for name in
+                         ('random', 'random_low', 'random_high', 'tau2', 'i2')},
+                        index=pd.Index(labels if labels is not None else range(k), name='omitted'))
+
+
+def cumulative(effects, variances, labels=None):
+    """Pooled estimates as studies are added in the given order"""
+    k = len(effects)
+    result = pool(effects, variances, np.tril(np.ones((k, k), dtype=bool)))
+    return pd.DataFrame({name: result[name] for name in
+                         ('k', 'random', 'random_low', 'random_high', 'tau2', 'i2')},
+                        index=pd.Index(labels if labels is not None else range(k), name='added'))
+
+
+def from_chart_data(data):
+    """(labels, effects, variances) for the studies in an effect_sizes spec entry (rows with N > 0)"""
+    rows = [i for i, n in enumerate(data['sample_sizes']) if n > 0]
+    effects = np.asarray([data['effect_sizes'][i] for i in rows], dtype='float64')
+    sizes = [data['sample_sizes'][i] for i in rows]
+    return [data['relationships'][i] for i in rows], effects, cohens_d_variance(effects, sizes)
+
+
+def describe(data):
+    """One-line summary of the pooled estimate, for dashboard captions"""
+    _, effects, variances = from_chart_data(data)
+    result = pool(effects, variances)
+    return (f"Random-effects pooled estimate d={result['random']:.2f} "
+            f"[{result['random_low']:.2f}, {result['random_high']:.2f}] across {int(result['k'])} studies, "
+            f"heterogeneity I²={result['i2']:.0%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Random-effects meta-analysis of the effect-size studies')
+    parser.add_argument('spec', nargs='?', default=None, help='chart spec (default: chart_data.json)')
+    parser.add_argument('--simulate', type=int, default=None, metavar='K',
+                        help='time pooling, leave-one-out and cumulative runs on K synthetic effects')
+    args = parser.parse_args(argv)
+
+    if args.simulate:
+        rng = np.random.default_rng(0)
+        variances = 4 / rng.integers(50, 5000, args.simulate)
+        effects = rng.normal(0.5, 0.15, args.simulate) + rng.normal(0, np.sqrt(variances))
+        started = time.perf_counter()
+        result = pool(effects, variances)
+        leave_one_out(effects, variances)
+        cumulative(effects, variances)
+        elapsed = time.perf_counter() - started
+        print(f"✓ {args.simulate:,} effects: θ_R = {result['random']:.3f}, τ² = {result['tau2']:.4f} "
+              f"(true 0.5, 0.0225); pooled + leave-one-out + cumulative in {elapsed * 1000:.1f} ms")
+        return 0
+
+    from chart_data import ChartDataError, get_chart_data
+
+    try:
+        labels, effects, variances = from_chart_data(get_chart_data('effect_sizes', args.spec))
+        result = pool(effects, variances)
+    except (ChartDataError, ValueError) as e:
+        print(f"✗ {e}")
+        return 1
+    labels = [label.replace('\n', ' ') for label in labels]
+    print(f"✓ {int(result['k'])} studies")
+    print(f"   fixed effect     d = {result['fixed']:.3f} (SE {result['fixed_se']:.3f})")
+    print(f"   random effects   d = {result['random']:.3f} "
+          f"[{result['random_low']:.3f}, {result['random_high']:.3f}], "
+          f"prediction [{result['prediction_low']:.3f}, {result['prediction_high']:.3f}]")
+    print(f"   heterogeneity    Q = {result['q']:.1f} (df {int(result['df'])}, p = {result['p_q']:.3g}), "
+          f"I² = {result['i2']:.0%}, τ² = {result['tau2']:.4f}")
+    print("\nLeave-one-out:")
+    print(leave_one_out(effects, variances, labels).to_string(float_format='%.3f'))
+    print("\nCumulative:")
+    print(cumulative(effects, variances, labels).to_string(float_format='%.3f'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Optimize dashboard PNGs after rendering
+Recompresses visuals/*.png in parallel (lossless by default, optional
+256-colour palette quantization), prints a before/after byte report and
+fails when any image is over the size budget
+"""
+
+import argparse
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+DEFAULT_BUDGET_KB = 512
+
+
+def optimize_png(path, quantize=False):
+    """Recompress one PNG in place; returns (path, bytes_before, bytes_after)"""
+    path = Path(path)
+    before = path.stat().st_size
+
+    with Image.open(path) as img:
+        img.load()
+        info = {'dpi': img.info['dpi']} if 'dpi' in img.info else {}
+
+        # matplotlib writes RGBA even for opaque figures - drop the unused alpha
+        if img.mode == 'RGBA' and img.getchannel('A').getextrema() == (255, 255):
+            img = img.convert('RGB')
+
+        if img.mode in ('RGB', 'L') and img.getcolors(256) is not None:
+            # Few enough colours for an exact palette (still lossless)
+            img = img.quantize(256, method=Image.Quantize.FASTOCTREE)
+        elif quantize and img.mode == 'RGB':
+            img = img.quantize(256, method=Image.Quantize.MEDIANCUT)
+
+        buf = io.BytesIO()
+        img.save(buf, 'PNG', optimize=True, **info)
+
+    data = buf.getvalue()
+    if len(data) < before:
+        path.write_bytes(data)
+        return str(path), before, len(data)
+    return str(path), before, before
+
+
+def optimize_directory(directory='visuals', quantize=False, workers=None):
+    """Optimize every PNG in a directory using a process pool"""
+    paths = sorted(Path(directory).glob('*.png'))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(optimize_png, paths, [quantize] * len(paths)))
+    return results
+
+
+def print_report(results, budget_kb=DEFAULT_BUDGET_KB):
+    """Print the before/after table; returns the files over budget"""
+    over_budget = []
+    total_before = sum(before for _, before, _ in results)
+    total_after = sum(after for _, _, after in results)
+
+    print(f"{'File':<45} {'Before':>10} {'After':>10} {'Saved':>7}")
+    print("-" * 75)
+    for path, before, after in results:
+        saved = (1 - after / before) * 100 if before else 0
+        flag = ''
+        if after > budget_kb * 1024:
+            over_budget.append(path)
+            flag = '  ✗ over budget'
+        print(f"{Path(path).name:<45} {before/1024:>8.0f}KB {after/1024:>8.0f}KB {saved:>6.1f}%{flag}")
+    print("-" * 75)
+    if total_before:
+        print(f"{'TOTAL':<45} {total_before/1024:>8.0f}KB {total_after/1024:>8.0f}KB "
+              f"{(1 - total_after / total_before) * 100:>6.1f}%")
+    return over_budget
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Recompress dashboard PNGs')
+    parser.add_argument('directory', nargs='?', default='visuals')
+    parser.add_argument('--quantize', action='store_true',
+                        help='palette-quantize to 256 colours (lossy, much smaller)')
+    parser.add_argument('--budget-kb', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f'fail if any PNG is larger than this (default {DEFAULT_BUDGET_KB})')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    print(f"\n🗜️  Optimizing PNGs in {args.directory}/ "
+          f"({'palette-quantized' if args.quantize else 'lossless'})...\n")
+    results = optimize_directory(args.directory, args.quantize, args.workers)
+    over_budget = print_report(results, args.budget_kb)
+
+    if over_budget:
+        print(f"\n✗ {len(over_budget)} image(s) exceed the {args.budget_kb} KB budget")
+        return 1
+    print(f"\n✓ All {len(results)} images within the {args.budget_kb} KB budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
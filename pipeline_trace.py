@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Stage tracing for the EBM analysis pipeline
+Records wall time, CPU time, row counts and (optionally) tracemalloc peak
+memory for each pipeline stage and exports them as a Chrome trace-event
+file (open in chrome://tracing or https://ui.perfetto.dev) and a compact
+JSON summary.
+
+Usage:
+    tracer = StageTracer('data_analysis')
+    with tracer.stage('merge') as span:
+        merged_df = merge(...)
+        span['rows'] = len(merged_df)
+    tracer.write('analysis_output')
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+TRACE_FILE = 'pipeline_trace.json'
+SUMMARY_FILE = 'pipeline_summary.json'
+
+
+class StageTracer:
+    """Collects timed spans; stages may nest (e.g. figures inside 'visualize')"""
+
+    def __init__(self, name='pipeline', memory=False):
+        self.name = name
+        self.memory = memory
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._open = []  # running peak (bytes) of each open span, outermost first
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _fold_peak(self):
+        """Fold the peak since the last reset into every open span"""
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for i, running in enumerate(self._open):
+            self._open[i] = max(running, peak)
+
+    @contextmanager
+    def stage(self, name, category='stage'):
+        """Time a block; yields a dict for extra fields such as 'rows'"""
+        args = {}
+        depth = len(self._open)
+        if self.memory:
+            self._fold_peak()
+        self._open.append(0)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield args
+        finally:
+            wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            if self.memory:
+                self._fold_peak()
+                args['peak_kb'] = round(self._open[-1] / 1024, 1)
+            self._open.pop()
+            self.spans.append({
+                'name': name,
+                'category': category,
+                'depth': depth,
+                'start_s': wall_start - self._origin,
+                'wall_s': wall,
+                'cpu_s': cpu,
+                'args': args,
+            })
+
+    def chrome_trace(self):
+        """Spans as Chrome trace-event 'complete' (ph=X) events, in microseconds"""
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                   'args': {'name': self.name}}]
+        for span in sorted(self.spans, key=lambda s: (s['start_s'], s['depth'])):
+            events.append({
+                'name': span['name'],
+                'cat': span['category'],
+                'ph': 'X',
+                'ts': round(span['start_s'] * 1e6, 1),
+                'dur': round(span['wall_s'] * 1e6, 1),
+                'pid': pid,
+                'tid': tid,
+                'args': {'cpu_ms': round(span['cpu_s'] * 1000, 2), **span['args']},
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def summary(self):
+        """Top-level stages in run order plus their nested children"""
+        spans = sorted(self.spans, key=lambda s: (s['start_s'], s['depth']))
+        stages = [{
+            'name': s['name'],
+            'category': s['category'],
+            'depth': s['depth'],
+            'wall_ms': round(s['wall_s'] * 1000, 2),
+            'cpu_ms': round(s['cpu_s'] * 1000, 2),
+            **s['args'],
+        } for s in spans]
+        top = [s for s in spans if s['depth'] == 0]
+        return {
+            'pipeline': self.name,
+            'total_wall_ms': round(sum(s['wall_s'] for s in top) * 1000, 2),
+            'total_cpu_ms': round(sum(s['cpu_s'] for s in top) * 1000, 2),
+            'stages': stages,
+        }
+
+    def write(self, out_dir):
+        """Write the Chrome trace and JSON summary; returns both paths"""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        trace_path = out_dir / TRACE_FILE
+        summary_path = out_dir / SUMMARY_FILE
+        trace_path.write_text(json.dumps(self.chrome_trace()), encoding='utf-8')
+        summary_path.write_text(json.dumps(self.summary(), indent=2) + '\n', encoding='utf-8')
+        return trace_path, summary_path
+
+    def print_table(self):
+        print(f"\n⏱  Stage timings ({self.name}):")
+        print("-" * 80)
+        header = f"   {'Stage':<36} {'Wall ms':>10} {'CPU ms':>10} {'Rows':>8}"
+        print(header + (f" {'Peak KB':>10}" if self.memory else ''))
+        for s in self.summary()['stages']:
+            label = '  ' * s['depth'] + s['name']
+            rows = s.get('rows', '')
+            line = f"   {label:<36} {s['wall_ms']:>10.1f} {s['cpu_ms']:>10.1f} {rows:>8}"
+            print(line + (f" {s['peak_kb']:>10.0f}" if self.memory else ''))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Power analysis for EBM Dashboard
+Checks whether the pilot (pilot teams vs control teams, compared on
+12-month retention with a t-test on team retention rates) is big enough
+to detect the projected improvement. Power is estimated by simulation
+over a grid of pilot sizes, baseline retention rates and effects:
+
+    team retention p_j ~ Beta(mean p, intra-team correlation icc)
+    retained_j         ~ Binomial(team_size, p_j)
+    reject H0          ⇔ Welch t-test on team rates, two-sided p < alpha
+
+Each grid cell draws all its replicates as one replicates × teams array
+and tests them in a single vectorised call; cells are spread over worker
+processes. Every cell gets its own seed from one SeedSequence, so the
+results do not depend on the number of workers - and a grid is fully
+determined by its spec entry, so from_chart_data() caches it on disk
+under .cache/power keyed by the entry's digest.
+
+Usage:
+    python power_analysis.py [spec] [--replicates N] [--workers N] [--no-cache]
+"""
+
+import argparse
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+SEED = 0
+TARGET_POWER = 0.8
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.cache' / 'power'
+# Where the power curve chart keeps its grids (None recomputes, e.g. benchmark.py)
+CACHE_DIR = DEFAULT_CACHE_DIR
+
+
+def _team_rates(rng, employees, rate, team_size, icc, replicates):
+    """replicates × teams retention rates for one arm (employees rounded to whole teams)"""
+    teams = max(2, round(employees / team_size))
+    if icc > 0:
+        a, b = rate * (1 - icc) / icc, (1 - rate) * (1 - icc) / icc
+        rate = rng.beta(a, b, size=(replicates, teams))
+    return rng.binomial(team_size, rate, size=(replicates, teams)) / team_size
+
+
+def simulate_cell(args):
+    """Worker: share of replicates in which the pilot detects the effect"""
+    pilot, baseline, effect, team_size, icc, control_ratio, alpha, replicates, seed = args
+    rng = np.random.default_rng(seed)
+    treated = _team_rates(rng, pilot, baseline + effect, team_size, icc, replicates)
+    control = _team_rates(rng, pilot * control_ratio, baseline, team_size, icc, replicates)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-equal team rates give NaN, not a rejection
+        p_values = stats.ttest_ind(treated, control, axis=1, equal_var=False).pvalue
+    return float(np.mean(p_values < alpha))
+
+
+def power_grid(sample_sizes, baseline_rates, effects, team_size=5, icc=0.05, control_ratio=1.0,
+               alpha=0.05, replicates=2000, workers=None, seed=SEED):
+    """Simulated power for every (pilot size, baseline, effect) combination
+
+    Sizes are pilot-arm employees; the control arm has control_ratio times
+    as many. Returns one row per cell with the Monte Carlo standard error.
+    """
+    if not 0 <= icc < 1:
+        raise ValueError("icc must be in [0, 1)")
+    for p in baseline_rates:
+        for d in effects:
+            if not (0 < p < 1 and 0 < p + d < 1):
+                raise ValueError(f"retention rates must be strictly between 0 and 1 "
+                                 f"(baseline {p:g} + effect {d:g} = {p + d:g})")
+    cells = [(n, p, d) for p in baseline_rates for d in effects for n in sample_sizes]
+    seeds = np.random.SeedSequence(seed).spawn(len(cells))
+    jobs = [(n, p, d, team_size, icc, control_ratio, alpha, replicates, s)
+            for (n, p, d), s in zip(cells, seeds)]
+    if workers != 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            power = list(pool.map(simulate_cell, jobs, chunksize=max(1, len(jobs) // 32)))
+    else:
+        power = [simulate_cell(job) for job in jobs]
+
+    grid = pd.DataFrame(cells, columns=['pilot_size', 'baseline', 'effect'])
+    grid['control_size'] = (grid['pilot_size'] * control_ratio).round().astype(int)
+    grid['power'] = power
+    grid['mc_se'] = np.sqrt(grid['power'] * (1 - grid['power']) / replicates)
+    return grid[['pilot_size', 'control_size', 'baseline', 'effect', 'power', 'mc_se']]
+
+
+def required_size(grid, target=TARGET_POWER):
+    """Smallest simulated pilot size reaching `target` power per baseline and effect (NaN if none)"""
+    reached = grid[grid['power'] >= target]
+    sizes = reached.groupby(['baseline', 'effect'])['pilot_size'].min()
+    return sizes.reindex(pd.MultiIndex.from_frame(grid[['baseline', 'effect']].drop_duplicates()))
+
+
+def from_chart_data(data, workers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """Power grid for a pilot_power spec entry (cached by the entry's digest unless cache_dir is None)"""
+    from chart_data import chart_digest
+
+    path = Path(cache_dir) / f"{chart_digest(data)}-{SEED}.csv" if cache_dir else None
+    if path and path.exists():
+        return pd.read_csv(path, float_precision='round_trip')
+    grid = power_grid(data['sample_sizes'], data['baseline_rates'], data['effects'],
+                      data['team_size'], data['icc'], data['control_ratio'], data['alpha'],
+                      int(data['replicates']), workers)
+    if path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        grid.to_csv(path, index=False, float_format='%.17g')
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simulated power of the pilot evaluation design')
+    parser.add_argument('spec', nargs='?', default=None, help='chart spec (default: chart_data.json)')
+    parser.add_argument('--replicates', type=int, default=None, help='simulated pilots per grid cell')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    from chart_data import ChartDataError, get_chart_data
+
+    try:
+        data = get_chart_data('pilot_power', args.spec)
+        if args.replicates:
+            data['replicates'] = args.replicates
+        grid = from_chart_data(data, args.workers, None if args.no_cache else DEFAULT_CACHE_DIR)
+    except (ChartDataError, ValueError) as e:
+        print(f"✗ {e}")
+        return 1
+
+    planned = data['planned_size']
+    print(f"✓ {len(grid)} grid cells × {int(data['replicates']):,} simulated pilots "
+          f"(teams of {data['team_size']}, ICC {data['icc']}, control {data['control_ratio']:g}× pilot)")
+    table = grid.pivot_table(index='pilot_size', columns=['baseline', 'effect'], values='power')
+    print(table.to_string(float_format='%.2f'))
+    print(f"\nPilot size for {TARGET_POWER:.0%} power (planned: {planned} employees):")
+    for (baseline, effect), size in required_size(grid).items():
+        needed = f"{int(size)}" if pd.notna(size) else f"> {max(data['sample_sizes'])}"
+        print(f"   baseline {baseline:.0%}, +{effect * 100:.0f} pts: {needed}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Build-time pre-rendering of content/*.txt for EBM Dashboard
+Renders each content file with the same rules content-loader.js applies in
+the browser (processContent / processMarkdown / wrapConsecutiveLists) and
+injects the HTML into its container in index.html. The result is written to
+dist/ with the assets the page references, so the published page makes no
+content requests and does no client-side parsing.
+
+Pre-rendered containers carry data-prerendered="<file>"; content-loader.js
+skips those and only fetches files that were missing at build time.
+Containers and their '#' / '##' headings carry the ids that the search
+index (search_index.py) uses as section anchors.
+Figures quoted in captions (<span data-stat="name">) are recomputed from
+the chart data by fill_stats(), so they always match the rendered charts.
+
+Usage:
+    python prerender_content.py [--out dist] [--check]
+"""
+
+import argparse
+import html
+import re
+import shutil
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+CONTENT_DIR = ROOT / 'content'
+INDEX = ROOT / 'index.html'
+DIST_DIR = ROOT / 'dist'
+
+# Copied next to the rendered page so dist/ is self-contained
+STATIC_ASSETS = ['content-loader.js', 'search-client.js', 'logic-model.html', 'visuals', 'content']
+
+# Same list and order as content-loader.js
+CONTENT_FILES = [
+    'ask-problem-definition.txt', 'ask-stakeholder-analysis.txt', 'ask-success-criteria.txt',
+    'evidence-scientific-methods.txt', 'evidence-scientific-sources.txt', 'evidence-scientific-appraisal.txt',
+    'evidence-practitioner-methods.txt', 'evidence-practitioner-sources.txt', 'evidence-practitioner-appraisal.txt',
+    'evidence-organizational-methods.txt', 'evidence-organizational-sources.txt', 'evidence-organizational-appraisal.txt',
+    'evidence-stakeholder-methods.txt', 'evidence-stakeholder-sources.txt', 'evidence-stakeholder-appraisal.txt',
+    'synthesis-integration.txt', 'application-implementation.txt', 'assessment-monitoring.txt',
+]
+
+EMPTY_HTML = ('<div style="font-family: inherit; line-height: 1.6; color: #999; font-style: italic;">'
+              'Content file is empty. Add your content to see it here.</div>')
+
+# JavaScript's '.' excludes all four line terminators and its multiline
+# '^' / '$' break at each of them; Python's '.' and re.M only know '\n'
+_TERMINATORS = r'\n\r\u2028\u2029'
+_DOT = rf'[^{_TERMINATORS}]'
+_BOL = rf'(?:\A|(?<=[{_TERMINATORS}]))'
+_EOL = rf'(?=[{_TERMINATORS}]|\Z)'
+
+# String.prototype.trim(): unlike str.strip() it removes a BOM but not \x1c-\x1f / \x85
+_JS_WHITESPACE = ('\t\n\v\f\r \xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006'
+                  '\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff')
+
+# (pattern, marker) pairs applied before escaping, in processMarkdown order
+_MARKERS = [
+    (re.compile(rf'{_BOL}#### ({_DOT}*){_EOL}'), r'###HEADER4###\1###HEADER4###'),
+    (re.compile(rf'{_BOL}### ({_DOT}*){_EOL}'), r'###HEADER3###\1###HEADER3###'),
+    (re.compile(rf'{_BOL}## ({_DOT}*){_EOL}'), r'###HEADER2###\1###HEADER2###'),
+    (re.compile(rf'{_BOL}# ({_DOT}*){_EOL}'), r'###HEADER1###\1###HEADER1###'),
+    (re.compile(rf'\*\*({_DOT}*?)\*\*'), r'###BOLD###\1###BOLD###'),
+    (re.compile(r'(?<!\*)\*([^*\n]+?)\*(?!\*)'), r'###ITALIC###\1###ITALIC###'),
+    (re.compile(rf'{_BOL}- ({_DOT}*){_EOL}'), r'###LISTITEM###\1###LISTITEM###'),
+    (re.compile(rf'{_BOL}([0-9]+)\. ({_DOT}*){_EOL}'), r'###NUMITEM###\2###NUMITEM###'),
+]
+
+_LI = '<li style="margin: 5px 0; padding-left: 5px;">'
+_TAGS = [
+    ('HEADER1', '<h3 style="color: #2c3e50; margin-top: 20px; margin-bottom: 10px; font-weight: 600;">', '</h3>'),
+    ('HEADER2', '<h4 style="color: #34495e; margin-top: 15px; margin-bottom: 8px; font-weight: 600;">', '</h4>'),
+    ('HEADER3', '<h5 style="color: #7f8c8d; margin-top: 10px; margin-bottom: 5px; font-weight: 600;">', '</h5>'),
+    ('HEADER4', '<h6 style="color: #95a5a6; margin-top: 8px; margin-bottom: 3px; font-weight: 600; font-size: 0.9em;">', '</h6>'),
+    ('BOLD', '<strong style="font-weight: 600;">', '</strong>'),
+    ('ITALIC', '<em style="font-style: italic;">', '</em>'),
+    ('LISTITEM', _LI, '</li>'),
+    ('NUMITEM', _LI, '</li>'),
+]
+_TAG_PATTERNS = [(re.compile(rf'###{name}###({_DOT}*?)###{name}###'), open_tag, close_tag)
+                 for name, open_tag, close_tag in _TAGS]
+
+_LIST_RUN = re.compile(r'(<li[^>]*>.*?</li>(?:\s*<br>)*)+', re.S)
+_LIST_BREAK = re.compile(r'\s*<br>\s*(?=<li|\Z)')
+
+# Rendered '#' / '##' headings - the sections search_index.py links to
+_HEADING = re.compile('|'.join(re.escape(open_tag) for name, open_tag, _ in _TAGS
+                               if name in ('HEADER1', 'HEADER2')))
+
+# A content-file-preview container and the first <pre> inside it
+_CONTAINER = re.compile(
+    r'<div class="content-file-preview" onclick="openContentFile\(\'(?P<file>[^\']+)\'\)">'
+    r'(?P<head>.*?<pre\b[^>]*>)(?P<body>.*?)</pre>', re.S)
+
+# A caption figure computed at build time: <span data-stat="name">...</span>
+_STAT = re.compile(r'(?P<open><span data-stat="(?P<name>[\w-]+)">)[^<]*</span>')
+
+
+def escape_html(text):
+    """Equivalent of the loader's textContent → innerHTML round trip"""
+    return html.escape(text, quote=False).replace('\xa0', '&nbsp;')
+
+
+def escape_and_wrap(content):
+    return ('<div style="font-family: inherit; line-height: 1.6; color: #333; white-space: pre-wrap;">'
+            f'{escape_html(content)}</div>')
+
+
+def wrap_consecutive_lists(content):
+    def wrap(match):
+        clean_list = _LIST_BREAK.sub('', match.group(0))
+        list_tag = 'ol' if 'list-style-type: decimal' in match.group(0) else 'ul'
+        return (f'<{list_tag} style="margin: 10px 0; padding-left: 25px; list-style-position: outside;">'
+                f'{clean_list}</{list_tag}>')
+    return _LIST_RUN.sub(wrap, content)
+
+
+def process_markdown(content):
+    for pattern, marker in _MARKERS:
+        content = pattern.sub(marker, content)
+
+    content = escape_html(content)
+
+    for pattern, open_tag, close_tag in _TAG_PATTERNS:
+        content = pattern.sub(lambda m: f'{open_tag}{m.group(1)}{close_tag}', content)
+    content = content.replace('\n\n', '<br><br>').replace('\n', '<br>')
+
+    content = wrap_consecutive_lists(content)
+
+    return f'<div style="font-family: inherit; line-height: 1.6; color: #333; word-wrap: break-word;">{content}</div>'
+
+
+def process_content(content, filename):
+    """Render one content file exactly as content-loader.js would"""
+    content = content.strip(_JS_WHITESPACE)
+
+    if not content:
+        return EMPTY_HTML
+
+    # HTML passes through unless it carries script-capable markup
+    if '<' in content and any(tag in content for tag in ('<div', '<table', '<h', '<p')):
+        if any(unsafe in content for unsafe in ('<script', '<iframe', 'javascript:')):
+            print(f"⚠️  Potentially unsafe HTML in {filename}, treating as plain text")
+            return escape_and_wrap(content)
+        return content
+
+    try:
+        return process_markdown(content)
+    except re.error as e:
+        print(f"⚠️  Markdown processing failed for {filename}: {e}")
+        return escape_and_wrap(content)
+
+
+def add_heading_ids(rendered, filename, text):
+    """Give the rendered section headings the ids the search index links to"""
+    from search_index import heading_ids  # search_index imports this module
+    ids = heading_ids(filename, text)
+    if len(_HEADING.findall(rendered)) != len(ids):
+        return rendered  # HTML content or a header the two parsers disagree on
+    ids = iter(ids)
+    return _HEADING.sub(lambda m: m.group(0).replace(' ', f' id="{next(ids)}" ', 1), rendered)
+
+
+def prerender(page, content_dir=CONTENT_DIR):
+    """Inject rendered content into page; returns (html, rendered file names)"""
+    rendered = []
+
+    def fill(match):
+        filename = match.group('file')
+        path = Path(content_dir) / filename
+        if filename not in CONTENT_FILES or not path.exists():
+            return match.group(0)  # leave it to the runtime loader
+        text = path.read_text(encoding='utf-8')
+        body = add_heading_ids(process_content(text, filename), filename, text)
+        rendered.append(filename)
+        return (f'<div class="content-file-preview" id="{Path(filename).stem}" style="cursor: default;" '
+                f'title="Content loaded from {filename}" data-prerendered="{filename}">'
+                f'{match.group("head")}{body}</pre>')
+
+    return _CONTAINER.sub(fill, page), rendered
+
+
+def _stat_values():
+    """{data-stat name: function returning its text}"""
+    import bayesian_updating
+    import meta_analysis
+    from chart_data import get_chart_data
+    return {
+        'meta-analysis': lambda: meta_analysis.describe(get_chart_data('effect_sizes')),
+        'bayesian-journey': lambda: bayesian_updating.describe(get_chart_data('bayesian_journey')),
+    }
+
+
+def fill_stats(page):
+    """Replace every data-stat caption with its value computed from the chart data"""
+    values = _stat_values()
+
+    def fill(match):
+        name = match.group('name')
+        if name not in values:
+            return match.group(0)
+        return f'{match.group("open")}{html.escape(values[name]())}</span>'
+
+    return _STAT.sub(fill, page)
+
+
+def copy_assets(out_dir):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name in STATIC_ASSETS:
+        src, dest = ROOT / name, out_dir / name
+        if src.is_dir():
+            shutil.copytree(src, dest, dirs_exist_ok=True)
+        elif src.exists():
+            shutil.copy2(src, dest)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pre-render content/*.txt into the dashboard')
+    parser.add_argument('--out', default=str(DIST_DIR), help='output directory (default: dist)')
+    parser.add_argument('--check', action='store_true',
+                        help='only report which content files would be rendered')
+    args = parser.parse_args(argv)
+
+    page, rendered = prerender(fill_stats(INDEX.read_text(encoding='utf-8')))
+    missing = [f for f in CONTENT_FILES if f not in rendered]
+
+    print(f"\n▶ Pre-rendered {len(rendered)}/{len(CONTENT_FILES)} content files")
+    for filename in missing:
+        print(f"  - {filename}: no file or container, left to content-loader.js")
+    if args.check:
+        return 0
+
+    out_dir = Path(args.out)
+    copy_assets(out_dir)
+    (out_dir / 'index.html').write_text(page, encoding='utf-8')
+    print(f"✓ Saved: {out_dir / 'index.html'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
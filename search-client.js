@@ -0,0 +1,151 @@
+(function() {
+    // Browser client for the static search index built by search_index.py.
+    // Scores are precomputed BM25 weights, so a query only sums posting lists.
+    //
+    //   const index = await EBMSearch.load('search-index.json');
+    //   index.search('manager training effect size', 10);
+    //   // → [{file, anchor, title, line, score}, ...]
+
+    const WEIGHT_SCALE = 1000;
+
+    // Must match STOPWORDS / tokenize() in search_index.py
+    const STOPWORDS = new Set((
+        'a an and are as at be but by for from has have in is it its of on or that the ' +
+        'this to was were will with i my we our you your they their he she not no'
+    ).split(' '));
+
+    function tokenize(text) {
+        const folded = text.toLowerCase().replace(/(?<=[0-9]),(?=[0-9]{3}(?![0-9]))/g, '');
+        return (folded.match(/[a-z0-9]+(?:\.[0-9]+)*/g) || []).filter(t => !STOPWORDS.has(t));
+    }
+
+    function SearchIndex(index) {
+        this.docs = index.docs;
+        this.postings = new Map();
+        for (const [term, flat] of Object.entries(index.terms)) {
+            const docIds = new Int32Array(flat.length / 2);
+            const weights = new Int32Array(flat.length / 2);
+            let docId = 0;
+            for (let i = 0; i < flat.length; i += 2) {
+                docId += flat[i];
+                docIds[i / 2] = docId;
+                weights[i / 2] = flat[i + 1];
+            }
+            this.postings.set(term, { docIds, weights });
+        }
+    }
+
+    SearchIndex.prototype.search = function(query, limit = 10) {
+        const scores = new Map();
+        for (const term of new Set(tokenize(query))) {
+            const posting = this.postings.get(term);
+            if (!posting) continue;
+            for (let i = 0; i < posting.docIds.length; i++) {
+                const docId = posting.docIds[i];
+                scores.set(docId, (scores.get(docId) || 0) + posting.weights[i]);
+            }
+        }
+        return Array.from(scores)
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([docId, score]) => {
+                const [file, anchor, title, line] = this.docs[docId];
+                return { file, anchor, title, line, score: Math.round(score) / WEIGHT_SCALE };
+            });
+    };
+
+    window.EBMSearch = {
+        tokenize,
+        async load(url = 'search-index.json') {
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`Search index unavailable (HTTP ${response.status})`);
+            }
+            const index = new SearchIndex(await response.json());
+            console.log(`🔎 Search index ready: ${index.docs.length} sections, ${index.postings.size} terms`);
+            return index;
+        }
+    };
+
+    // Dashboard search box (#content-search): the index is fetched on first
+    // use; picking a result switches to the section's tab and scrolls to it.
+    // Pre-rendered pages carry the anchors as heading ids; content loaded at
+    // runtime has none, so the file's container is the fallback target.
+    function sectionElement(file, anchor) {
+        return document.getElementById(anchor) ||
+            document.querySelector(`.content-file-preview[data-prerendered="${file}"]`) ||
+            document.querySelector(`.content-file-preview[onclick*="'${file}'"]`);
+    }
+
+    function reveal(element) {
+        const panel = element.closest('.tab-panel');
+        if (panel && !panel.classList.contains('active') && typeof showTab === 'function') {
+            showTab(Number(panel.id.replace('tab-', '')));
+        }
+        element.scrollIntoView({ behavior: 'smooth', block: 'start' });
+    }
+
+    function message(list, text) {
+        const item = document.createElement('li');
+        item.textContent = text;
+        list.replaceChildren(item);
+    }
+
+    function mount(container) {
+        const input = container.querySelector('input');
+        const list = container.querySelector('ul');
+        let loading = null;
+
+        input.addEventListener('input', async () => {
+            const query = input.value.trim();
+            if (!query) {
+                list.replaceChildren();
+                return;
+            }
+            let index;
+            try {
+                loading = loading || window.EBMSearch.load(container.dataset.index);
+                index = await loading;
+            } catch (error) {
+                loading = null;
+                message(list, 'Search needs the built dashboard (python build_dashboard.py).');
+                console.warn(error);
+                return;
+            }
+            if (input.value.trim() !== query) return;  // a newer query is on its way
+
+            const results = index.search(query, 8);
+            if (!results.length) {
+                message(list, `No sections match "${query}".`);
+                return;
+            }
+            list.replaceChildren(...results.map(result => {
+                const item = document.createElement('li');
+                const link = document.createElement('a');
+                const source = document.createElement('small');
+                link.href = `#${result.anchor}`;
+                link.textContent = result.title;
+                source.textContent = `${result.file}, line ${result.line}`;
+                link.addEventListener('click', event => {
+                    const target = sectionElement(result.file, result.anchor);
+                    if (!target) return;
+                    event.preventDefault();
+                    reveal(target);
+                });
+                item.append(link, source);
+                return item;
+            }));
+        });
+    }
+
+    function init() {
+        const container = document.getElementById('content-search');
+        if (container) mount(container);
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init);
+    } else {
+        init();
+    }
+})();
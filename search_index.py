@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Full-text search index for the EBM Dashboard content files
+Splits each content/*.txt file into sections at its '#' / '##' headers,
+builds an inverted index over them and precomputes the BM25 weight of
+every (term, section) posting, so a query is a handful of dict lookups
+and additions - no raw text is scanned at query time.
+
+The index is one static JSON file shared by this module's query API and
+the browser client (search-client.js):
+
+    {"version": 1,
+     "docs":  [[file, anchor, title, line], ...],          # one per section
+     "terms": {term: [doc_delta, weight, doc_delta, weight, ...]}}
+
+Doc ids in a posting list are delta-encoded and weights are BM25 scores
+scaled by WEIGHT_SCALE and rounded to integers.
+
+Usage:
+    python search_index.py build [--out dist/search-index.json]
+    python search_index.py query "manager training effect size" [--limit N]
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from prerender_content import CONTENT_DIR, CONTENT_FILES, DIST_DIR
+
+INDEX_FILE = 'search-index.json'
+K1 = 1.2
+B = 0.75
+WEIGHT_SCALE = 1000
+
+STOPWORDS = frozenset('''
+a an and are as at be but by for from has have in is it its of on or that the
+this to was were will with i my we our you your they their he she not no
+'''.split())
+
+# Keep decimals ("0.67", "4.2m") together; "13,346" is folded to "13346" first
+_THOUSANDS = re.compile(r'(?<=[0-9]),(?=[0-9]{3}(?![0-9]))')
+_TOKEN = re.compile(r'[a-z0-9]+(?:\.[0-9]+)*')
+_SECTION_HEADER = re.compile(r'^(#{1,2}) (.*)$')
+_MARKUP = re.compile(r'\*\*|\*|`')
+
+
+def tokenize(text):
+    """Lowercased word/number tokens minus stopwords (mirrored in search-client.js)"""
+    text = _THOUSANDS.sub('', text.lower())
+    return [t for t in _TOKEN.findall(text) if t not in STOPWORDS]
+
+
+def slugify(title):
+    return re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-') or 'section'
+
+
+def split_sections(filename, text):
+    """[(anchor, title, line, body)] split at '#' and '##' headers
+
+    The anchor is the element id of the section in the pre-rendered page:
+    the file stem for text before the first header, "<stem>--<title slug>"
+    for a header (unique across the page, since ids are).
+    """
+    sections = []
+    stem = Path(filename).stem
+    title, line, body, used = stem.replace('-', ' ').title(), 1, [], set()
+    heading = False
+
+    def flush(force=False):
+        if force or any(part.strip() for part in body):
+            anchor = f"{stem}--{slugify(title)}" if heading else stem
+            if anchor in used:
+                anchor = f"{anchor}-{line}"
+            used.add(anchor)
+            sections.append((anchor, title, line, '\n'.join(body)))
+
+    for number, raw in enumerate(text.splitlines(), 1):
+        match = _SECTION_HEADER.match(raw)
+        if match:
+            flush()
+            title, line, body = _MARKUP.sub('', match.group(2)).strip(), number, [raw]
+            heading = True
+        else:
+            body.append(raw)
+    flush(force=not sections)
+    return sections
+
+
+def heading_ids(filename, text):
+    """Anchors of the '#' / '##' header sections, in document order"""
+    return [anchor for anchor, _, _, body in split_sections(filename, text)
+            if _SECTION_HEADER.match(body.split('\n', 1)[0])]
+
+
+def build_index(content_dir=CONTENT_DIR):
+    """Compute the index structure for every content file that exists"""
+    docs, term_freqs = [], []
+    for filename in CONTENT_FILES:
+        path = Path(content_dir) / filename
+        if not path.exists():
+            continue
+        for anchor, title, line, body in split_sections(filename, path.read_text(encoding='utf-8')):
+            docs.append([filename, anchor, title, line])
+            term_freqs.append(Counter(tokenize(body)))
+
+    n_docs = len(docs)
+    lengths = [sum(tf.values()) for tf in term_freqs]
+    avgdl = sum(lengths) / n_docs if n_docs else 0.0
+    df = Counter(term for tf in term_freqs for term in tf)
+
+    postings = {}
+    for doc_id, tf in enumerate(term_freqs):
+        norm = K1 * (1 - B + B * lengths[doc_id] / avgdl)
+        for term, freq in tf.items():
+            idf = math.log(1 + (n_docs - df[term] + 0.5) / (df[term] + 0.5))
+            weight = idf * freq * (K1 + 1) / (freq + norm)
+            postings.setdefault(term, []).append((doc_id, round(weight * WEIGHT_SCALE)))
+
+    terms = {}
+    for term in sorted(postings):
+        flat, previous = [], 0
+        for doc_id, weight in postings[term]:
+            flat += [doc_id - previous, weight]
+            previous = doc_id
+        terms[term] = flat
+    return {'version': 1, 'docs': docs, 'terms': terms}
+
+
+def write_index(index, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(index, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    return path
+
+
+class SearchIndex:
+    """Query API over a built index (postings decoded once at load)"""
+
+    def __init__(self, index):
+        self.docs = index['docs']
+        self.postings = {}
+        for term, flat in index['terms'].items():
+            doc_ids, doc_id = [], 0
+            for delta in flat[0::2]:
+                doc_id += delta
+                doc_ids.append(doc_id)
+            self.postings[term] = list(zip(doc_ids, flat[1::2]))
+
+    @classmethod
+    def load(cls, path=DIST_DIR / INDEX_FILE):
+        return cls(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def search(self, query, limit=10):
+        """Best sections for query as dicts (file, anchor, title, line, score)"""
+        scores = {}
+        for term in set(tokenize(query)):
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0) + weight
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [{'file': self.docs[d][0], 'anchor': self.docs[d][1], 'title': self.docs[d][2],
+                 'line': self.docs[d][3], 'score': round(score / WEIGHT_SCALE, 3)}
+                for d, score in best]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build or query the content search index')
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help='index content/*.txt')
+    build.add_argument('--out', default=str(DIST_DIR / INDEX_FILE))
+    query = sub.add_parser('query', help='search a built index')
+    query.add_argument('text')
+    query.add_argument('--index', default=str(DIST_DIR / INDEX_FILE))
+    query.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        index = build_index()
+        path = write_index(index, args.out)
+        print(f"✓ Indexed {len(index['docs'])} sections, {len(index['terms'])} terms "
+              f"→ {path} ({path.stat().st_size / 1024:.1f} KB)")
+        return 0
+
+    try:
+        index = SearchIndex.load(args.index)
+    except FileNotFoundError:
+        print(f"✗ No index at {args.index} - run: python search_index.py build")
+        return 1
+    start = time.perf_counter()
+    results = index.search(args.text, args.limit)
+    elapsed_us = (time.perf_counter() - start) * 1e6
+    print(f"{len(results)} result(s) in {elapsed_us:.0f} µs")
+    for r in results:
+        print(f"  {r['score']:7.3f}  {r['file']}#{r['anchor']}  (line {r['line']}) {r['title']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Seasonal decomposition for EBM Dashboard
+Splits monthly series into trend + seasonal + residual:
+
+    classical  centred 2×12 moving-average trend, seasonal index = mean
+               detrended value per calendar month (centred to sum to 0).
+               Every series in the panel is done in one pass - the moving
+               average is a single windowed matrix product and the monthly
+               indices a grouped mean over the whole T × K block.
+    stl        statsmodels STL (robust), one series per worker process.
+               Optional: falls back to classical when statsmodels is missing.
+
+Results are cached per series on disk, keyed by a hash of the method,
+period, dates and values, so re-running the analysis only decomposes
+series whose data changed.
+
+Usage:
+    python seasonal_adjustment.py [--method classical|stl] [--no-cache]
+"""
+
+import argparse
+import hashlib
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+METHODS = ('classical', 'stl')
+COMPONENTS = ('trend', 'seasonal', 'resid')
+PERIOD = 12
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.cache' / 'decomposition'
+
+
+def _phase(dates, period):
+    """Position in the seasonal cycle; calendar month for monthly data"""
+    months = pd.DatetimeIndex(dates).year * 12 + pd.DatetimeIndex(dates).month - 1
+    return np.asarray(months) % period
+
+
+def classical(values, phase, period=PERIOD):
+    """Additive classical decomposition of a T × K block; returns {component: T × K}"""
+    # Centred moving average: 2×12 for even periods, plain for odd
+    if period % 2 == 0:
+        weights = np.r_[0.5, np.ones(period - 1), 0.5] / period
+    else:
+        weights = np.ones(period) / period
+    half = len(weights) // 2
+    trend = np.full(values.shape, np.nan)
+    if len(values) >= len(weights):
+        windows = np.lib.stride_tricks.sliding_window_view(values, len(weights), axis=0)
+        trend[half:len(values) - half] = windows @ weights
+
+    detrended = values - trend
+    index = np.full((period, values.shape[1]), np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN months stay NaN
+        for p in range(period):
+            index[p] = np.nanmean(detrended[phase == p], axis=0)
+        index -= np.nanmean(index, axis=0)
+    seasonal = index[phase]
+    return {'trend': trend, 'seasonal': seasonal, 'resid': values - trend - seasonal}
+
+
+def _stl_one(args):
+    """Worker: STL of one series over its observed stretch"""
+    values, period = args
+    from statsmodels.tsa.seasonal import STL  # optional dependency
+
+    out = {name: np.full(len(values), np.nan) for name in COMPONENTS}
+    observed = np.flatnonzero(~np.isnan(values))
+    if len(observed) < 2 * period:
+        return out
+    stretch = slice(observed[0], observed[-1] + 1)
+    fit = STL(pd.Series(values[stretch]).interpolate().to_numpy(), period=period, robust=True).fit()
+    out['trend'][stretch], out['seasonal'][stretch] = fit.trend, fit.seasonal
+    out['resid'] = values - out['trend'] - out['seasonal']
+    return out
+
+
+def stl(values, period=PERIOD, workers=None):
+    """STL for each column of a T × K block, in parallel; returns {component: T × K}"""
+    jobs = [(values[:, k], period) for k in range(values.shape[1])]
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_stl_one, jobs))
+    else:
+        results = [_stl_one(job) for job in jobs]
+    return {name: np.column_stack([r[name] for r in results]) for name in COMPONENTS}
+
+
+def stl_available():
+    try:
+        import statsmodels.tsa.seasonal  # noqa: F401  optional dependency
+    except ImportError:
+        return False
+    return True
+
+
+class DecompositionCache:
+    """One .npz per decomposed series, keyed by method, period, dates and values"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(method, period, dates, values):
+        digest = hashlib.sha256(f"{method}:{period}".encode())
+        digest.update(pd.DatetimeIndex(dates).asi8.tobytes())
+        digest.update(np.ascontiguousarray(values, dtype='float64').tobytes())
+        return digest.hexdigest()[:24]
+
+    def get(self, key):
+        path = self.directory / f"{key}.npz"
+        if not path.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        with np.load(path) as data:
+            return {name: data[name] for name in COMPONENTS}
+
+    def put(self, key, components):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        np.savez(self.directory / f"{key}.npz", **components)
+
+
+def decompose(frame, method='classical', period=PERIOD, cache=None, workers=None):
+    """Decompose every column of a monthly frame; returns {component: DataFrame}
+
+    Cached series are loaded; the rest are decomposed together in one pass.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown decomposition method {method!r} (expected {', '.join(METHODS)})")
+    if method == 'stl' and not stl_available():
+        print("  (statsmodels not installed - using classical decomposition)")
+        method = 'classical'
+
+    values = frame.to_numpy(dtype='float64')
+    out = {name: np.full(values.shape, np.nan) for name in COMPONENTS}
+    keys = [cache.key(method, period, frame.index, values[:, k]) if cache else None
+            for k in range(values.shape[1])]
+    todo = []
+    for k, key in enumerate(keys):
+        cached = cache.get(key) if cache else None
+        if cached is None:
+            todo.append(k)
+        else:
+            for name in COMPONENTS:
+                out[name][:, k] = cached[name]
+
+    if todo:
+        block = values[:, todo]
+        if method == 'classical':
+            fresh = classical(block, _phase(frame.index, period), period)
+        else:
+            fresh = stl(block, period, workers)
+        for i, k in enumerate(todo):
+            for name in COMPONENTS:
+                out[name][:, k] = fresh[name][:, i]
+            if cache:
+                cache.put(keys[k], {name: fresh[name][:, i] for name in COMPONENTS})
+
+    return {name: pd.DataFrame(out[name], index=frame.index, columns=frame.columns)
+            for name in COMPONENTS}
+
+
+def adjusted(frame, components):
+    """Seasonally adjusted values (original minus the seasonal component)"""
+    return frame - components['seasonal']
+
+
+def seasonal_amplitude(components):
+    """Peak-to-trough size of each series' seasonal pattern"""
+    seasonal = components['seasonal']
+    return seasonal.max() - seasonal.min()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Decompose the monthly analysis series')
+    parser.add_argument('--method', choices=METHODS, default='classical')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    from data_analysis import load_jolts
+
+    frame = load_jolts().set_index('date')[['quits_rate']]
+    cache = None if args.no_cache else DecompositionCache()
+    components = decompose(frame, args.method, cache=cache)
+    amplitude = seasonal_amplitude(components)
+    for column in frame:
+        print(f"✓ {column}: seasonal amplitude {amplitude[column]:.3f}, "
+              f"residual std {components['resid'][column].std():.3f}")
+    if cache:
+        print(f"  cache: {cache.hits} hit(s), {cache.misses} miss(es) in {cache.directory}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Survey estimation for EBM Dashboard
+Weighted means with replicate-weight standard errors for respondent-level
+survey data (FEVS-style). The full-sample weight and the R replicate
+weights are one respondents × (1 + R) matrix W; per-group weighted totals
+for every weight column come from two sparse products,
+
+    Σw·x = G(a·x) @ W        Σw = G(a) @ W
+
+where G(v) is the groups × respondents indicator matrix carrying v and a
+marks respondents who answered. No replicate loop and no respondents ×
+replicates temporaries. The replicate means θ_r then give
+
+    jk1   var = (R-1)/R · Σ(θ_r - θ)²    (delete-one-group jackknife)
+    brr   var = 1/R · Σ(θ_r - θ)²        (balanced repeated replication)
+    fay   var = 1/(R(1-ρ)²) · Σ(θ_r - θ)²
+
+fevs_ingest.py accumulates the same totals chunk by chunk; survey_means()
+does it in one pass for frames that fit in memory.
+
+Usage:
+    python survey_estimation.py data/fevs_fixture.csv [--by YEAR AGENCY] [--method jk1]
+"""
+
+import argparse
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+METHODS = ('jk1', 'brr', 'fay')
+REPLICATE_PATTERN = re.compile(r'^REPWT([0-9]+)$')
+
+
+def replicate_columns(columns, pattern=REPLICATE_PATTERN):
+    """Replicate weight columns in replicate order (REPWT1, REPWT2, ..., REPWT10)"""
+    found = [(int(m.group(1)), c) for c in columns if (m := pattern.match(str(c)))]
+    return [c for _, c in sorted(found)]
+
+
+def group_matrix(codes, n_groups, values):
+    """Sparse groups × respondents matrix with `values` at each respondent's group"""
+    n = len(codes)
+    return sparse.csr_matrix((values, (codes, np.arange(n))), shape=(n_groups, n))
+
+
+def weighted_totals(codes, n_groups, weights, scores):
+    """(Σw·x, Σw) over answering respondents, groups × weight columns
+
+    `weights` is respondents × (1 + R): the full-sample weight first, then
+    the replicates. NaN scores are unanswered and contribute to neither.
+    """
+    answered = ~np.isnan(scores)
+    wx = group_matrix(codes, n_groups, np.where(answered, scores, 0.0)) @ weights
+    w = group_matrix(codes, n_groups, answered.astype('float64')) @ weights
+    return wx, w
+
+
+def replicate_variance(estimate, replicates, method='jk1', rho=0.0):
+    """Variance of `estimate` (shape G) from its replicate estimates (G × R)"""
+    if method not in METHODS:
+        raise ValueError(f"unknown variance method {method!r} (expected {', '.join(METHODS)})")
+    r = replicates.shape[-1]
+    if r < 2:
+        raise ValueError("replicate variance needs at least 2 replicates")
+    factor = {'jk1': (r - 1) / r, 'brr': 1 / r, 'fay': 1 / (r * (1 - rho) ** 2)}[method]
+    return factor * np.nansum((replicates - estimate[..., None]) ** 2, axis=-1)
+
+
+def ratio_estimates(wx, w, method='jk1', rho=0.0):
+    """(means, standard errors) from totals whose first column is the full sample"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        theta = np.where(w > 0, wx / w, np.nan)
+    se = np.sqrt(replicate_variance(theta[:, 0], theta[:, 1:], method, rho)) if w.shape[1] > 1 else None
+    return theta[:, 0], se
+
+
+def survey_means(frame, by, scores, weight, replicates=None, method='jk1', rho=0.0):
+    """Weighted mean and replicate SE of each score column per `by` group"""
+    replicates = replicate_columns(frame.columns) if replicates is None else list(replicates)
+    codes, groups = pd.MultiIndex.from_frame(frame[list(by)]).factorize()
+    groups = groups.set_names(list(by))
+    W = frame[[weight, *replicates]].to_numpy(dtype='float64')
+    result = pd.DataFrame(index=groups)
+    result['respondents'] = np.bincount(codes, minlength=len(groups))
+    for column in scores:
+        values = pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype='float64')
+        mean, se = ratio_estimates(*weighted_totals(codes, len(groups), W, values), method, rho)
+        result[column] = mean
+        if se is not None:
+            result[f'{column}_se'] = se
+    return result.sort_index().reset_index()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Weighted means with replicate-weight standard errors')
+    parser.add_argument('file', help='respondent-level CSV with a weight and REPWT1..REPWTn columns')
+    parser.add_argument('--by', nargs='+', default=['YEAR', 'AGENCY'])
+    parser.add_argument('--scores', nargs='+', default=['Q52', 'Q70', 'Q71'])
+    parser.add_argument('--weight', default='POSTWT')
+    parser.add_argument('--method', choices=METHODS, default='jk1')
+    parser.add_argument('--rho', type=float, default=0.5, help="Fay's coefficient (--method fay)")
+    args = parser.parse_args(argv)
+
+    frame = pd.read_csv(args.file)
+    replicates = replicate_columns(frame.columns)
+    if not replicates:
+        print(f"✗ No replicate weight columns in {args.file}")
+        return 1
+    result = survey_means(frame, args.by, args.scores, args.weight, replicates, args.method, args.rho)
+    print(f"✓ {len(frame):,} respondents, {len(replicates)} replicates ({args.method})")
+    print(result.to_string(index=False, float_format='%.3f'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
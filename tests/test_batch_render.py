@@ -0,0 +1,47 @@
+import copy
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import batch_render
+import chart_data
+import chart_output
+
+UPDATED = [entry for entry in batch_render.BATCH_CHARTS if entry[3]]
+
+
+def _stretched(data, factor):
+    """Every numeric list scaled, so labels and bars overrun the template's layout"""
+    data = copy.deepcopy(data)
+    for field, value in data.items():
+        if isinstance(value, list) and value and all(isinstance(v, (int, float)) for v in value):
+            data[field] = [type(v)(v * factor) for v in value]
+    return data
+
+
+@pytest.fixture
+def low_dpi(monkeypatch):
+    monkeypatch.setattr(chart_output, 'OUTPUT_DIR', chart_output.OUTPUT_DIR)
+    monkeypatch.setattr(batch_render, '_TEMPLATES', {})
+    chart_output.set_dpi_override(40)
+    yield
+    chart_output.set_dpi_override(None)
+
+
+@pytest.mark.parametrize('factor', [1.6, 0.4])
+@pytest.mark.parametrize('entry', UPDATED, ids=[entry[1] for entry in UPDATED])
+def test_reused_figure_matches_fresh_render(entry, factor, low_dpi, tmp_path):
+    base = chart_data.load_chart_data(chart_data.DEFAULT_SPEC)['charts'][entry[2]]
+    department = _stretched(base, factor)
+
+    assert batch_render.render_chart_for(entry, base, tmp_path / 'template') == 'full'
+    assert batch_render.render_chart_for(entry, department, tmp_path / 'reused') == 'reused'
+    filename = batch_render._TEMPLATES[entry[1]][1]
+    batch_render._TEMPLATES.clear()
+    assert batch_render.render_chart_for(entry, department, tmp_path / 'fresh') == 'full'
+
+    reused = np.asarray(Image.open(tmp_path / 'reused' / filename))
+    fresh = np.asarray(Image.open(tmp_path / 'fresh' / filename))
+    assert reused.shape == fresh.shape
+    assert (reused == fresh).all()
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import bayesian_updating
+
+
+def test_posterior_sequence_multiplies_odds():
+    # 30% prior = 3:7 odds; × 3 = 9:7, × 2.5 = 22.5:7
+    result = bayesian_updating.posterior_sequence(0.3, [3, 2.5])
+    np.testing.assert_allclose(result, [0.3, 9 / 16, 22.5 / 29.5])
+
+
+def test_posterior_sequence_broadcasts_over_draws():
+    priors = np.array([0.2, 0.5])
+    ratios = np.array([[2.0, 4.0], [1.0, 0.5]])
+    result = bayesian_updating.posterior_sequence(priors, ratios)
+    for prior, row, expected in zip(priors, ratios, result):
+        np.testing.assert_allclose(bayesian_updating.posterior_sequence(prior, row), expected)
+
+
+def test_sensitivity_band_brackets_the_journey():
+    data = {'prior': 30, 'prior_strength': 20, 'sources': ['A', 'B'],
+            'likelihood_ratios': [3, 2], 'log_lr_se': [0.3, 0.3]}
+    result = bayesian_updating.journey(data, draws=5000)
+    assert all(low <= mid <= high for low, mid, high in
+               zip(result['low'], result['confidence'], result['high']))
+
+
+def test_rejects_invalid_inputs():
+    with pytest.raises(ValueError):
+        bayesian_updating.posterior_sequence(1.0, [2])
+    with pytest.raises(ValueError):
+        bayesian_updating.posterior_sequence(0.3, [0])
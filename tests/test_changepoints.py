@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+import changepoints
+
+
+def _penalised_cost(x, breaks, beta, scale):
+    edges = [0, *breaks, len(x)]
+    return sum(scale * np.sum((x[a:b] - x[a:b].mean()) ** 2) + beta
+               for a, b in zip(edges, edges[1:])) - beta
+
+
+def _optimal_partitioning(x, beta, min_size, scale):
+    """O(n²) exact search without pruning"""
+    n = len(x)
+    F = np.full(n + 1, np.inf)
+    F[0] = -beta
+    for t in range(min_size, n + 1):
+        for s in range(0, t - min_size + 1):
+            if s == 0 or s >= min_size:
+                seg = x[s:t]
+                F[t] = min(F[t], F[s] + scale * np.sum((seg - seg.mean()) ** 2) + beta)
+    return F[n]
+
+
+@pytest.mark.parametrize('min_size', [1, 3, 6, 7])
+def test_pelt_matches_brute_force(min_size):
+    rng = np.random.default_rng(min_size)
+    for _ in range(75):
+        n = int(rng.integers(2 * min_size, 60))
+        x = rng.normal(0, 1, n) + np.repeat(rng.normal(0, 2, 4), -(-n // 4))[:n]
+        beta = 2 * np.log(n)
+        scale = 1.0 / changepoints.noise_variance(x)
+        breaks = changepoints.pelt(x, beta, min_size)
+        assert all(b >= min_size and len(x) - b >= min_size for b in breaks)
+        assert np.diff([0, *breaks, n]).min() >= min_size
+        assert _penalised_cost(x, breaks, beta, scale) == pytest.approx(
+            _optimal_partitioning(x, beta, min_size, scale), abs=1e-8)
+
+
+def test_pelt_finds_planted_breaks():
+    rng = np.random.default_rng(0)
+    x = np.concatenate([rng.normal(m, 0.3, 40) for m in (0.0, 2.0, 0.5)])
+    assert changepoints.pelt(x) == [40, 80]
+
+
+def test_noise_variance_on_forward_filled_series():
+    rng = np.random.default_rng(1)
+    quarterly = np.concatenate([rng.normal(m, 0.2, 40) for m in (3.0, 4.0)])
+    monthly = np.repeat(quarterly, 3)
+    # Zero MAD (two of three differences are 0); σ² should be near 3 × 0.2²,
+    # not the overall variance, which includes the shift
+    assert 0.06 < changepoints.noise_variance(monthly) < 0.24 < np.var(monthly)
+    assert changepoints.pelt(monthly) == [120]
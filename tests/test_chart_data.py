@@ -0,0 +1,30 @@
+import copy
+
+import pytest
+
+import chart_data
+import generate_visuals
+
+
+@pytest.fixture
+def spec():
+    return copy.deepcopy(chart_data.load_chart_data(chart_data.DEFAULT_SPEC))
+
+
+def test_committed_spec_is_valid(spec):
+    assert chart_data.validate(spec) is spec
+
+
+@pytest.mark.parametrize('value', [-5, 120])
+def test_progress_completion_outside_0_100_is_rejected(spec, value):
+    spec['charts']['progress_timeline']['completion'][3] = value
+    with pytest.raises(chart_data.ChartDataError,
+                       match='progress_timeline.completion: expected percentages'):
+        chart_data.validate(spec)
+
+
+def test_passed_data_is_used_even_if_empty(monkeypatch):
+    monkeypatch.setattr(generate_visuals, 'get_chart_data',
+                        lambda chart: pytest.fail('spec loaded despite passed data'))
+    with pytest.raises(KeyError):
+        generate_visuals.create_evidence_quality_chart({})
@@ -0,0 +1,45 @@
+import copy
+import json
+
+import pytest
+
+import build_dashboard
+import chart_data
+import citation_db
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = citation_db.connect(tmp_path / 'citations.sqlite')
+    citation_db.extract(conn)
+    return conn
+
+
+@pytest.fixture
+def bad_spec(tmp_path, monkeypatch):
+    spec = copy.deepcopy(chart_data.load_chart_data(chart_data.DEFAULT_SPEC))
+    spec['charts']['scientific_studies']['sample_sizes'][2] = 50000  # Allen et al. (2010)
+    path = tmp_path / 'chart_data.json'
+    path.write_text(json.dumps(spec), encoding='utf-8')
+    monkeypatch.setenv('EBM_CHART_DATA', str(path))
+    chart_data.load_chart_data.cache_clear()
+    yield path
+    chart_data.load_chart_data.cache_clear()
+
+
+def test_committed_spec_matches_sources(conn):
+    checks = citation_db.check_charts(conn, chart_data.load_chart_data(chart_data.DEFAULT_SPEC))
+    assert len(checks) == 8
+    assert [label for label, value, row in checks if row is None or row['sample_size'] != value] == []
+
+
+def test_check_charts_reports_a_drifted_sample_size(conn, bad_spec):
+    checks = citation_db.check_charts(conn)
+    assert [(label, value, row['sample_size']) for label, value, row in checks
+            if row['sample_size'] != value] == [('Allen et al. (2010)', 50000, 4217)]
+    assert citation_db.main(['check-charts', '--db', str(bad_spec.with_suffix('.sqlite'))]) == 1
+
+
+def test_build_stops_on_a_drifted_sample_size(bad_spec, monkeypatch):
+    monkeypatch.setattr(build_dashboard, 'build_charts', lambda *a: pytest.fail('charts rendered'))
+    assert build_dashboard.main(['--data', str(bad_spec)]) == 1
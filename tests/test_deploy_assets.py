@@ -0,0 +1,109 @@
+import gzip
+import json
+import threading
+import urllib.request
+from functools import partial
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import deploy_assets
+from dev_server import DevHandler
+
+PAGE = ('<html><head><script src="content-loader.js"></script></head><body>'
+        '<img src="visuals/chart.png">' + '<p>dashboard text</p>' * 200 + '</body></html>')
+
+
+@pytest.fixture
+def dist(tmp_path):
+    (tmp_path / 'visuals').mkdir()
+    (tmp_path / 'index.html').write_text(PAGE, encoding='utf-8')
+    (tmp_path / 'visuals' / 'chart.png').write_bytes(b'\x89PNG fake image')
+    (tmp_path / 'content-loader.js').write_text('// loader\n' * 200, encoding='utf-8')
+    (tmp_path / 'search-client.js').write_text('// loaded by name\n' * 200, encoding='utf-8')
+    assert deploy_assets.main(['--dist', str(tmp_path)]) == 0
+    return tmp_path
+
+
+@pytest.fixture
+def server(dist):
+    manifest = deploy_assets.load_manifest(dist)
+    handler = type('Handler', (DevHandler,), {'manifest': manifest['files'], 'log_message': lambda *a: None})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(handler, directory=str(dist)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}', manifest
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(url, encoding=None):
+    request = urllib.request.Request(url, headers={'Accept-Encoding': encoding} if encoding else {})
+    with urllib.request.urlopen(request) as response:
+        return response.headers, response.read()
+
+
+def test_only_referenced_assets_are_hashed(dist):
+    manifest = deploy_assets.load_manifest(dist)
+    assert set(manifest['assets']) == {'visuals/chart.png', 'content-loader.js'}
+    assert (dist / 'search-client.js').exists()
+    page = (dist / 'index.html').read_text(encoding='utf-8')
+    assert manifest['assets']['visuals/chart.png'] in page
+    assert manifest['assets']['content-loader.js'] in page
+
+
+def test_server_sends_manifest_headers(server):
+    base, manifest = server
+    headers, body = _get(f"{base}/{manifest['assets']['visuals/chart.png']}")
+    assert headers['Cache-Control'] == deploy_assets.CACHE_IMMUTABLE
+    assert body == b'\x89PNG fake image'
+
+    headers, body = _get(f'{base}/index.html', 'gzip')
+    assert headers['Cache-Control'] == deploy_assets.CACHE_REVALIDATE
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['Vary'] == 'Accept-Encoding'
+    assert manifest['assets']['content-loader.js'] in gzip.decompress(body).decode('utf-8')
+
+    headers, _ = _get(f'{base}/index.html')
+    assert headers['Content-Encoding'] is None
+
+
+def test_unreferenced_script_is_served_by_name(server):
+    base, _ = server
+    headers, body = _get(f'{base}/search-client.js', 'gzip')
+    assert headers['Cache-Control'] == deploy_assets.CACHE_REVALIDATE
+    assert gzip.decompress(body).startswith(b'// loaded by name')
+
+
+def test_chart_with_smaller_svg_is_served_as_svg(tmp_path):
+    (tmp_path / 'visuals').mkdir()
+    (tmp_path / 'index.html').write_text('<img src="visuals/diagram.png"><img src="visuals/chart.png">',
+                                         encoding='utf-8')
+    for stem in ('diagram', 'chart'):
+        (tmp_path / 'visuals' / f'{stem}.png').write_bytes(b'\x89PNG' + b'\0' * 4000)
+    svg = '<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0"/></svg>'
+    (tmp_path / 'visuals' / 'diagram.svg').write_text(svg, encoding='utf-8')
+    (tmp_path / 'visuals' / 'format_report.json').write_text(json.dumps({
+        'diagram': {'png_bytes': 4004, 'svg_bytes': len(svg), 'chosen': 'svg'},
+        'chart': {'png_bytes': 4004, 'svg_bytes': 9000, 'chosen': 'png'},
+    }), encoding='utf-8')
+    assert deploy_assets.main(['--dist', str(tmp_path)]) == 0
+
+    manifest = deploy_assets.load_manifest(tmp_path)
+    assert set(manifest['assets']) == {'visuals/diagram.svg', 'visuals/chart.png'}
+    page = (tmp_path / 'index.html').read_text(encoding='utf-8')
+    assert manifest['assets']['visuals/diagram.svg'] in page
+    assert 'diagram.png' not in page
+
+    handler = type('Handler', (DevHandler,), {'manifest': manifest['files'], 'log_message': lambda *a: None})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(handler, directory=str(tmp_path)))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        headers, body = _get(f"http://127.0.0.1:{httpd.server_address[1]}/"
+                             f"{manifest['assets']['visuals/diagram.svg']}")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert headers['Content-Type'] == 'image/svg+xml'
+    assert headers['Cache-Control'] == deploy_assets.CACHE_IMMUTABLE
+    assert body.decode('utf-8') == svg
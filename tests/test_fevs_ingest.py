@@ -0,0 +1,59 @@
+import csv
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+import fevs_ingest
+from prerender_content import ROOT
+
+FIXTURE = ROOT / 'data' / 'fevs_fixture.csv'
+LEAVING_SCORES = {'A': 5.0, 'B': 1.0, 'C': 1.0, 'D': 1.0}
+
+
+def _expected():
+    """Respondents and weighted means per (year, agency) and year, row by row"""
+    counts, sums = defaultdict(int), defaultdict(lambda: [0.0, 0.0])
+    with open(FIXTURE, newline='') as f:
+        for row in csv.DictReader(f):
+            weight = float(row['POSTWT'])
+            for key in ((int(row['YEAR']), row['AGENCY']), (int(row['YEAR']), fevs_ingest.ALL_AGENCIES)):
+                counts[key] += 1
+                for metric, column in fevs_ingest.DEFAULT_ITEMS.items():
+                    answer = row[column].strip()
+                    if metric == 'intent_to_stay':
+                        score = LEAVING_SCORES.get(answer)
+                    else:
+                        score = float(answer) if answer in ('1', '2', '3', '4', '5') else None
+                    if score is not None:
+                        sums[key, metric][0] += weight * score
+                        sums[key, metric][1] += weight
+    return counts, {key: wx / w for key, (wx, w) in sums.items()}
+
+
+@pytest.mark.parametrize('chunk_rows', [fevs_ingest.CHUNK_ROWS, 97])
+def test_ingest_fixture_segments_and_means(chunk_rows):
+    by_agency, rows = fevs_ingest.ingest([FIXTURE], chunk_rows=chunk_rows)
+    counts, means = _expected()
+
+    assert rows == 720
+    assert len(by_agency) == 6 * 5  # 2019-2024 × (4 agencies + governmentwide)
+    table = by_agency.set_index(['year', 'agency'])
+    assert table['respondents'].to_dict() == counts
+    assert (table.loc[(slice(None), 'AG'), 'respondents'] == 30).all()
+    for (key, metric), mean in means.items():
+        assert table.loc[key, metric] == pytest.approx(mean, rel=1e-12), (key, metric)
+    assert table.filter(like='_se').gt(0).all().all()
+
+
+def test_governmentwide_rows_pool_agencies():
+    by_agency, _ = fevs_ingest.ingest([FIXTURE])
+    table = by_agency.set_index(['year', 'agency'])
+    agencies = table.drop(index=fevs_ingest.ALL_AGENCIES, level='agency')
+    overall = table.xs(fevs_ingest.ALL_AGENCIES, level='agency')
+    np.testing.assert_allclose(overall['weight'], agencies['weight'].groupby(level='year').sum())
+
+    national = fevs_ingest.governmentwide(by_agency)
+    assert national['year'].tolist() == list(range(2019, 2025))
+    assert (national['sample_size'] == 120).all()
+    np.testing.assert_allclose(national['pay_satisfaction'], overall['pay_satisfaction'])
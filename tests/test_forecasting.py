@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+import forecasting
+
+
+def _predict(name, x, ar, const=0.0, steps=4):
+    fitted = {'params': {'const': const, 'ar': ar}, 'sigma': 1.0}
+    return forecasting.predict(np.asarray(x, dtype='float64'), name, 12, fitted, steps)
+
+
+def test_ar2_psi_weights_known_answer():
+    # ψ_j = φ1 ψ_{j-1} + φ2 ψ_{j-2}: 1, 0.5, 0.5·0.5 + 0.3, 0.5·0.55 + 0.3·0.5
+    _, psi = _predict('arima(2,0,0)', [0.0, 0.0, 0.0], [0.5, 0.3])
+    np.testing.assert_allclose(psi, [1.0, 0.5, 0.55, 0.425])
+
+
+def test_arima110_point_and_psi_known_answer():
+    # Differences 1, 2 → next differences 1, 0.5, 0.25; ψ_j = (1 - φ^(j+1)) / (1 - φ)
+    point, psi = _predict('arima(1,1,0)', [0.0, 1.0, 3.0], [0.5], steps=3)
+    np.testing.assert_allclose(point, [4.0, 4.5, 4.75])
+    np.testing.assert_allclose(psi, [1.0, 1.5, 1.75])
+
+
+def test_intervals_widen_with_cumulative_psi():
+    lower, upper = forecasting.intervals(np.zeros(3), np.array([1.0, 1.5, 1.75]), sigma=2.0, level=0.95)
+    half = stats.norm.ppf(0.975) * 2.0 * np.sqrt([1.0, 3.25, 6.3125])
+    np.testing.assert_allclose(upper, half)
+    np.testing.assert_allclose(lower, -half)
+
+
+def test_arima_fit_recovers_ar1():
+    rng = np.random.default_rng(46)
+    x = np.zeros(5000)
+    for t in range(1, len(x)):
+        x[t] = 2.0 + 0.6 * x[t - 1] + rng.normal()
+    fitted = forecasting.fit(x, 'arima(1,0,0)')
+    assert fitted['params']['ar'][0] == pytest.approx(0.6, abs=0.03)
+    assert fitted['params']['const'] == pytest.approx(2.0, abs=0.15)
+    assert fitted['sigma'] == pytest.approx(1.0, abs=0.03)
+
+
+def test_series_too_short_for_any_candidate_falls_back_to_naive():
+    s = pd.Series([1.0, 3.0, 2.0], index=pd.date_range('2024-01-01', periods=3, freq='MS'))
+    summary, df = forecasting.forecast({'short': s}, horizon=3, workers=1)
+    assert summary['short']['model'] == 'naive' and summary['short']['holdout'] == 1
+    assert np.all(df['forecast'] == 2.0)
+
+
+@pytest.mark.parametrize('n', range(4, 9))
+def test_short_series_gets_a_holdout_and_finite_intervals(n):
+    x = np.arange(n) + np.sin(np.arange(n))
+    s = pd.Series(x, index=pd.date_range('2024-01-01', periods=n, freq='MS'))
+    summary, df = forecasting.forecast({'short': s}, horizon=3, workers=1)
+    assert summary['short']['holdout'] >= 1
+    assert np.isfinite(summary['short']['sigma'])
+    assert np.all(np.isfinite(df[['forecast', 'lower', 'upper']]))
+
+
+def test_too_short_series_is_a_clear_error():
+    s = pd.Series([1.0, 2.0], index=pd.date_range('2024-01-01', periods=2, freq='MS'))
+    with pytest.raises(ValueError, match='short: 2 observation'):
+        forecasting.forecast({'short': s}, horizon=3, workers=1)
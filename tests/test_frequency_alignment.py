@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import frequency_alignment
+
+QUARTERS = pd.DatetimeIndex(['2024-01-01', '2024-04-01'])
+MONTHS = pd.date_range('2024-01-01', '2024-06-01', freq='MS')
+
+# Quarter averages 0 and 3. Minimising Σ(Δy)² under the two constraints
+# gives differences a, 2a, 3a, 2a, a with a = 9/19 (Lagrange conditions by hand)
+DENTON = np.array([-12, -3, 15, 42, 60, 69]) / 19
+
+
+def test_denton_average_known_answer():
+    frame = pd.DataFrame({'level': [0.0, 3.0]}, index=QUARTERS)
+    monthly = frequency_alignment.align(frame, MONTHS, 'denton', freq='Q')
+    np.testing.assert_allclose(monthly['level'], DENTON, atol=1e-12)
+    np.testing.assert_allclose(monthly['level'].groupby(MONTHS.quarter).mean(), [0.0, 3.0], atol=1e-12)
+
+
+def test_denton_sum_reproduces_quarter_totals():
+    frame = pd.DataFrame({'flow': [0.0, 9.0]}, index=QUARTERS)
+    monthly = frequency_alignment.align(frame, MONTHS, 'denton', freq='Q', aggregation='sum')
+    np.testing.assert_allclose(monthly['flow'], DENTON, atol=1e-12)
+
+
+def test_denton_fills_partly_covered_quarters():
+    frame = pd.DataFrame({'level': [0.0, 3.0]}, index=QUARTERS)
+    monthly = frequency_alignment.align(frame, MONTHS[1:], 'denton', freq='Q')
+    np.testing.assert_allclose(monthly['level'], DENTON[1:], atol=1e-12)
+
+
+def test_linear_and_ffill_operators():
+    frame = pd.DataFrame({'x': [0.0, 3.0]}, index=QUARTERS)
+    np.testing.assert_allclose(frequency_alignment.align(frame, MONTHS, 'linear')['x'],
+                               [0, 1, 2, 3, np.nan, np.nan])
+    np.testing.assert_allclose(frequency_alignment.align(frame, MONTHS, 'ffill')['x'],
+                               [0, 0, 0, 3, np.nan, np.nan])
+
+
+def test_denton_needs_frequency():
+    with pytest.raises(ValueError, match='observation frequency'):
+        frequency_alignment.operator(QUARTERS, MONTHS, 'denton')
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import meta_analysis
+
+# BCG vaccine trials (Colditz et al., 1994): tpos, tneg, cpos, cneg
+BCG = np.array([
+    [4, 119, 11, 128], [6, 300, 29, 274], [3, 228, 11, 209], [62, 13536, 248, 12619],
+    [33, 5036, 47, 5761], [180, 1361, 372, 1079], [8, 2537, 10, 619], [505, 87886, 499, 87892],
+    [29, 7470, 45, 7232], [17, 1699, 65, 1600], [186, 50448, 141, 27197], [5, 2493, 3, 2338],
+    [27, 16886, 29, 17825],
+], dtype='float64')
+
+
+def _log_risk_ratios():
+    a, b, c, d = BCG.T
+    return np.log(a / (a + b)) - np.log(c / (c + d)), 1 / a - 1 / (a + b) + 1 / c - 1 / (c + d)
+
+
+def test_dersimonian_laird_known_answer():
+    # Published DerSimonian-Laird results for the BCG log risk ratios
+    result = meta_analysis.pool(*_log_risk_ratios())
+    assert result['fixed'] == pytest.approx(-0.4303, abs=1e-4)
+    assert result['random'] == pytest.approx(-0.7141, abs=1e-4)
+    assert result['random_se'] == pytest.approx(0.1787, abs=1e-4)
+    assert result['tau2'] == pytest.approx(0.3088, abs=1e-4)
+    assert result['q'] == pytest.approx(152.2330, abs=1e-3)
+    assert result['i2'] == pytest.approx((152.2330 - 12) / 152.2330, abs=1e-5)
+
+
+def test_leave_one_out_and_cumulative_match_subset_fits():
+    effects, variances = _log_risk_ratios()
+    omitted = meta_analysis.leave_one_out(effects, variances)
+    added = meta_analysis.cumulative(effects, variances)
+    for i in range(len(effects)):
+        keep = np.arange(len(effects)) != i
+        assert omitted['random'].iloc[i] == pytest.approx(
+            meta_analysis.pool(effects[keep], variances[keep])['random'])
+        if i:
+            assert added['random'].iloc[i] == pytest.approx(
+                meta_analysis.pool(effects[:i + 1], variances[:i + 1])['random'])
+
+
+def test_rows_without_sample_size_are_not_pooled():
+    data = {'relationships': ['A', 'B', 'Combined'], 'effect_sizes': [0.5, 0.3, 0.9],
+            'sample_sizes': [400, 900, 0], 'confidence': [90, 80, 70]}
+    labels, effects, variances = meta_analysis.from_chart_data(data)
+    assert labels == ['A', 'B']
+    np.testing.assert_allclose(effects, [0.5, 0.3])
+    np.testing.assert_allclose(variances, meta_analysis.cohens_d_variance([0.5, 0.3], [400, 900]))
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import panel_regression
+
+REGRESSORS = ['compensation_change_pct', 'overall_satisfaction']
+
+
+def _dummy_variable_fit(frame):
+    """Dense OLS with segment and month dummies and CR1 errors clustered by segment"""
+    X = pd.concat([frame[REGRESSORS],
+                   pd.get_dummies(frame['segment'], prefix='s', dtype=float),
+                   pd.get_dummies(frame['date'], prefix='t', drop_first=True, dtype=float)],
+                  axis=1).to_numpy()
+    y = frame['quits_rate'].to_numpy()
+    beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+    resid = y - X @ beta
+    bread = np.linalg.pinv(X.T @ X)
+    codes, clusters = pd.factorize(frame['segment'])
+    scores = np.stack([(X[codes == g] * resid[codes == g, None]).sum(axis=0) for g in range(len(clusters))])
+    n, G = len(y), len(clusters)
+    k = X.shape[1] - G  # segment effects are nested in the clusters
+    vcov = G / (G - 1) * (n - 1) / (n - k) * bread @ scores.T @ scores @ bread
+    return beta[:2], np.sqrt(np.diag(vcov))[:2]
+
+
+def test_fit_matches_dummy_variable_regression():
+    frame = panel_regression.synthetic_panel(12, 30, seed=3)
+    table, summary = panel_regression.fit(frame, 'quits_rate', REGRESSORS)
+    beta, se = _dummy_variable_fit(frame)
+    np.testing.assert_allclose(table['coef'], beta, rtol=1e-6)
+    np.testing.assert_allclose(table['std_err'], se, rtol=1e-6)
+    assert summary['clusters'] == 12
+
+
+def test_fit_recovers_planted_slopes():
+    table, _ = panel_regression.fit(panel_regression.synthetic_panel(200, 60), 'quits_rate', REGRESSORS)
+    np.testing.assert_allclose(table['coef'], [-0.15, -0.3], atol=0.02)
+
+
+def test_fit_needs_two_clusters():
+    frame = panel_regression.synthetic_panel(1, 24)
+    with pytest.raises(ValueError, match='at least 2 clusters'):
+        panel_regression.fit(frame, 'quits_rate', REGRESSORS)
+
+
+def test_fit_reports_convergence():
+    _, summary = panel_regression.fit(panel_regression.synthetic_panel(12, 30, seed=3),
+                                      'quits_rate', REGRESSORS)
+    assert summary['converged'] and summary['sweeps'] < panel_regression.MAX_ITER
+
+
+def test_demean_warns_when_sweeps_run_out(monkeypatch):
+    frame = panel_regression.synthetic_panel(12, 30, seed=3)
+    codes = [pd.factorize(frame['segment'])[0], pd.factorize(frame['date'])[0]]
+    with pytest.warns(RuntimeWarning, match='did not converge in 1 sweeps'):
+        _, sweeps, converged = panel_regression.demean(frame[REGRESSORS].to_numpy(), codes, max_iter=1)
+    assert (sweeps, converged) == (1, False)
+
+    monkeypatch.setattr(panel_regression.demean, '__defaults__', (1, panel_regression.TOLERANCE))
+    with pytest.warns(RuntimeWarning):
+        _, summary = panel_regression.fit(frame, 'quits_rate', REGRESSORS)
+    assert summary['converged'] is False
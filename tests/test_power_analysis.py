@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+import power_analysis
+
+
+def test_rates_must_stay_inside_unit_interval():
+    with pytest.raises(ValueError, match='strictly between 0 and 1'):
+        power_analysis.power_grid([20], [0.95], [0.08], workers=1)
+
+
+def test_no_effect_rejects_at_alpha():
+    grid = power_analysis.power_grid([100], [0.6], [0.0], replicates=4000, workers=1)
+    assert grid['power'].iloc[0] == pytest.approx(0.05, abs=4 * grid['mc_se'].iloc[0])
+
+
+def test_matches_analytic_power_without_clustering():
+    p0, p1, n = 0.6, 0.75, 150
+    grid = power_analysis.power_grid([n], [p0], [p1 - p0], team_size=1, icc=0.0,
+                                     replicates=4000, workers=1)
+    se = np.sqrt(p0 * (1 - p0) / n + p1 * (1 - p1) / n)
+    analytic = stats.norm.sf(stats.norm.ppf(0.975) - (p1 - p0) / se)
+    assert grid['power'].iloc[0] == pytest.approx(analytic, abs=0.03)
+
+
+def test_grid_cache_round_trips(tmp_path):
+    data = {'sample_sizes': [20, 40], 'baseline_rates': [0.6], 'effects': [0.1, 0.15],
+            'team_size': 5, 'icc': 0.05, 'control_ratio': 4, 'alpha': 0.05, 'replicates': 200}
+    fresh = power_analysis.from_chart_data(data, workers=1, cache_dir=tmp_path)
+    cached = power_analysis.from_chart_data(data, workers=1, cache_dir=tmp_path)
+    for column in fresh:
+        np.testing.assert_array_equal(fresh[column].to_numpy(), cached[column].to_numpy())
@@ -0,0 +1,61 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import prerender_content
+from prerender_content import CONTENT_DIR, CONTENT_FILES, ROOT
+
+# Runs the loader's own processContent in node, with a minimal DOM for escapeHtml
+NODE_RENDER = r'''
+const fs = require('fs');
+const source = fs.readFileSync(process.argv[1], 'utf8');
+const start = source.indexOf('    function processContent(');
+const end = source.indexOf('    window.enableAdvancedContent');
+const document = {createElement: () => ({
+    set textContent(text) {
+        this.html = text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+            .replace(/\u00a0/g, '&nbsp;');
+    },
+    get innerHTML() { return this.html; },
+})};
+const console = {warn: () => {}};
+const processContent = new Function('document', 'console',
+    source.slice(start, end) + '\nreturn processContent;')(document, console);
+const inputs = JSON.parse(fs.readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify(inputs.map(text => processContent(text, 'test.txt'))));
+'''
+
+EDGE_CASES = [
+    '# Title\r\nbody\r\n- one\r\n- two\r\n\r\n1. first\r\n## Next\r\ntext',
+    '# Title\rbody\r- item',
+    '# Title ## Sub - item text',
+    '\ufeff# Title\nbody',
+    '\x85# Title\x1c\n\u3000body\u3000',
+    '\xa0# Title with nbsp\xa0\n**bold** and *italic*',
+    '\u0661. Arabic-Indic digit\n1. ascii',
+]
+
+
+def _node_render(texts):
+    result = subprocess.run(['node', '-e', NODE_RENDER, str(ROOT / 'content-loader.js')],
+                            input=json.dumps(texts), capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node not installed')
+def test_prerender_matches_browser_loader():
+    texts = [(CONTENT_DIR / name).read_text(encoding='utf-8') for name in CONTENT_FILES
+             if (CONTENT_DIR / name).exists()]
+    texts += EDGE_CASES
+    expected = _node_render(texts)
+    for text, html in zip(texts, expected):
+        assert prerender_content.process_content(text, 'test.txt') == html, text[:60]
+
+
+def test_crlf_headers_render_as_headings():
+    html = prerender_content.process_content('# Title\r\nbody', 'test.txt')
+    assert html.startswith('<div style="font-family: inherit; line-height: 1.6; color: #333; '
+                           'word-wrap: break-word;"><h3 ')
+    assert '>Title</h3>' in html
@@ -0,0 +1,31 @@
+import re
+
+import prerender_content
+import search_index
+
+
+def test_split_sections_anchors_are_page_unique():
+    text = 'Intro text\n# Overview\nbody\n## Overview\nmore\n### Detail\nstill overview'
+    sections = search_index.split_sections('ask-problem-definition.txt', text)
+    assert [(anchor, line) for anchor, _, line, _ in sections] == [
+        ('ask-problem-definition', 1),
+        ('ask-problem-definition--overview', 2),
+        ('ask-problem-definition--overview-4', 4),
+    ]
+    assert search_index.heading_ids('ask-problem-definition.txt', text) == [
+        'ask-problem-definition--overview', 'ask-problem-definition--overview-4']
+
+
+def test_every_index_anchor_is_an_id_in_the_prerendered_page():
+    page, rendered = prerender_content.prerender(prerender_content.INDEX.read_text(encoding='utf-8'))
+    assert rendered
+    ids = set(re.findall(r'\bid="([^"]+)"', page))
+    docs = search_index.build_index()['docs']
+    assert {file for file, *_ in docs} == set(rendered)
+    assert [anchor for _, anchor, _, _ in docs if anchor not in ids] == []
+
+
+def test_page_loads_the_search_client():
+    page = prerender_content.INDEX.read_text(encoding='utf-8')
+    assert '<script src="search-client.js"></script>' in page
+    assert 'id="content-search"' in page
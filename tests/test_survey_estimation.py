@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import survey_estimation
+
+# Delete-one jackknife replicates of three equally weighted respondents:
+# replicate r drops respondent r and reweights the rest by 3/2
+FRAME = pd.DataFrame({
+    'GROUP': ['a', 'a', 'a'],
+    'SCORE': [1.0, 2.0, 3.0],
+    'POSTWT': [1.0, 1.0, 1.0],
+    'REPWT1': [0.0, 1.5, 1.5],
+    'REPWT2': [1.5, 0.0, 1.5],
+    'REPWT3': [1.5, 1.5, 0.0],
+})
+
+
+@pytest.mark.parametrize('method, rho, variance', [
+    # θ = 2, θ_r = 2.5, 2, 1.5 → Σ(θ_r - θ)² = 0.5
+    ('jk1', 0.0, 2 / 3 * 0.5),          # = s²/n for the sample mean
+    ('brr', 0.0, 1 / 3 * 0.5),
+    ('fay', 0.5, 1 / (3 * 0.25) * 0.5),
+])
+def test_replicate_standard_errors_known_answer(method, rho, variance):
+    result = survey_estimation.survey_means(FRAME, ['GROUP'], ['SCORE'], 'POSTWT', method=method, rho=rho)
+    assert result['SCORE'].tolist() == [2.0]
+    assert result['SCORE_se'].iloc[0] == pytest.approx(np.sqrt(variance), rel=1e-12)
+
+
+def test_unanswered_respondents_drop_out_of_every_replicate():
+    frame = FRAME.assign(SCORE=[1.0, np.nan, 3.0])
+    result = survey_estimation.survey_means(frame, ['GROUP'], ['SCORE'], 'POSTWT')
+    # θ = 2, θ_r = 3, 2, 1 → jk1 var = 2/3 · 2
+    assert result['SCORE'].iloc[0] == 2.0
+    assert result['SCORE_se'].iloc[0] == pytest.approx(np.sqrt(4 / 3), rel=1e-12)
+
+
+def test_replicate_columns_sort_numerically():
+    assert survey_estimation.replicate_columns(['REPWT10', 'POSTWT', 'REPWT2', 'REPWT1']) == [
+        'REPWT1', 'REPWT2', 'REPWT10']
+
+
+def test_replicate_variance_rejects_unknown_method():
+    with pytest.raises(ValueError, match='unknown variance method'):
+        survey_estimation.replicate_variance(np.zeros(1), np.zeros((1, 3)), 'bootstrap')
@@ -0,0 +1,24 @@
+import importlib
+
+import watch_dashboard
+
+
+def test_helper_changes_rebuild_their_charts_and_page():
+    targets = watch_dashboard.targets_for(['bayesian_updating.py'])
+    assert targets == {'helper:bayesian_updating', 'charts:generate_milestone3_visuals', 'page'}
+    assert 'charts:generate_visuals' in watch_dashboard.targets_for(['meta_analysis.py'])
+    assert 'charts:generate_milestone3_visuals' in watch_dashboard.targets_for(['power_analysis.py'])
+
+
+def test_helpers_reload_before_chart_modules(monkeypatch):
+    builder = watch_dashboard.Builder()
+    reloaded = []
+
+    def reload(module):
+        reloaded.append(module.__name__)
+        return module
+
+    monkeypatch.setattr(importlib, 'reload', reload)
+    monkeypatch.setattr(builder, '_render', lambda tasks: False)
+    builder.rebuild(watch_dashboard.targets_for(['power_analysis.py']) - {'page'})
+    assert reloaded == ['power_analysis', 'generate_milestone3_visuals']
@@ -0,0 +1,103 @@
+"""
+Shared visual theme for EBM Dashboard charts
+One palette, one place for rcParams, and font pre-warming so render
+workers pay matplotlib's font lookup cost once instead of per chart
+"""
+
+from functools import lru_cache
+
+import matplotlib
+import matplotlib.style
+
+# Professional color scheme (matching dashboard)
+PALETTE = {
+    'primary': '#2c3e50',
+    'secondary': '#34495e',
+    'accent': '#3498db',
+    'success': '#27ae60',
+    'warning': '#f39c12',
+    'danger': '#e74c3c',
+    'light': '#ecf0f1',
+    'medium': '#95a5a6',
+    'purple': '#9b59b6',
+}
+
+# Named themes: a base matplotlib style (or seaborn axes style) plus overrides
+THEMES = {
+    # generate_visuals.py
+    'darkgrid': {'style': 'seaborn-v0_8-darkgrid'},
+    # generate_evidence_visuals.py, generate_milestone3_visuals.py
+    'clean': {'style': 'default'},
+    # data_analysis.py
+    'analysis': {
+        'seaborn': 'whitegrid',
+        'rc': {'figure.figsize': (12, 6), 'font.size': 10},
+    },
+}
+
+# Session settings plt.style.use never touches - keep them out of themes too
+_NON_STYLE_KEYS = {
+    'backend', 'backend_fallback', 'interactive', 'toolbar', 'timezone',
+    'webagg.port', 'webagg.address', 'webagg.port_retries', 'webagg.open_in_browser',
+    'figure.max_open_warning', 'figure.raise_window', 'savefig.directory',
+    'tk.window_focus', 'docstring.hardcopy', 'date.epoch',
+}
+
+_active_theme = None
+
+
+@lru_cache(maxsize=None)
+def _theme_rc(name):
+    """Resolve a theme to a flat rcParams dict (computed once per process)"""
+    spec = THEMES[name]
+    with matplotlib.rc_context():
+        matplotlib.style.use('default')
+        if 'seaborn' in spec:
+            import seaborn as sns
+            sns.set_style(spec['seaborn'])
+        else:
+            matplotlib.style.use(spec['style'])
+        matplotlib.rcParams.update(spec.get('rc', {}))
+        rc = dict(matplotlib.rcParams)
+    for key in _NON_STYLE_KEYS:
+        rc.pop(key, None)
+    return rc
+
+
+def apply_theme(name='clean'):
+    """Apply a named theme; cheap after the first call for each name"""
+    global _active_theme
+    if name == _active_theme:
+        return
+    matplotlib.rcParams.update(_theme_rc(name))
+    _active_theme = name
+
+
+def warm_fonts():
+    """Load the fonts the charts use so the first real render is not slowed
+    by font discovery (regular/bold/italic of the active sans-serif family)"""
+    from matplotlib import font_manager
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    for weight in ('normal', 'bold'):
+        for style in ('normal', 'italic'):
+            prop = font_manager.FontProperties(weight=weight, style=style)
+            font_manager.get_font(font_manager.findfont(prop))
+
+    # Drawing once also fills matplotlib's text layout caches
+    fig = Figure(figsize=(1, 1))
+    FigureCanvasAgg(fig)
+    fig.text(0.5, 0.5, 'Warm 0123456789%', fontweight='bold')
+    fig.text(0.5, 0.2, 'Warm', style='italic')
+    fig.canvas.draw()
+
+
+def init_worker(name='clean', vector=False):
+    """ProcessPoolExecutor initializer: headless backend, theme and fonts"""
+    matplotlib.use('Agg')
+    apply_theme(name)
+    warm_fonts()
+    if vector:
+        from chart_output import set_vector_output
+        set_vector_output(True)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Watch mode for EBM Dashboard
+Watches the chart scripts, the chart data spec, the content files and the
+page assets, and rebuilds only what a change affects:
+
+    chart data spec        → the charts whose inputs changed (spec diff)
+    generate_*.py          → that module's charts
+    theme.py, chart_output → every chart
+    meta_analysis.py,      → the charts of the modules that import them
+    bayesian_updating.py,    (helper reloaded first), and the page for
+    power_analysis.py        the captions computed from them
+    content/*.txt          → dist/ page (pre-rendered or bundle), search index
+    evidence-*-sources.txt → also the citation database
+    index.html, *.js       → dist/ page
+    (any re-rendered chart → dist/ page, to copy the new PNGs)
+
+Rebuilds run in this process, so imports, fonts and the theme stay warm
+and a content edit reaches dist/ in well under a second. Bursts of events
+(editor save = write + rename) are debounced into one rebuild. Uses
+watchdog (inotify/FSEvents) when installed, otherwise polls mtimes.
+PNG optimization is left to the full build.
+
+Usage:
+    python watch_dashboard.py [--content prerender|bundle] [--debounce SECONDS]
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import importlib
+import io
+import os
+import queue
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import bundle_content
+import chart_data
+import chart_output
+import citation_db
+import prerender_content
+import search_index
+import theme
+from batch_render import BATCH_CHARTS
+from build_dashboard import CHART_MODULES
+from file_events import DEBOUNCE_S, collect, watch_events
+
+ROOT = Path(__file__).resolve().parent
+
+# Analysis helpers → the chart modules that import them
+HELPER_MODULES = {
+    'meta_analysis': ['generate_visuals'],
+    'bayesian_updating': ['generate_milestone3_visuals'],
+    'power_analysis': ['generate_milestone3_visuals'],
+}
+
+# Dependency graph: input pattern (relative to ROOT) → targets it invalidates.
+# Targets are rebuilt in TARGET_ORDER so charts land before the page copies them.
+RULES = [
+    ('theme.py', ['charts:all']),
+    ('chart_output.py', ['charts:all']),
+    *[(f'{module}.py', [f'charts:{module}']) for module in CHART_MODULES],
+    *[(f'{helper}.py', [f'helper:{helper}', *(f'charts:{m}' for m in modules), 'page'])
+      for helper, modules in HELPER_MODULES.items()],
+    ('content/evidence-*-sources.txt', ['citations']),
+    ('content/*.txt', ['page', 'search']),
+    ('index.html', ['page']),
+    ('logic-model.html', ['page']),
+    ('content-loader.js', ['page']),
+    ('search-client.js', ['page']),
+]
+TARGET_ORDER = ['charts', 'citations', 'page', 'search']
+
+
+def spec_path():
+    return Path(os.environ.get('EBM_CHART_DATA') or chart_data.DEFAULT_SPEC).resolve()
+
+
+def targets_for(paths):
+    """Targets invalidated by a set of changed paths (relative, posix)"""
+    spec = spec_path()
+    targets = set()
+    for path in paths:
+        if (ROOT / path).resolve() == spec:
+            targets.add('chart-data')
+        for pattern, invalidated in RULES:
+            if fnmatch.fnmatch(path, pattern):
+                targets.update(invalidated)
+    return targets
+
+
+def watched_files():
+    """Every existing file a rule (or the spec) refers to"""
+    files = {spec_path()}
+    for pattern, _ in RULES:
+        files.update(ROOT.glob(pattern))
+    return files
+
+
+def _quietly(func, argv):
+    with contextlib.redirect_stdout(io.StringIO()):
+        if func(argv) != 0:
+            raise RuntimeError(f"{func.__module__} failed")
+
+
+class Builder:
+    """Holds the warm state (loaded spec, imported modules) between rebuilds"""
+
+    def __init__(self, content_mode='prerender'):
+        self.content_mode = content_mode
+        self.spec = chart_data.load_chart_data()
+        self.modules = {name: importlib.import_module(name) for name in CHART_MODULES}
+
+    def _render(self, tasks):
+        for module_name, func_name in tasks:
+            module = self.modules[module_name]
+            start = time.perf_counter()
+            theme.apply_theme(module.THEME)
+            with contextlib.redirect_stdout(io.StringIO()):
+                getattr(module, func_name)()
+            plt.close('all')
+            print(f"  ✓ {func_name} ({time.perf_counter() - start:.2f}s)")
+        return bool(tasks)
+
+    def charts_for_spec_change(self):
+        chart_data.load_chart_data.cache_clear()
+        try:
+            spec = chart_data.load_chart_data()
+        except (chart_data.ChartDataError, ValueError) as e:
+            print(f"  ✗ Invalid chart data, keeping previous charts: {e}")
+            return []
+        changed = set(chart_data.diff_specs(self.spec, spec))
+        self.spec = spec
+        return [(module, func) for module, func, key, _ in BATCH_CHARTS if key in changed]
+
+    def reload_helpers(self, names):
+        """Reload changed helpers before the chart modules that import from them"""
+        for name in HELPER_MODULES:
+            if name in names:
+                importlib.reload(importlib.import_module(name))
+
+    def charts_for_modules(self, names):
+        if 'all' in names:
+            importlib.reload(theme)
+            importlib.reload(chart_output)
+            names = CHART_MODULES
+        tasks = []
+        for name in names:
+            module = self.modules[name] = importlib.reload(self.modules[name])
+            tasks += [(name, attr) for attr in dir(module)
+                      if attr.startswith('create_') and callable(getattr(module, attr))]
+        return tasks
+
+    def rebuild(self, targets):
+        """Run the invalidated targets; returns the set actually rebuilt"""
+        done = set()
+        tasks = []
+        if 'chart-data' in targets:
+            tasks += self.charts_for_spec_change()
+        self.reload_helpers({t.split(':', 1)[1] for t in targets if t.startswith('helper:')})
+        modules = {t.split(':', 1)[1] for t in targets if t.startswith('charts:')}
+        if modules:
+            tasks += [t for t in self.charts_for_modules(modules) if t not in tasks]
+        if tasks and self._render(tasks):
+            done.add('charts')
+            targets = targets | {'page'}
+
+        if 'citations' in targets:
+            _quietly(citation_db.main, ['extract'])
+            done.add('citations')
+        if 'page' in targets:
+            publish = bundle_content.main if self.content_mode == 'bundle' else prerender_content.main
+            _quietly(publish, [])
+            done.add('page')
+        if 'search' in targets:
+            _quietly(search_index.main, ['build'])
+            done.add('search')
+        return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rebuild dashboard artifacts as sources change')
+    parser.add_argument('--content', choices=['prerender', 'bundle'], default='prerender')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_S,
+                        help='seconds of quiet before rebuilding')
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("EBM DASHBOARD WATCH MODE")
+    print("=" * 60)
+    builder = Builder(args.content)
+    builder.rebuild({'page', 'search'})
+    print("✓ dist/ is up to date - watching for changes (Ctrl+C to stop)")
+
+    events = queue.Queue()
+    stop = watch_events(events, ROOT, {ROOT, ROOT / 'content', spec_path().parent}, watched_files)
+    try:
+        while True:
+            changed = collect(events, args.debounce)
+            targets = targets_for(changed)
+            if not targets:
+                continue
+            start = time.perf_counter()
+            print(f"\n▶ {', '.join(sorted(changed))}")
+            try:
+                done = builder.rebuild(targets)
+            except Exception:
+                print(f"✗ Rebuild failed\n{traceback.format_exc()}")
+                continue
+            order = [t for t in TARGET_ORDER if t in done]
+            if order:
+                print(f"✓ Rebuilt {', '.join(order)} in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())